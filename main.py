@@ -3,32 +3,110 @@ from discord.ext import commands
 from discord import app_commands
 import os
 import asyncio
-from flask import Flask
-from threading import Thread
 
 from src.config import Config
 from src.services.database import db_service
-
-app = Flask('')
-
-@app.route('/')
-def home():
-    return "BM Creations Bot is alive and running!"
-
-def run_flask():
-    app.run(host='0.0.0.0', port=5000)
-
-def keep_alive():
-    t = Thread(target=run_flask)
-    t.daemon = True
-    t.start()
+from src.services.command_sync import sync_command_tree, sync_guild_commands
+from src.services.startup import startup_report, load_extensions
+from src.services.health import HealthServer
+from src.services.notifications import notification_outbox
+from src.services.interactions import interaction_router
+from src.services.cache import guild_cache
+from src.services.changes import change_feed
+from src.services.sharding import shard_scope
+from src.services.transcripts import transcript_archiver
+from src.services.usage import faq_usage
+from src.services.profiler import start_profile, finish_profile, current_profile
 
 intents = discord.Intents.default()
 intents.message_content = True
 intents.members = True
 intents.guilds = True
 
-bot = commands.Bot(command_prefix=Config.BOT_PREFIX, intents=intents, help_command=None)
+class BMCommandTree(app_commands.CommandTree):
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        # Runs inside the command's own task, so the profile started here
+        # sees every statement the command issues.
+        if interaction.command:
+            interaction.extras["query_profile"] = start_profile(f"command:/{interaction.command.qualified_name}")
+        return True
+
+# SHARDED=1 runs every shard in this process; SHARD_IDS runs only that slice
+# of SHARD_COUNT shards, so several processes can split the guilds.
+BotBase = commands.AutoShardedBot if Config.SHARDED or Config.SHARD_IDS else commands.Bot
+
+class BMCreationsBot(BotBase):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.command_sync_task = None
+        self.database_task = None
+        self.health_server = HealthServer(self)
+    
+    async def setup_hook(self):
+        try:
+            await self.health_server.start()
+        except Exception as e:
+            print(f"Health server failed to start: {e}")
+        
+        try:
+            await self.start_database()
+        except Exception as e:
+            print(f"Database initialization error: {e}")
+            self.database_task = asyncio.create_task(self.retry_database())
+        
+        interaction_router.attach(self)
+        await transcript_archiver.start(self)
+        await faq_usage.start()
+        await load_extensions(self, COGS)
+    
+    async def start_database(self):
+        with startup_report.phase("database"):
+            await db_service.initialize()
+        print("Database initialized successfully!")
+        # A retry after a partial start must not start anything twice.
+        if notification_outbox.task is None:
+            await notification_outbox.start(self)
+        if change_feed.task is None:
+            try:
+                await change_feed.start(db_service.engine)
+            except Exception as e:
+                print(f"Change feed unavailable, caches will rely on TTL refresh: {e}")
+        if guild_cache.task is None:
+            with startup_report.phase("cache.warm"):
+                await guild_cache.start()
+    
+    async def retry_database(self):
+        # Listeners and background loops wait on db_service readiness, so
+        # keep trying rather than leave the bot connected but inert.
+        delay = 1
+        while True:
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, Config.DB_RETRY_MAX_SECONDS)
+            try:
+                await self.start_database()
+                return
+            except Exception as e:
+                print(f"Database initialization error, retrying in {delay}s: {e}")
+    
+    async def close(self):
+        if self.database_task:
+            self.database_task.cancel()
+        await notification_outbox.stop()
+        await transcript_archiver.stop()
+        await faq_usage.stop()
+        await guild_cache.stop()
+        await change_feed.stop()
+        await self.health_server.stop()
+        await super().close()
+
+shard_options = {}
+if Config.SHARD_IDS:
+    shard_options = {"shard_count": Config.SHARD_COUNT, "shard_ids": Config.SHARD_IDS}
+elif Config.SHARDED and Config.SHARD_COUNT > 1:
+    shard_options = {"shard_count": Config.SHARD_COUNT}
+
+bot = BMCreationsBot(command_prefix=Config.BOT_PREFIX, intents=intents, help_command=None, tree_cls=BMCommandTree,
+                     **shard_options)
 
 COGS = [
     "src.cogs.core",
@@ -47,25 +125,17 @@ COGS = [
     "src.cogs.support_interaction",
 ]
 
-async def load_cogs():
-    for cog in COGS:
-        try:
-            await bot.load_extension(cog)
-            print(f"Loaded cog: {cog}")
-        except Exception as e:
-            print(f"Failed to load cog {cog}: {e}")
-
 @bot.event
 async def on_ready():
     print(f"{bot.user.name} is now online and ready!")
     print(f"Bot ID: {bot.user.id}")
     print(f"Connected to {len(bot.guilds)} guilds")
+    if bot.shard_count:
+        print(f"Running {shard_scope.describe()}")
     
-    try:
-        await db_service.initialize()
-        print("Database initialized successfully!")
-    except Exception as e:
-        print(f"Database initialization error: {e}")
+    if startup_report.ready_after is None:
+        startup_report.mark_ready()
+        startup_report.print_report()
     
     all_commands = bot.tree.get_commands()
     print(f"\nCommands in tree before sync: {len(all_commands)}")
@@ -74,25 +144,18 @@ async def on_ready():
     if len(all_commands) > 10:
         print(f"  ... and {len(all_commands) - 10} more")
     
-    for guild in bot.guilds:
-        try:
-            bot.tree.copy_global_to(guild=guild)
-            synced = await bot.tree.sync(guild=guild)
-            print(f"Synced {len(synced)} slash commands to guild: {guild.name}")
-        except Exception as e:
-            print(f"Failed to sync to guild {guild.name}: {e}")
-    
-    try:
-        global_synced = await bot.tree.sync()
-        print(f"Also synced {len(global_synced)} slash commands globally")
-    except Exception as e:
-        print(f"Failed to sync globally: {e}")
+    if bot.command_sync_task is None:
+        bot.command_sync_task = asyncio.create_task(sync_command_tree(bot))
     
     print("\n=== BOT INVITE LINK ===")
     print(f"If slash commands don't work, re-invite the bot with this link:")
     print(f"https://discord.com/api/oauth2/authorize?client_id={bot.user.id}&permissions=8&scope=bot%20applications.commands")
     print("========================\n")
 
+@bot.event
+async def on_guild_join(guild: discord.Guild):
+    await sync_guild_commands(bot, guild)
+
 OWNER_USERNAMES = ["sizuka42"]
 
 PUBLIC_COMMANDS = [
@@ -135,8 +198,22 @@ async def global_command_check(interaction: discord.Interaction) -> bool:
     )
     return False
 
+@bot.event
+async def on_app_command_completion(interaction: discord.Interaction, command):
+    finish_profile(interaction.extras.get("query_profile"))
+
+@bot.before_invoke
+async def before_prefix_command(ctx: commands.Context):
+    start_profile(f"command:{Config.BOT_PREFIX}{ctx.command.qualified_name}")
+
+@bot.after_invoke
+async def after_prefix_command(ctx: commands.Context):
+    finish_profile(current_profile())
+
 @bot.tree.error
 async def on_app_command_error(interaction: discord.Interaction, error: app_commands.AppCommandError):
+    finish_profile(interaction.extras.get("query_profile"))
+    
     if isinstance(error, app_commands.CheckFailure):
         return
     elif isinstance(error, app_commands.MissingPermissions):
@@ -157,9 +234,7 @@ async def on_app_command_error(interaction: discord.Interaction, error: app_comm
 
 async def main():
     async with bot:
-        await load_cogs()
         await bot.start(Config.TOKEN)
 
 if __name__ == "__main__":
-    keep_alive()
     asyncio.run(main())
@@ -2,6 +2,7 @@ import discord
 from discord.ext import commands
 
 from src.services.database import db_service
+from src.services.cache import guild_cache
 from src.utils.helpers import create_embed, format_price
 from src.utils.translations import get_text
 from src.config import Config
@@ -53,7 +54,7 @@ class CommerceCog(commands.Cog):
         user = await db_service.get_or_create_user(ctx.author.id, ctx.guild.id)
         lang = user.language
         
-        products = await db_service.search_products(ctx.guild.id, product_name)
+        products = await guild_cache.search_products(ctx.guild.id, product_name)
         
         if not products:
             embed = create_embed(
@@ -151,7 +152,7 @@ class CommerceCog(commands.Cog):
         user = await db_service.get_or_create_user(ctx.author.id, ctx.guild.id)
         lang = user.language
         
-        products = await db_service.search_products(ctx.guild.id, product_name)
+        products = await guild_cache.search_products(ctx.guild.id, product_name)
         
         if not products:
             embed = create_embed(
@@ -244,7 +245,7 @@ class CommerceCog(commands.Cog):
     
     @commands.command(name="products")
     async def list_products(self, ctx: commands.Context, category: str = None):
-        products = await db_service.get_products(ctx.guild.id, category=category)
+        products = await guild_cache.get_products(ctx.guild.id, category=category)
         
         if not products:
             await ctx.send("No products available at the moment.", delete_after=5)
@@ -271,7 +272,7 @@ class CommerceCog(commands.Cog):
     
     @commands.command(name="search")
     async def search_products(self, ctx: commands.Context, *, search_term: str):
-        products = await db_service.search_products(ctx.guild.id, search_term)
+        products = await guild_cache.search_products(ctx.guild.id, search_term)
         
         if not products:
             await ctx.send(f"No products found matching '{search_term}'.", delete_after=5)
@@ -2,8 +2,12 @@ import discord
 from discord.ext import commands
 from discord import app_commands
 from src.services.database import db_service
+from src.services.cache import guild_cache
+from src.services.startup import startup_report
 from src.utils.helpers import create_embed, is_staff
 from src.utils.translations import get_text
+from src.services.instrumentation import instrument, operation_stats
+from src.services.profiler import recent_profiles
 from src.config import Config
 
 class CoreCog(commands.Cog):
@@ -12,6 +16,9 @@ class CoreCog(commands.Cog):
     
     @commands.Cog.listener()
     async def on_member_join(self, member: discord.Member):
+        if not db_service.is_ready:
+            return
+        
         await db_service.get_or_create_user(
             discord_id=member.id,
             guild_id=member.guild.id,
@@ -19,7 +26,7 @@ class CoreCog(commands.Cog):
             display_name=member.display_name
         )
         
-        settings = await db_service.get_or_create_guild_settings(member.guild.id)
+        settings = await guild_cache.get_settings(member.guild.id)
         if settings.welcome_channel_id:
             channel = self.bot.get_channel(settings.welcome_channel_id)
             if channel:
@@ -39,8 +46,9 @@ class CoreCog(commands.Cog):
                 await channel.send(embed=embed)
     
     @commands.Cog.listener()
+    @instrument("core.on_message", "listener")
     async def on_message(self, message: discord.Message):
-        if message.author.bot:
+        if message.author.bot or not db_service.is_ready:
             return
         
         if message.guild:
@@ -290,6 +298,76 @@ class CoreCog(commands.Cog):
         embed.add_field(name="Roles", value=", ".join(roles) if roles else "None", inline=False)
         
         await interaction.response.send_message(embed=embed)
+    
+    @app_commands.command(name="startupreport", description="View startup timing report (Admin)")
+    @app_commands.default_permissions(administrator=True)
+    async def show_startup_report(self, interaction: discord.Interaction):
+        embed = create_embed(
+            title="Startup Timings",
+            description="```\n" + "\n".join(startup_report.format_lines())[:4000] + "\n```",
+            color=Config.EMBED_COLOR
+        )
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+    
+    @app_commands.command(name="perfstats", description="View hot-path latency statistics (Admin)")
+    @app_commands.describe(kind="Only show one kind of operation")
+    @app_commands.choices(kind=[
+        app_commands.Choice(name="Database", value="db"),
+        app_commands.Choice(name="Listeners", value="listener"),
+        app_commands.Choice(name="Handlers", value="handler"),
+        app_commands.Choice(name="Buttons & menus", value="view"),
+    ])
+    @app_commands.default_permissions(administrator=True)
+    async def perf_stats(self, interaction: discord.Interaction, kind: str = None):
+        stats = operation_stats(kind)
+        
+        if not stats:
+            await interaction.response.send_message("No operations recorded yet.", ephemeral=True)
+            return
+        
+        lines = [f"{'operation':<40} {'n':>6} {'avg':>7} {'p95':>7} {'max':>7}"]
+        for stat in stats[:20]:
+            operation = stat["operation"][-40:]
+            lines.append(
+                f"{operation:<40} {stat['count']:>6} {stat['avg'] * 1000:>5.0f}ms "
+                f"{stat['p95'] * 1000:>5.0f}ms {stat['max'] * 1000:>5.0f}ms"
+                + (f" ({stat['errors']} err)" if stat["errors"] else "")
+            )
+        
+        embed = create_embed(
+            title="Performance Stats",
+            description="```\n" + "\n".join(lines)[:4000] + "\n```",
+            color=Config.EMBED_COLOR
+        )
+        embed.set_footer(text=f"Sorted by total time | slow log threshold {Config.SLOW_OPERATION_MS}ms")
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+    
+    @app_commands.command(name="sqlprofile", description="View SQL statements per command/listener (Admin)")
+    @app_commands.default_permissions(administrator=True)
+    async def sql_profile(self, interaction: discord.Interaction):
+        if not Config.SQL_PROFILE:
+            await interaction.response.send_message(
+                "SQL profiling is off. Set `SQL_PROFILE=1` and restart to enable it.", ephemeral=True
+            )
+            return
+        
+        if not recent_profiles:
+            await interaction.response.send_message("No profiled invocations yet.", ephemeral=True)
+            return
+        
+        worst = sorted(recent_profiles, key=lambda p: p["statements"], reverse=True)[:10]
+        embed = create_embed(
+            title="SQL Profile",
+            description=f"Heaviest of the last {len(recent_profiles)} invocations",
+            color=Config.EMBED_COLOR
+        )
+        for summary in worst:
+            value = f"{summary['statements']} statements, {summary['db_ms']:.1f}ms DB / {summary['elapsed_ms']:.1f}ms total"
+            for statement, count in summary["n_plus_one"][:2]:
+                value += f"\nN+1 x{count}: `{statement[:120]}`"
+            embed.add_field(name=summary["scope"][:256], value=value[:1024], inline=False)
+        
+        await interaction.response.send_message(embed=embed, ephemeral=True)
 
 async def setup(bot: commands.Bot):
     await bot.add_cog(CoreCog(bot))
@@ -3,20 +3,30 @@ from discord.ext import commands
 from typing import List
 
 from src.services.database import db_service
+from src.services.cache import guild_cache
+from src.services.changes import change_feed
 from src.utils.helpers import create_embed, extract_keywords, is_staff
 from src.utils.translations import get_text
+from src.services.instrumentation import instrument
+from src.services.ratelimit import AutoReplyLimiter
+from src.services.usage import faq_usage
 from src.config import Config
 
 class FAQCog(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
         self.auto_response_cache = {}
+        self.reply_limiter = AutoReplyLimiter("faq")
     
     @commands.Cog.listener()
+    @instrument("faq.on_message", "listener")
     async def on_message(self, message: discord.Message):
         if message.author.bot or not message.guild:
             return
         
+        if not db_service.is_ready:
+            return
+        
         if message.content.startswith("!"):
             return
         
@@ -28,21 +38,15 @@ class FAQCog(commands.Cog):
         if not is_question:
             return
         
-        faqs = await db_service.search_faq(message.guild.id, message.content[:100])
+        faqs = await guild_cache.search_faq(message.guild.id, message.content[:100])
         
         if faqs:
-            best_match = faqs[0]
+            settings = await guild_cache.get_settings(message.guild.id)
+            if not self.reply_limiter.allow(message, settings):
+                return
             
-            async with db_service.session_factory() as session:
-                from sqlalchemy import select
-                from src.models.database import FAQ
-                result = await session.execute(
-                    select(FAQ).where(FAQ.id == best_match.id)
-                )
-                faq = result.scalar_one_or_none()
-                if faq:
-                    faq.usage_count += 1
-                    await session.commit()
+            best_match = faqs[0]
+            faq_usage.record(best_match.id)
             
             embed = create_embed(
                 title="Related FAQ",
@@ -55,7 +59,7 @@ class FAQCog(commands.Cog):
     
     @commands.command(name="faq")
     async def faq_list(self, ctx: commands.Context, category: str = None):
-        faqs = await db_service.get_all_faqs(ctx.guild.id)
+        faqs = await guild_cache.get_faqs(ctx.guild.id)
         
         if not faqs:
             await ctx.send("No FAQs available yet.", delete_after=5)
@@ -92,7 +96,7 @@ class FAQCog(commands.Cog):
         user = await db_service.get_or_create_user(ctx.author.id, ctx.guild.id)
         lang = user.language
         
-        faqs = await db_service.search_faq(ctx.guild.id, question)
+        faqs = await guild_cache.search_faq(ctx.guild.id, question)
         
         if faqs:
             embed = create_embed(
@@ -179,6 +183,7 @@ class FAQCog(commands.Cog):
             await session.execute(
                 delete(FAQ).where(FAQ.id == faq_id)
             )
+            await change_feed.publish(session, "faqs", ctx.guild.id)
             await session.commit()
         
         embed = create_embed(
@@ -215,6 +220,7 @@ class FAQCog(commands.Cog):
                 if answer:
                     faq.answer = answer
                 
+                await change_feed.publish(session, "faqs", ctx.guild.id)
                 await session.commit()
             
             embed = create_embed(
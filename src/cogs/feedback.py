@@ -2,6 +2,7 @@ import discord
 from discord.ext import commands
 
 from src.services.database import db_service
+from src.services.cache import guild_cache
 from src.utils.helpers import create_embed, is_staff, format_timestamp
 from src.utils.translations import get_text
 from src.config import Config
@@ -36,7 +37,7 @@ class FeedbackCog(commands.Cog):
         
         await ctx.send(embed=embed)
         
-        settings = await db_service.get_or_create_guild_settings(ctx.guild.id)
+        settings = await guild_cache.get_settings(ctx.guild.id)
         if settings.log_channel_id:
             log_channel = self.bot.get_channel(settings.log_channel_id)
             if log_channel:
@@ -87,7 +88,7 @@ class FeedbackCog(commands.Cog):
         
         await ctx.send(embed=embed)
         
-        settings = await db_service.get_or_create_guild_settings(ctx.guild.id)
+        settings = await guild_cache.get_settings(ctx.guild.id)
         if settings.order_channel_id:
             review_channel = self.bot.get_channel(settings.order_channel_id)
             if review_channel:
@@ -154,7 +155,7 @@ class FeedbackCog(commands.Cog):
         
         await ctx.author.send(embed=embed)
         
-        settings = await db_service.get_or_create_guild_settings(ctx.guild.id)
+        settings = await guild_cache.get_settings(ctx.guild.id)
         if settings.log_channel_id:
             log_channel = self.bot.get_channel(settings.log_channel_id)
             if log_channel:
@@ -3,6 +3,7 @@ from discord.ext import commands
 from datetime import datetime, timedelta
 
 from src.services.database import db_service
+from src.services.cache import guild_cache
 from src.models.database import WarningLevel
 from src.utils.helpers import create_embed, is_staff, format_timestamp, get_eastern_time, parse_duration
 from src.config import Config
@@ -81,7 +82,7 @@ class ModerationCog(commands.Cog):
         except:
             pass
         
-        settings = await db_service.get_or_create_guild_settings(ctx.guild.id)
+        settings = await guild_cache.get_settings(ctx.guild.id)
         if settings.log_channel_id:
             log_channel = self.bot.get_channel(settings.log_channel_id)
             if log_channel:
@@ -2,78 +2,81 @@ import discord
 from discord.ext import commands
 from discord import app_commands
 from datetime import datetime
+from typing import List
 
 from src.services.database import db_service
+from src.services.cache import guild_cache
 from src.models.database import OrderStatus
 from src.utils.helpers import create_embed, is_staff, get_eastern_time, format_timestamp, get_status_emoji
 from src.utils.translations import get_text
+from src.utils.embeds import field, CONNECT_FIELD, ORDER_COMPLETED, ORDER_COMPLETED_NOTICE
+from src.services.notifications import notification_outbox
+from src.services.orders import order_transitions
+from src.services.interactions import interaction_router, routed_id, order_id_from_message
+from src.utils.views import RoutedView, copy_components
 from src.config import Config
 
-class ManualOrderCompletionView(discord.ui.View):
-    def __init__(self, order_id: str, bot: commands.Bot, timeout: float = None):
-        super().__init__(timeout=timeout)
-        self.order_id = order_id
+class ManualOrderCompletionView(RoutedView):
+    def __init__(self, order_id: str):
+        super().__init__()
+        self.add_item(discord.ui.Button(label="Mark Completed", style=discord.ButtonStyle.success, emoji="✅",
+                                        custom_id=routed_id("order", "manual_complete", order_id)))
+
+class OrdersCog(commands.Cog):
+    def __init__(self, bot: commands.Bot):
         self.bot = bot
     
-    @discord.ui.button(label="Mark Completed", style=discord.ButtonStyle.success, emoji="✅", custom_id="manual_complete_order")
-    async def complete_order(self, interaction: discord.Interaction, button: discord.ui.Button):
+    async def cog_load(self):
+        interaction_router.register("order", "manual_complete", self.manual_complete_order,
+                                    legacy_ids=("manual_complete_order",), resolver=order_id_from_message)
+    
+    async def cog_unload(self):
+        interaction_router.unregister(self)
+    
+    async def manual_complete_order(self, interaction: discord.Interaction, args: List[str]):
+        order_id = args[0]
         await interaction.response.defer()
         
-        order = await db_service.update_order_status(
-            self.order_id,
-            OrderStatus.DELIVERED,
-            staff_id=interaction.user.id
-        )
-        
-        if not order:
-            await interaction.followup.send("Order not found!", ephemeral=True)
+        try:
+            order = await db_service.update_order_status(
+                order_id,
+                OrderStatus.DELIVERED,
+                staff_id=interaction.user.id
+            )
+        except ValueError as e:
+            await interaction.followup.send(f"Order **{order_id}** was not updated: {e}.", ephemeral=True)
             return
         
-        for item in self.children:
-            item.disabled = True
-        
         try:
-            await interaction.message.edit(view=self)
+            await interaction.message.edit(view=copy_components(interaction.message))
         except:
             pass
         
-        completed_embed = create_embed(
-            title="✅ Order Completed!",
-            description="Thank you for shopping with **BM Creations Market!**\n\nYour order has been successfully delivered.",
-            color=Config.SUCCESS_COLOR
-        )
-        
-        completed_embed.add_field(name="🆔 Order ID", value=f"**{self.order_id}**", inline=True)
-        completed_embed.add_field(name="📦 Status", value="✅ **COMPLETED**", inline=True)
-        completed_embed.add_field(name="⏰ Completed At", value=format_timestamp(get_eastern_time()), inline=True)
-        completed_embed.add_field(
-            name="🌐 Connect With Us",
-            value="**Website:** [Visit Us](https://imvublackmarket.xyz/)\n**Instagram:** [Follow Us](https://www.instagram.com/imvublackmarket_official?igsh=MXhsaXo4dzByeTg4ZA==)",
-            inline=False
-        )
-        completed_embed.set_footer(text="BM Creations Market | Trusted Since 2020")
+        completed_embed = ORDER_COMPLETED.fill(fields=[
+            field("🆔 Order ID", f"**{order_id}**"),
+            field("📦 Status", "✅ **COMPLETED**"),
+            field("⏰ Completed At", format_timestamp(get_eastern_time())),
+        ])
         
         await interaction.followup.send(embed=completed_embed)
         
-        settings = await db_service.get_or_create_guild_settings(interaction.guild.id)
+        settings = await guild_cache.get_settings(interaction.guild.id)
         if settings.order_channel_id:
-            order_channel = self.bot.get_channel(settings.order_channel_id)
-            if order_channel:
-                status_embed = create_embed(
-                    title="✅ Order Completed",
-                    description=f"Order **{self.order_id}** has been marked as completed!",
-                    color=Config.SUCCESS_COLOR
-                )
-                status_embed.add_field(name="Completed By", value=interaction.user.mention, inline=True)
-                status_embed.add_field(name="Time", value=format_timestamp(get_eastern_time()), inline=True)
-                await order_channel.send(embed=status_embed)
+            status_embed = create_embed(
+                title="✅ Order Completed",
+                description=f"Order **{order_id}** has been marked as completed!",
+                color=Config.SUCCESS_COLOR
+            )
+            status_embed.add_field(name="Completed By", value=interaction.user.mention, inline=True)
+            status_embed.add_field(name="Time", value=format_timestamp(get_eastern_time()), inline=True)
+            await notification_outbox.enqueue(settings.order_channel_id, order_id, status_embed)
         
         try:
             user = self.bot.get_user(order.user.discord_id)
             if user:
                 dm_embed = create_embed(
                     title="🎉 Your Order is Complete!",
-                    description=f"Your order **{self.order_id}** has been delivered!\n\nThank you for choosing BM Creations Market!",
+                    description=f"Your order **{order_id}** has been delivered!\n\nThank you for choosing BM Creations Market!",
                     color=Config.SUCCESS_COLOR
                 )
                 await user.send(embed=dm_embed)
@@ -91,12 +94,6 @@ class ManualOrderCompletionView(discord.ui.View):
                     await interaction.channel.edit(name=new_name)
         except:
             pass
-        
-        self.stop()
-
-class OrdersCog(commands.Cog):
-    def __init__(self, bot: commands.Bot):
-        self.bot = bot
     
     def blur_name(self, name: str) -> str:
         if len(name) <= 2:
@@ -155,25 +152,23 @@ class OrdersCog(commands.Cog):
         order_embed.add_field(name="📦 Status", value="🟡 **IN PROGRESS**", inline=True)
         order_embed.set_footer(text="Click 'Mark Completed' when order is delivered")
         
-        view = ManualOrderCompletionView(order_id, self.bot)
+        view = ManualOrderCompletionView(order_id)
         await interaction.followup.send(embed=order_embed, view=view)
         
-        settings = await db_service.get_or_create_guild_settings(interaction.guild.id)
+        settings = await guild_cache.get_settings(interaction.guild.id)
         if settings.order_channel_id:
-            order_channel = self.bot.get_channel(settings.order_channel_id)
-            if order_channel:
-                status_embed = create_embed(
-                    title="🎫 New Order Received",
-                    description=f"Order **{order_id}** has been created!",
-                    color=Config.EMBED_COLOR
-                )
-                status_embed.add_field(name="🆔 Order ID", value=f"**{order_id}**", inline=True)
-                status_embed.add_field(name="👤 Customer", value=f"||{blurred_name}||", inline=True)
-                status_embed.add_field(name="🛍️ Product", value=product, inline=True)
-                status_embed.add_field(name="🕐 Time", value=format_timestamp(get_eastern_time()), inline=True)
-                status_embed.add_field(name="📦 Status", value="🟡 **IN PROGRESS**", inline=True)
-                status_embed.set_footer(text="Order created from ticket")
-                await order_channel.send(embed=status_embed)
+            status_embed = create_embed(
+                title="🎫 New Order Received",
+                description=f"Order **{order_id}** has been created!",
+                color=Config.EMBED_COLOR
+            )
+            status_embed.add_field(name="🆔 Order ID", value=f"**{order_id}**", inline=True)
+            status_embed.add_field(name="👤 Customer", value=f"||{blurred_name}||", inline=True)
+            status_embed.add_field(name="🛍️ Product", value=product, inline=True)
+            status_embed.add_field(name="🕐 Time", value=format_timestamp(get_eastern_time()), inline=True)
+            status_embed.add_field(name="📦 Status", value="🟡 **IN PROGRESS**", inline=True)
+            status_embed.set_footer(text="Order created from ticket")
+            await notification_outbox.enqueue(settings.order_channel_id, order_id, status_embed)
     
     @app_commands.command(name="order", description="Create a new order")
     @app_commands.describe(details="Order details/description")
@@ -238,11 +233,7 @@ class OrdersCog(commands.Cog):
                 ])
                 dm_embed.add_field(name="📋 Recent Orders", value=recent, inline=False)
             
-            dm_embed.add_field(
-                name="🌐 Connect With Us",
-                value="**Website:** [imvublackmarket.xyz](https://imvublackmarket.xyz/)\n**Instagram:** [@imvublackmarket_official](https://www.instagram.com/imvublackmarket_official)",
-                inline=False
-            )
+            dm_embed.add_field(**CONNECT_FIELD)
             dm_embed.set_footer(text="BM Creations Market | Track orders with /trackorder")
             
             await interaction.user.send(embed=dm_embed)
@@ -370,15 +361,15 @@ class OrdersCog(commands.Cog):
         
         await interaction.response.defer()
         
-        order = await db_service.update_order_status(
-            order_id, 
-            status_map[status.lower()],
-            staff_id=interaction.user.id
+        outcome = await order_transitions.transition(
+            status_map[status.lower()], order_ids=[order_id], staff_id=interaction.user.id
         )
         
-        if not order:
-            await interaction.followup.send("Order not found.", ephemeral=True)
+        if not outcome.updated:
+            reason = outcome.skipped.get(order_id, "not found")
+            await interaction.followup.send(f"Order **{order_id}** was not updated: {reason}.", ephemeral=True)
             return
+        order = outcome.updated[0]
         
         embed = create_embed(
             title="Order Updated",
@@ -418,37 +409,27 @@ class OrdersCog(commands.Cog):
         
         await interaction.response.defer()
         
-        order = await db_service.update_order_status(
-            order_id, 
-            OrderStatus.DELIVERED,
-            staff_id=interaction.user.id
+        outcome = await order_transitions.transition(
+            OrderStatus.DELIVERED, order_ids=[order_id], staff_id=interaction.user.id
         )
         
-        if not order:
-            await interaction.followup.send("Order not found.", ephemeral=True)
+        if not outcome.updated:
+            reason = outcome.skipped.get(order_id, "not found")
+            await interaction.followup.send(f"Order **{order_id}** was not updated: {reason}.", ephemeral=True)
             return
+        order = outcome.updated[0]
         
-        settings = await db_service.get_or_create_guild_settings(interaction.guild.id)
-        
-        embed = create_embed(
-            title="Order Completed",
-            description="Thank you for shopping with **BM Creations Market!**\nYour order has been successfully delivered.",
-            color=Config.SUCCESS_COLOR
-        )
-        
-        embed.add_field(name="Official Website", value="[Visit Us](https://imvublackmarket.xyz/)", inline=False)
-        embed.add_field(name="Instagram", value="[Follow Us](https://www.instagram.com/imvublackmarket_official?igsh=MXhsaXo4dzByeTg4ZA==)", inline=False)
-        embed.add_field(name="Order ID", value=order_id, inline=False)
-        embed.add_field(name="Customer", value=f"<@{order.user.discord_id}>", inline=False)
-        embed.add_field(name="Completed At", value=format_timestamp(get_eastern_time()), inline=False)
-        embed.add_field(name="Status", value=f"{get_status_emoji('delivered')} DELIVERED", inline=False)
+        settings = await guild_cache.get_settings(interaction.guild.id)
         
-        embed.set_footer(text="BM Creations Support | Trusted Since 2020")
+        embed = ORDER_COMPLETED_NOTICE.fill(fields=[
+            field("Order ID", order_id, inline=False),
+            field("Customer", f"<@{order.user.discord_id}>", inline=False),
+            field("Completed At", format_timestamp(get_eastern_time()), inline=False),
+            field("Status", f"{get_status_emoji('delivered')} DELIVERED", inline=False),
+        ])
         
         if settings.order_channel_id:
-            order_channel = self.bot.get_channel(settings.order_channel_id)
-            if order_channel:
-                await order_channel.send(embed=embed)
+            await notification_outbox.enqueue(settings.order_channel_id, order_id, embed)
         
         await interaction.followup.send(embed=embed)
         
@@ -472,16 +453,15 @@ class OrdersCog(commands.Cog):
         
         await interaction.response.defer()
         
-        order = await db_service.update_order_status(
-            order_id,
-            OrderStatus.SHIPPED,
-            tracking_number=tracking_number,
-            staff_id=interaction.user.id
+        outcome = await order_transitions.transition(
+            OrderStatus.SHIPPED, order_ids=[order_id], staff_id=interaction.user.id, tracking_number=tracking_number
         )
         
-        if not order:
-            await interaction.followup.send("Order not found.", ephemeral=True)
+        if not outcome.updated:
+            reason = outcome.skipped.get(order_id, "not found")
+            await interaction.followup.send(f"Order **{order_id}** was not updated: {reason}.", ephemeral=True)
             return
+        order = outcome.updated[0]
         
         embed = create_embed(
             title="Tracking Number Added",
@@ -490,7 +470,7 @@ class OrdersCog(commands.Cog):
         )
         
         embed.add_field(name="Tracking Number", value=tracking_number, inline=False)
-        embed.add_field(name="Status", value=f"{get_status_emoji('shipped')} Shipped", inline=True)
+        embed.add_field(name="Status", value=f"{get_status_emoji(order.status.value)} {order.status.value.title()}", inline=True)
         
         await interaction.followup.send(embed=embed)
         
@@ -506,6 +486,80 @@ class OrdersCog(commands.Cog):
                 await user.send(embed=dm_embed)
         except:
             pass
+    
+    @app_commands.command(name="bulkupdate", description="Update many orders at once (Staff only)")
+    @app_commands.describe(
+        status="New status for the orders",
+        order_ids="Order IDs separated by spaces or commas",
+        current_status="Update every order in this server that currently has this status"
+    )
+    @app_commands.choices(status=[
+        app_commands.Choice(name="Pending", value="pending"),
+        app_commands.Choice(name="Confirmed", value="confirmed"),
+        app_commands.Choice(name="Processing", value="processing"),
+        app_commands.Choice(name="Shipped", value="shipped"),
+        app_commands.Choice(name="Delivered", value="delivered"),
+        app_commands.Choice(name="Cancelled", value="cancelled"),
+        app_commands.Choice(name="Refunded", value="refunded"),
+    ], current_status=[
+        app_commands.Choice(name="Pending", value="pending"),
+        app_commands.Choice(name="Confirmed", value="confirmed"),
+        app_commands.Choice(name="Processing", value="processing"),
+        app_commands.Choice(name="Shipped", value="shipped"),
+        app_commands.Choice(name="Delivered", value="delivered"),
+        app_commands.Choice(name="Cancelled", value="cancelled"),
+        app_commands.Choice(name="Refunded", value="refunded"),
+    ])
+    @app_commands.default_permissions(manage_messages=True)
+    async def bulk_update(self, interaction: discord.Interaction, status: str,
+                          order_ids: str = None, current_status: str = None):
+        if not is_staff(interaction.user):
+            await interaction.response.send_message("You don't have permission to use this command.", ephemeral=True)
+            return
+        
+        ids = [order_id.strip() for order_id in order_ids.replace(",", " ").split() if order_id.strip()] if order_ids else None
+        if not ids and not current_status:
+            await interaction.response.send_message("Give me some order IDs or a current status to update.", ephemeral=True)
+            return
+        
+        await interaction.response.defer()
+        
+        outcome = await order_transitions.transition(
+            OrderStatus(status),
+            order_ids=ids,
+            guild_id=interaction.guild.id,
+            from_status=OrderStatus(current_status) if current_status else None,
+            staff_id=interaction.user.id
+        )
+        
+        embed = create_embed(
+            title="Bulk Order Update",
+            description=f"{len(outcome.updated)} order(s) moved to {get_status_emoji(status)} **{status.title()}**",
+            color=Config.SUCCESS_COLOR if outcome.updated else Config.WARNING_COLOR
+        )
+        
+        if outcome.updated:
+            updated = ", ".join(order.order_id for order in outcome.updated[:40])
+            if len(outcome.updated) > 40:
+                updated += f" and {len(outcome.updated) - 40} more"
+            embed.add_field(name="Updated", value=updated[:1024], inline=False)
+        
+        if outcome.skipped:
+            skipped = "\n".join(f"{order_id}: {reason}" for order_id, reason in list(outcome.skipped.items())[:15])
+            if len(outcome.skipped) > 15:
+                skipped += f"\n...and {len(outcome.skipped) - 15} more"
+            embed.add_field(name="Skipped", value=skipped[:1024], inline=False)
+        
+        if outcome.matched > outcome.processed:
+            embed.add_field(
+                name="⚠️ Not Finished",
+                value=f"{outcome.matched} orders matched but only the first {outcome.processed} were processed. "
+                      f"Run the command again to update the rest.",
+                inline=False
+            )
+        
+        embed.add_field(name="Updated By", value=interaction.user.mention, inline=True)
+        await interaction.followup.send(embed=embed)
 
 async def setup(bot: commands.Bot):
     await bot.add_cog(OrdersCog(bot))
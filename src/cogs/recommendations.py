@@ -3,6 +3,7 @@ from discord.ext import commands
 from typing import List
 
 from src.services.database import db_service
+from src.services.cache import guild_cache
 from src.utils.helpers import create_embed, is_staff, is_ticket_channel, format_price
 from src.utils.translations import get_text
 from src.config import Config
@@ -15,7 +16,7 @@ class RecommendationsCog(commands.Cog):
         history = await db_service.get_user_history(discord_id, guild_id)
         
         if not history.get("user"):
-            return await db_service.get_products(guild_id, available_only=True)
+            return await guild_cache.get_products(guild_id, available_only=True)
         
         user = history["user"]
         orders = history.get("orders", [])
@@ -31,7 +32,7 @@ class RecommendationsCog(commands.Cog):
                     if item.product and item.product.category:
                         purchased_categories.add(item.product.category)
         
-        all_products = await db_service.get_products(guild_id, available_only=True)
+        all_products = await guild_cache.get_products(guild_id, available_only=True)
         
         recommendations = []
         for product in all_products:
@@ -126,7 +127,7 @@ class RecommendationsCog(commands.Cog):
             await ctx.send(embed=embed, delete_after=10)
             return
         
-        products = await db_service.search_products(ctx.guild.id, product_name)
+        products = await guild_cache.search_products(ctx.guild.id, product_name)
         
         if not products:
             await ctx.send("Product not found.", delete_after=5)
@@ -134,7 +135,7 @@ class RecommendationsCog(commands.Cog):
         
         target_product = products[0]
         
-        all_products = await db_service.get_products(ctx.guild.id, category=target_product.category)
+        all_products = await guild_cache.get_products(ctx.guild.id, category=target_product.category)
         
         similar = [p for p in all_products if p.id != target_product.id][:5]
         
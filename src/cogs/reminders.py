@@ -21,7 +21,6 @@ class RemindersCog(commands.Cog):
     @tasks.loop(seconds=30)
     async def check_reminders(self):
         try:
-            await db_service.ensure_initialized()
             reminders = await db_service.get_pending_reminders()
             
             for reminder in reminders:
@@ -81,11 +80,11 @@ class RemindersCog(commands.Cog):
     @check_reminders.before_loop
     async def before_check_reminders(self):
         await self.bot.wait_until_ready()
+        await db_service.wait_until_ready()
     
     @tasks.loop(minutes=1)
     async def check_announcements(self):
         try:
-            await db_service.ensure_initialized()
             announcements = await db_service.get_pending_announcements()
             
             for announcement in announcements:
@@ -112,6 +111,7 @@ class RemindersCog(commands.Cog):
     @check_announcements.before_loop
     async def before_check_announcements(self):
         await self.bot.wait_until_ready()
+        await db_service.wait_until_ready()
     
     @commands.command(name="remind", aliases=["remindme"])
     async def set_reminder(self, ctx: commands.Context, time: str, *, message: str):
@@ -1,13 +1,28 @@
 import discord
 from discord.ext import commands
 from discord import app_commands, ui
-from typing import Optional, Dict, Set
+from typing import Optional, Dict, List, Set
 import asyncio
 from datetime import datetime
 
 from src.services.database import db_service
+from src.services.cache import guild_cache
 from src.models.database import TicketStatus, OrderStatus
 from src.utils.helpers import create_embed, is_staff, format_timestamp, get_eastern_time, get_status_emoji
+from src.services.instrumentation import instrument
+from src.services.notifications import notification_outbox
+from src.services.orders import order_placement
+from src.services.catalog import product_catalog, category_info
+from src.services.interactions import interaction_router, routed_id, order_id_from_message
+from src.services.transcripts import transcript_archiver
+from src.services.debounce import message_debouncer
+from src.services.ratelimit import AutoReplyLimiter, DEFAULT_INPUT_BUDGETS
+from src.utils.views import InstrumentedView, RoutedView, copy_components
+from src.utils.embeds import (
+    field, TIMELINE_STAGE, ORDER_CREATED, ORDER_RECEIVED_STATUS, ORDER_COMPLETED_TICKET,
+    ORDER_DELIVERED_STATUS, ORDER_COMPLETED_DM, TRIGGER_PRODUCT, MARKET_FOOTER,
+    COMPLETED_COLOR, PROCESSING_COLOR
+)
 from src.config import Config
 
 suppressed_channels: Dict[int, datetime] = {}
@@ -34,339 +49,61 @@ def blur_name(name: str) -> str:
         return name[0] + "*" * (len(name) - 1)
     return name[0] + "*" * (len(name) - 2) + name[-1]
 
-class OrderTimelineView(ui.View):
-    def __init__(self, order_id: str, bot: commands.Bot, customer_name: str = None, product_name: str = None, product_price: float = None, ticket_channel_id: int = None, timeout: float = None):
-        super().__init__(timeout=timeout)
-        self.order_id = order_id
-        self.bot = bot
-        self.customer_name = customer_name
-        self.product_name = product_name
-        self.product_price = product_price
-        self.ticket_channel_id = ticket_channel_id
-        self.current_stage = 1
-    
-    async def interaction_check(self, interaction: discord.Interaction) -> bool:
-        if not is_owner_user(interaction.user):
-            if not interaction.user.guild_permissions.administrator:
-                await interaction.response.send_message(
-                    "Only the owner can update order status!", 
-                    ephemeral=True
-                )
-                return False
-        return True
-    
-    def get_timeline_display(self, stage: int) -> str:
-        stages = [
-            ("Order Confirmed", "✅" if stage >= 1 else "⏳"),
-            ("Payment Received", "✅" if stage >= 2 else "⏳"),
-            ("Order Processing", "✅" if stage >= 3 else "⏳"),
-            ("Completed", "✅" if stage >= 4 else "⏳"),
-        ]
-        
-        lines = []
-        for i, (name, status) in enumerate(stages, 1):
-            if i < stage:
-                lines.append(f"{status} ~~{name}~~")
-            elif i == stage:
-                lines.append(f"**{status} {name}** ← Current")
-            else:
-                lines.append(f"{status} {name}")
-        
-        return "\n".join(lines)
-    
-    @ui.button(label="Payment Received", style=discord.ButtonStyle.primary, emoji="💰", custom_id="payment_received", row=0)
-    async def payment_received(self, interaction: discord.Interaction, button: ui.Button):
-        self.current_stage = 2
-        button.disabled = True
-        try:
-            await interaction.message.edit(view=self)
-        except:
-            pass
-        
-        embed = discord.Embed(
-            title="💰 Payment Received",
-            description=f"**Order:** {self.order_id}\n\n**Timeline:**\n{self.get_timeline_display(2)}",
-            color=0x00ff00
-        )
-        embed.set_footer(text="BM Creations Support • Trusted since 2020")
-        await interaction.response.send_message(embed=embed)
-    
-    @ui.button(label="Order Processing", style=discord.ButtonStyle.primary, emoji="⚙️", custom_id="order_processing", row=0)
-    async def order_processing(self, interaction: discord.Interaction, button: ui.Button):
-        self.current_stage = 3
-        button.disabled = True
-        for item in self.children:
-            if hasattr(item, 'custom_id') and item.custom_id == 'payment_received':
-                item.disabled = True
-        try:
-            await interaction.message.edit(view=self)
-        except:
-            pass
-        
-        embed = discord.Embed(
-            title="⚙️ Order Processing",
-            description=f"**Order:** {self.order_id}\n\n**Timeline:**\n{self.get_timeline_display(3)}",
-            color=0xffa500
-        )
-        embed.set_footer(text="BM Creations Support • Trusted since 2020")
-        await interaction.response.send_message(embed=embed)
-    
-    @ui.button(label="Mark Complete", style=discord.ButtonStyle.success, emoji="✅", custom_id="mark_complete", row=0)
-    async def mark_complete(self, interaction: discord.Interaction, button: ui.Button):
-        await interaction.response.defer()
-        
-        order = await db_service.update_order_status(
-            self.order_id,
-            OrderStatus.DELIVERED,
-            staff_id=interaction.user.id
-        )
-        
-        if not order:
-            await interaction.followup.send("Order not found!", ephemeral=True)
-            return
-        
-        self.current_stage = 4
-        for item in self.children:
-            if hasattr(item, 'disabled'):
-                item.disabled = True
-        
-        try:
-            await interaction.message.edit(view=self)
-        except:
-            pass
-        
-        completed_time = format_timestamp(get_eastern_time())
-        blurred_customer = blur_name(self.customer_name) if self.customer_name else "Customer"
-        hidden_order_id = f"||{self.order_id}||"
-        hidden_ticket = f"||<#{self.ticket_channel_id}>||" if self.ticket_channel_id else "||Private||"
-        
-        ticket_embed = discord.Embed(
-            title="🎉 𝐎𝐫𝐝𝐞𝐫 𝐂𝐨𝐦𝐩𝐥𝐞𝐭𝐞𝐝!",
-            description=f"Thank you for shopping with **BM Creations Market!**\n\nYour order has been **successfully delivered**! 🚀",
-            color=0x00ff00
-        )
-        ticket_embed.add_field(name="🆔 Order ID", value=hidden_order_id, inline=True)
-        ticket_embed.add_field(name="👤 Customer", value=blurred_customer, inline=True)
-        ticket_embed.add_field(name="📦 Status", value="✅ **COMPLETED**", inline=True)
-        if self.product_name:
-            ticket_embed.add_field(name="🛒 Product", value=self.product_name, inline=True)
-        if self.product_price:
-            ticket_embed.add_field(name="💰 Price", value=f"${self.product_price}", inline=True)
-        ticket_embed.add_field(name="⏰ Completed At", value=completed_time, inline=True)
-        ticket_embed.add_field(
-            name="🌐 Connect With Us",
-            value="🔗 **Website:** [imvublackmarket.xyz](https://imvublackmarket.xyz/)\n📸 **Instagram:** [@imvublackmarket_official](https://www.instagram.com/imvublackmarket_official)",
-            inline=False
-        )
-        ticket_embed.add_field(name="📋 Ticket", value=hidden_ticket, inline=True)
-        ticket_embed.set_footer(text="BM Creations Support • Trusted since 2020")
-        
-        await interaction.followup.send(embed=ticket_embed)
-        
-        settings = await db_service.get_or_create_guild_settings(interaction.guild.id)
-        if settings.order_channel_id:
-            order_channel = self.bot.get_channel(settings.order_channel_id)
-            if order_channel:
-                status_embed = discord.Embed(
-                    title="✅ 𝐎𝐫𝐝𝐞𝐫 𝐃𝐞𝐥𝐢𝐯𝐞𝐫𝐞𝐝",
-                    description=f"Order has been **successfully delivered!** 🎉",
-                    color=0x00ff00
-                )
-                status_embed.add_field(name="🆔 Order ID", value=hidden_order_id, inline=True)
-                status_embed.add_field(name="👤 Customer", value=blurred_customer, inline=True)
-                status_embed.add_field(name="📦 Status", value="✅ **COMPLETED**", inline=True)
-                if self.product_name:
-                    status_embed.add_field(name="🛒 Product", value=self.product_name, inline=True)
-                if self.product_price:
-                    status_embed.add_field(name="💰 Price", value=f"${self.product_price}", inline=True)
-                status_embed.add_field(name="⏰ Completed At", value=completed_time, inline=True)
-                status_embed.add_field(name="✍️ Completed By", value=interaction.user.mention, inline=True)
-                status_embed.add_field(name="📋 Ticket", value=hidden_ticket, inline=True)
-                status_embed.add_field(
-                    name="🌐 Connect With Us",
-                    value="🔗 **Website:** [imvublackmarket.xyz](https://imvublackmarket.xyz/)\n📸 **Instagram:** [@imvublackmarket_official](https://www.instagram.com/imvublackmarket_official)",
-                    inline=False
-                )
-                status_embed.set_footer(text="BM Creations Support • Trusted since 2020")
-                await order_channel.send(embed=status_embed)
-        
-        try:
-            user = self.bot.get_user(order.user.discord_id)
-            if user:
-                dm_embed = discord.Embed(
-                    title="🎉 Your Order is Complete!",
-                    description=f"Your order **{self.order_id}** has been **successfully delivered!** 🚀\n\nThank you for choosing **BM Creations Market!**",
-                    color=0x00ff00
-                )
-                dm_embed.add_field(
-                    name="🌐 Connect With Us",
-                    value="🔗 **Website:** [imvublackmarket.xyz](https://imvublackmarket.xyz/)\n📸 **Instagram:** [@imvublackmarket_official](https://www.instagram.com/imvublackmarket_official)",
-                    inline=False
-                )
-                dm_embed.set_footer(text="BM Creations Support • Trusted since 2020")
-                await user.send(embed=dm_embed)
-        except:
-            pass
-        
-        try:
-            if interaction.channel:
-                current_name = interaction.channel.name
-                if "-pending" in current_name:
-                    new_name = current_name.replace("-pending", "-complete")
-                    await interaction.channel.edit(name=new_name)
-                elif "pending" in current_name:
-                    new_name = current_name.replace("pending", "complete")
-                    await interaction.channel.edit(name=new_name)
-        except:
-            pass
-        
-        self.stop()
+def completed_order_fields(order_id: str, customer_name: str = None, product_name: str = None, product_price: float = None) -> list:
+    fields = [
+        field("🆔 Order ID", f"||{order_id}||"),
+        field("👤 Customer", blur_name(customer_name) if customer_name else "Customer"),
+        field("📦 Status", "✅ **COMPLETED**"),
+    ]
+    if product_name:
+        fields.append(field("🛒 Product", product_name))
+    if product_price:
+        fields.append(field("💰 Price", f"${product_price}"))
+    fields.append(field("⏰ Completed At", format_timestamp(get_eastern_time())))
+    return fields
 
-class OrderCompletionView(ui.View):
-    def __init__(self, order_id: str, bot: commands.Bot, customer_name: str = None, product_name: str = None, product_price: float = None, ticket_channel_id: int = None, timeout: float = None):
-        super().__init__(timeout=timeout)
-        self.order_id = order_id
-        self.bot = bot
-        self.customer_name = customer_name
-        self.product_name = product_name
-        self.product_price = product_price
-        self.ticket_channel_id = ticket_channel_id
-    
-    async def interaction_check(self, interaction: discord.Interaction) -> bool:
-        if not is_owner_user(interaction.user):
-            if not interaction.user.guild_permissions.administrator:
-                await interaction.response.send_message(
-                    "Only the owner can complete orders!", 
-                    ephemeral=True
-                )
-                return False
-        return True
+def timeline_display(stage: int) -> str:
+    stages = [
+        ("Order Confirmed", "✅" if stage >= 1 else "⏳"),
+        ("Payment Received", "✅" if stage >= 2 else "⏳"),
+        ("Order Processing", "✅" if stage >= 3 else "⏳"),
+        ("Completed", "✅" if stage >= 4 else "⏳"),
+    ]
+    
+    lines = []
+    for i, (name, status) in enumerate(stages, 1):
+        if i < stage:
+            lines.append(f"{status} ~~{name}~~")
+        elif i == stage:
+            lines.append(f"**{status} {name}** ← Current")
+        else:
+            lines.append(f"{status} {name}")
     
-    @ui.button(label="Mark Completed", style=discord.ButtonStyle.success, emoji="✅", custom_id="complete_order")
-    async def complete_order(self, interaction: discord.Interaction, button: ui.Button):
-        await interaction.response.defer()
-        
-        order = await db_service.update_order_status(
-            self.order_id,
-            OrderStatus.DELIVERED,
-            staff_id=interaction.user.id
-        )
-        
-        if not order:
-            await interaction.followup.send("Order not found!", ephemeral=True)
-            return
-        
-        for item in self.children:
-            item.disabled = True
-        
-        try:
-            await interaction.message.edit(view=self)
-        except:
-            pass
-        
-        completed_time = format_timestamp(get_eastern_time())
-        blurred_customer = blur_name(self.customer_name) if self.customer_name else "Customer"
-        hidden_order_id = f"||{self.order_id}||"
-        hidden_ticket = f"||<#{self.ticket_channel_id}>||" if self.ticket_channel_id else "||Private||"
-        
-        ticket_embed = discord.Embed(
-            title="🎉 𝐎𝐫𝐝𝐞𝐫 𝐂𝐨𝐦𝐩𝐥𝐞𝐭𝐞𝐝!",
-            description=f"Thank you for shopping with **BM Creations Market!**\n\nYour order has been **successfully delivered**! 🚀",
-            color=0x00ff00
-        )
-        ticket_embed.add_field(name="🆔 Order ID", value=hidden_order_id, inline=True)
-        ticket_embed.add_field(name="👤 Customer", value=blurred_customer, inline=True)
-        ticket_embed.add_field(name="📦 Status", value="✅ **COMPLETED**", inline=True)
-        if self.product_name:
-            ticket_embed.add_field(name="🛒 Product", value=self.product_name, inline=True)
-        if self.product_price:
-            ticket_embed.add_field(name="💰 Price", value=f"${self.product_price}", inline=True)
-        ticket_embed.add_field(name="⏰ Completed At", value=completed_time, inline=True)
-        ticket_embed.add_field(
-            name="🌐 Connect With Us",
-            value="🔗 **Website:** [imvublackmarket.xyz](https://imvublackmarket.xyz/)\n📸 **Instagram:** [@imvublackmarket_official](https://www.instagram.com/imvublackmarket_official)",
-            inline=False
-        )
-        ticket_embed.add_field(name="📋 Ticket", value=hidden_ticket, inline=True)
-        ticket_embed.set_footer(text="BM Creations Support • Trusted since 2020")
-        
-        await interaction.followup.send(embed=ticket_embed)
-        
-        settings = await db_service.get_or_create_guild_settings(interaction.guild.id)
-        if settings.order_channel_id:
-            order_channel = self.bot.get_channel(settings.order_channel_id)
-            if order_channel:
-                status_embed = discord.Embed(
-                    title="✅ 𝐎𝐫𝐝𝐞𝐫 𝐃𝐞𝐥𝐢𝐯𝐞𝐫𝐞𝐝",
-                    description=f"Order has been **successfully delivered!** 🎉",
-                    color=0x00ff00
-                )
-                status_embed.add_field(name="🆔 Order ID", value=hidden_order_id, inline=True)
-                status_embed.add_field(name="👤 Customer", value=blurred_customer, inline=True)
-                status_embed.add_field(name="📦 Status", value="✅ **COMPLETED**", inline=True)
-                if self.product_name:
-                    status_embed.add_field(name="🛒 Product", value=self.product_name, inline=True)
-                if self.product_price:
-                    status_embed.add_field(name="💰 Price", value=f"${self.product_price}", inline=True)
-                status_embed.add_field(name="⏰ Completed At", value=completed_time, inline=True)
-                status_embed.add_field(name="✍️ Completed By", value=interaction.user.mention, inline=True)
-                status_embed.add_field(name="📋 Ticket", value=hidden_ticket, inline=True)
-                status_embed.add_field(
-                    name="🌐 Connect With Us",
-                    value="🔗 **Website:** [imvublackmarket.xyz](https://imvublackmarket.xyz/)\n📸 **Instagram:** [@imvublackmarket_official](https://www.instagram.com/imvublackmarket_official)",
-                    inline=False
-                )
-                status_embed.set_footer(text="BM Creations Support • Trusted since 2020")
-                await order_channel.send(embed=status_embed)
-        
-        try:
-            user = self.bot.get_user(order.user.discord_id)
-            if user:
-                dm_embed = discord.Embed(
-                    title="🎉 Your Order is Complete!",
-                    description=f"Your order **{self.order_id}** has been **successfully delivered!** 🚀\n\nThank you for choosing **BM Creations Market!**",
-                    color=0x00ff00
-                )
-                dm_embed.add_field(
-                    name="🌐 Connect With Us",
-                    value="🔗 **Website:** [imvublackmarket.xyz](https://imvublackmarket.xyz/)\n📸 **Instagram:** [@imvublackmarket_official](https://www.instagram.com/imvublackmarket_official)",
-                    inline=False
-                )
-                dm_embed.set_footer(text="BM Creations Support • Trusted since 2020")
-                await user.send(embed=dm_embed)
-        except:
-            pass
-        
-        try:
-            if interaction.channel:
-                current_name = interaction.channel.name
-                if "-pending" in current_name:
-                    new_name = current_name.replace("-pending", "-complete")
-                    await interaction.channel.edit(name=new_name)
-                elif "pending" in current_name:
-                    new_name = current_name.replace("pending", "complete")
-                    await interaction.channel.edit(name=new_name)
-        except:
-            pass
-        
-        self.stop()
+    return "\n".join(lines)
 
-PERMANENT_TRIGGER_PRODUCTS = [
-    {"name": "King Cummy", "price": 35},
-    {"name": "Venom3", "price": 50},
-    {"name": "KingKong V4", "price": 40},
-    {"name": "Private BBC V5", "price": 55},
-    {"name": "King Cummy V8", "price": 50},
-    {"name": "Female Trigger", "price": 60},
-    {"name": "Red Venom", "price": 60},
-]
+async def ticket_from_channel(interaction: discord.Interaction) -> Optional[List[str]]:
+    ticket = await db_service.get_ticket(channel_id=interaction.channel_id)
+    if not ticket or not ticket.user:
+        return None
+    return [str(interaction.channel_id), str(ticket.user.discord_id)]
 
-GIFTING_TRIGGER_PRODUCTS = [
-    {"name": "HD Kong", "price": 38},
-    {"name": "BBC King Ultra", "price": 38},
-]
+class OrderTimelineView(RoutedView):
+    def __init__(self, order_id: str):
+        super().__init__()
+        self.add_item(ui.Button(label="Payment Received", style=discord.ButtonStyle.primary, emoji="💰",
+                                custom_id=routed_id("order", "paid", order_id), row=0))
+        self.add_item(ui.Button(label="Order Processing", style=discord.ButtonStyle.primary, emoji="⚙️",
+                                custom_id=routed_id("order", "processing", order_id), row=0))
+        self.add_item(ui.Button(label="Mark Complete", style=discord.ButtonStyle.success, emoji="✅",
+                                custom_id=routed_id("order", "complete", order_id), row=0))
+
+class OrderCompletionView(RoutedView):
+    def __init__(self, order_id: str):
+        super().__init__()
+        self.add_item(ui.Button(label="Mark Completed", style=discord.ButtonStyle.success, emoji="✅",
+                                custom_id=routed_id("order", "complete", order_id)))
 
-class ProductButtonView(ui.View):
+class ProductButtonView(InstrumentedView):
     def __init__(self, user_id: int, channel_id: int, product: dict, is_permanent: bool, paypal_link: str, bot: commands.Bot, timeout: float = 600):
         super().__init__(timeout=timeout)
         self.user_id = user_id
@@ -435,169 +172,12 @@ class ProductButtonView(ui.View):
         ticket = await db_service.get_ticket(channel_id=self.channel_id)
         if ticket and ticket.extra_data:
             category = ticket.extra_data.get("selected_category", "permanent_triggers")
-            if category == "permanent_triggers":
-                view = PermanentTriggersView(self.user_id, self.channel_id, self.paypal_link, self.bot)
-                title = "🎯 Permanent Triggers"
-            else:
-                view = GiftingTriggersView(self.user_id, self.channel_id, self.paypal_link, self.bot)
-                title = "🎁 Gifting Triggers"
-            
-            embed = create_embed(
-                title=title,
-                description="Select the product you want to purchase:",
-                color=Config.EMBED_COLOR
-            )
+            embed, view = await product_catalog.render(interaction.guild.id, category, interaction.user.id)
             await interaction.response.send_message(embed=embed, view=view)
         else:
             await interaction.response.send_message("Please start a new purchase.", ephemeral=True)
 
-class PermanentTriggersView(ui.View):
-    def __init__(self, user_id: int, channel_id: int, paypal_link: str, bot: commands.Bot, timeout: float = 600):
-        super().__init__(timeout=timeout)
-        self.user_id = user_id
-        self.channel_id = channel_id
-        self.paypal_link = paypal_link
-        self.bot = bot
-    
-    async def interaction_check(self, interaction: discord.Interaction) -> bool:
-        if interaction.user.id != self.user_id:
-            await interaction.response.send_message("This menu is not for you!", ephemeral=True)
-            return False
-        return True
-    
-    async def show_product_detail(self, interaction: discord.Interaction, product: dict):
-        for item in self.children:
-            item.disabled = True
-        try:
-            await interaction.message.edit(view=self)
-        except:
-            pass
-        
-        ticket = await db_service.get_ticket(channel_id=self.channel_id)
-        if ticket:
-            extra = ticket.extra_data or {}
-            extra["selected_product"] = product["name"]
-            extra["product_price"] = product["price"]
-            await db_service.update_ticket_extra_data(ticket.ticket_id, extra)
-        
-        embed = discord.Embed(
-            title=f"🎯 {product['name']}",
-            color=Config.EMBED_COLOR
-        )
-        embed.add_field(name="💰 Price", value=f"**${product['price']}**", inline=True)
-        embed.add_field(name="⏳ Permanent", value="**Yes**", inline=True)
-        embed.add_field(name="🔐 Login Required", value="Yes (for uploading)", inline=True)
-        embed.add_field(name="🏠 Sex Room Required", value="**Yes**", inline=True)
-        embed.add_field(name="📝 Note", value="Send screenshot after payment", inline=False)
-        embed.set_footer(text="BM Creations Market | Trusted Since 2020")
-        
-        view = ProductButtonView(self.user_id, self.channel_id, product, True, self.paypal_link, self.bot)
-        await interaction.response.send_message(embed=embed, view=view)
-        self.stop()
-    
-    @ui.button(label="King Cummy - $35", style=discord.ButtonStyle.success, custom_id="perm_king_cummy", row=0)
-    async def king_cummy(self, interaction: discord.Interaction, button: ui.Button):
-        await self.show_product_detail(interaction, {"name": "King Cummy", "price": 35})
-    
-    @ui.button(label="Venom3 - $50", style=discord.ButtonStyle.success, custom_id="perm_venom3", row=0)
-    async def venom3(self, interaction: discord.Interaction, button: ui.Button):
-        await self.show_product_detail(interaction, {"name": "Venom3", "price": 50})
-    
-    @ui.button(label="KingKong V4 - $40", style=discord.ButtonStyle.success, custom_id="perm_kingkong_v4", row=0)
-    async def kingkong_v4(self, interaction: discord.Interaction, button: ui.Button):
-        await self.show_product_detail(interaction, {"name": "KingKong V4", "price": 40})
-    
-    @ui.button(label="Private BBC V5 - $55", style=discord.ButtonStyle.success, custom_id="perm_private_bbc_v5", row=1)
-    async def private_bbc_v5(self, interaction: discord.Interaction, button: ui.Button):
-        await self.show_product_detail(interaction, {"name": "Private BBC V5", "price": 55})
-    
-    @ui.button(label="King Cummy V8 - $50", style=discord.ButtonStyle.success, custom_id="perm_king_cummy_v8", row=1)
-    async def king_cummy_v8(self, interaction: discord.Interaction, button: ui.Button):
-        await self.show_product_detail(interaction, {"name": "King Cummy V8", "price": 50})
-    
-    @ui.button(label="Female Trigger - $60", style=discord.ButtonStyle.success, custom_id="perm_female_trigger", row=2)
-    async def female_trigger(self, interaction: discord.Interaction, button: ui.Button):
-        await self.show_product_detail(interaction, {"name": "Female Trigger", "price": 60})
-    
-    @ui.button(label="Red Venom - $60", style=discord.ButtonStyle.success, custom_id="perm_red_venom", row=2)
-    async def red_venom(self, interaction: discord.Interaction, button: ui.Button):
-        await self.show_product_detail(interaction, {"name": "Red Venom", "price": 60})
-    
-    @ui.button(label="⬅️ Back", style=discord.ButtonStyle.secondary, custom_id="perm_back", row=2)
-    async def back_button(self, interaction: discord.Interaction, button: ui.Button):
-        embed = create_embed(
-            title="🛍️ What would you like to buy?",
-            description="Please select a product category below:",
-            color=Config.EMBED_COLOR
-        )
-        view = ProductCategorySelect(self.user_id, self.channel_id, self.paypal_link, self.bot)
-        await interaction.response.send_message(embed=embed, view=view)
-        self.stop()
-
-class GiftingTriggersView(ui.View):
-    def __init__(self, user_id: int, channel_id: int, paypal_link: str, bot: commands.Bot, timeout: float = 600):
-        super().__init__(timeout=timeout)
-        self.user_id = user_id
-        self.channel_id = channel_id
-        self.paypal_link = paypal_link
-        self.bot = bot
-    
-    async def interaction_check(self, interaction: discord.Interaction) -> bool:
-        if interaction.user.id != self.user_id:
-            await interaction.response.send_message("This menu is not for you!", ephemeral=True)
-            return False
-        return True
-    
-    async def show_product_detail(self, interaction: discord.Interaction, product: dict):
-        for item in self.children:
-            item.disabled = True
-        try:
-            await interaction.message.edit(view=self)
-        except:
-            pass
-        
-        ticket = await db_service.get_ticket(channel_id=self.channel_id)
-        if ticket:
-            extra = ticket.extra_data or {}
-            extra["selected_product"] = product["name"]
-            extra["product_price"] = product["price"]
-            await db_service.update_ticket_extra_data(ticket.ticket_id, extra)
-        
-        embed = discord.Embed(
-            title=f"🎁 {product['name']}",
-            color=Config.EMBED_COLOR
-        )
-        embed.add_field(name="💰 Price", value=f"**${product['price']}**", inline=True)
-        embed.add_field(name="⏳ Permanent", value="**6 Months**", inline=True)
-        embed.add_field(name="🔐 Login Required", value="Yes (for uploading)", inline=True)
-        embed.add_field(name="🏠 Sex Room Required", value="**Yes**", inline=True)
-        embed.add_field(name="📝 Note", value="Send screenshot after payment", inline=False)
-        embed.set_footer(text="BM Creations Market | Trusted Since 2020")
-        
-        view = ProductButtonView(self.user_id, self.channel_id, product, False, self.paypal_link, self.bot)
-        await interaction.response.send_message(embed=embed, view=view)
-        self.stop()
-    
-    @ui.button(label="HD Kong - $38", style=discord.ButtonStyle.primary, custom_id="gift_hd_kong", row=0)
-    async def hd_kong(self, interaction: discord.Interaction, button: ui.Button):
-        await self.show_product_detail(interaction, {"name": "HD Kong", "price": 38})
-    
-    @ui.button(label="BBC King Ultra - $38", style=discord.ButtonStyle.primary, custom_id="gift_bbc_king_ultra", row=0)
-    async def bbc_king_ultra(self, interaction: discord.Interaction, button: ui.Button):
-        await self.show_product_detail(interaction, {"name": "BBC King Ultra", "price": 38})
-    
-    @ui.button(label="⬅️ Back", style=discord.ButtonStyle.secondary, custom_id="gift_back", row=0)
-    async def back_button(self, interaction: discord.Interaction, button: ui.Button):
-        embed = create_embed(
-            title="🛍️ What would you like to buy?",
-            description="Please select a product category below:",
-            color=Config.EMBED_COLOR
-        )
-        view = ProductCategorySelect(self.user_id, self.channel_id, self.paypal_link, self.bot)
-        await interaction.response.send_message(embed=embed, view=view)
-        self.stop()
-
-class ProductCategorySelect(ui.View):
+class ProductCategorySelect(InstrumentedView):
     def __init__(self, user_id: int, channel_id: int, paypal_link: str = None, bot: commands.Bot = None, timeout: float = 300):
         super().__init__(timeout=timeout)
         self.user_id = user_id
@@ -646,24 +226,7 @@ class ProductCategorySelect(ui.View):
             extra["selected_category"] = category
             await db_service.update_ticket_extra_data(ticket.ticket_id, extra)
         
-        settings = await db_service.get_or_create_guild_settings(interaction.guild.id)
-        paypal_link = settings.paypal_link or self.paypal_link
-        
-        if category == "permanent_triggers":
-            embed = create_embed(
-                title="🎯 Permanent Triggers",
-                description="Select the product you want to purchase:\n\n*All Permanent Triggers include lifetime warranty*",
-                color=Config.EMBED_COLOR
-            )
-            view = PermanentTriggersView(self.user_id, self.channel_id, paypal_link, self.bot)
-        else:
-            embed = create_embed(
-                title="🎁 Gifting Triggers",
-                description="Select the product you want to purchase:\n\n*Gifting Triggers have a 6-month warranty*",
-                color=Config.EMBED_COLOR
-            )
-            view = GiftingTriggersView(self.user_id, self.channel_id, paypal_link, self.bot)
-        
+        embed, view = await product_catalog.render(interaction.guild.id, category, self.user_id)
         await interaction.response.send_message(embed=embed, view=view)
         self.stop()
     
@@ -697,103 +260,17 @@ class ProductCategorySelect(ui.View):
         await interaction.response.send_message(embed=embed)
         self.stop()
 
-class TicketWelcomeView(ui.View):
-    def __init__(self, user_id: int, bot: commands.Bot, channel_id: int, timeout: float = None):
-        super().__init__(timeout=timeout)
-        self.user_id = user_id
-        self.bot = bot
-        self.channel_id = channel_id
-    
-    async def interaction_check(self, interaction: discord.Interaction) -> bool:
-        if interaction.user.id != self.user_id:
-            await interaction.response.send_message("This menu is not for you!", ephemeral=True)
-            return False
-        return True
-    
-    @ui.button(label="Buy Product", style=discord.ButtonStyle.success, emoji="🛒", custom_id="buy_product")
-    async def buy_product(self, interaction: discord.Interaction, button: ui.Button):
-        for item in self.children:
-            item.disabled = True
-        try:
-            await interaction.message.edit(view=self)
-        except:
-            pass
-        
-        settings = await db_service.get_or_create_guild_settings(interaction.guild.id)
-        paypal_link = settings.paypal_link or ""
-        
-        embed = create_embed(
-            title="🛍️ What would you like to buy?",
-            description="Please select a product category below:",
-            color=Config.EMBED_COLOR
-        )
-        
-        view = ProductCategorySelect(self.user_id, self.channel_id, paypal_link, self.bot)
-        await interaction.response.send_message(embed=embed, view=view)
-        
-        ticket = await db_service.get_ticket(channel_id=self.channel_id)
-        if ticket:
-            extra = ticket.extra_data or {}
-            extra["flow"] = "buy_product"
-            await db_service.update_ticket_extra_data(ticket.ticket_id, extra)
-    
-    @ui.button(label="Any Queries", style=discord.ButtonStyle.primary, emoji="❓", custom_id="any_queries")
-    async def any_queries(self, interaction: discord.Interaction, button: ui.Button):
-        for item in self.children:
-            item.disabled = True
-        try:
-            await interaction.message.edit(view=self)
-        except:
-            pass
-        
-        embed = create_embed(
-            title="💬 How can I help you?",
-            description="Please describe your question or concern, and I'll do my best to assist you!\n\nYou can ask about:\n• Product information\n• Order status\n• Payment issues\n• Technical support\n• Anything else!",
-            color=Config.EMBED_COLOR
-        )
-        
-        await interaction.response.send_message(embed=embed)
-        
-        ticket = await db_service.get_ticket(channel_id=self.channel_id)
-        if ticket:
-            extra = ticket.extra_data or {}
-            extra["flow"] = "queries"
-            extra["awaiting_query"] = True
-            await db_service.update_ticket_extra_data(ticket.ticket_id, extra)
-    
-    @ui.button(label="Close Ticket", style=discord.ButtonStyle.danger, emoji="🔒", custom_id="close_ticket", row=1)
-    async def close_ticket(self, interaction: discord.Interaction, button: ui.Button):
-        ticket = await db_service.get_ticket(channel_id=self.channel_id)
-        
-        if not ticket:
-            await interaction.response.send_message("This is not a ticket channel.", ephemeral=True)
-            return
-        
-        await interaction.response.defer()
-        
-        await db_service.update_ticket_status(ticket.ticket_id, TicketStatus.CLOSED)
-        
-        embed = create_embed(
-            title="🔒 Ticket Closed",
-            description=f"This ticket has been closed by {interaction.user.mention}\n\n**Thank you for using BM Creations Market!**",
-            color=Config.WARNING_COLOR
-        )
-        embed.add_field(name="Ticket ID", value=ticket.ticket_id, inline=True)
-        embed.add_field(name="Closed At", value=format_timestamp(get_eastern_time()), inline=True)
-        
-        await interaction.followup.send(embed=embed)
-        
-        await interaction.channel.send("This channel will be deleted in 10 seconds...")
-        
-        import asyncio
-        await asyncio.sleep(10)
-        
-        try:
-            await interaction.channel.delete(reason="Ticket closed by user")
-        except:
-            pass
+class TicketWelcomeView(RoutedView):
+    def __init__(self, user_id: int, channel_id: int):
+        super().__init__()
+        self.add_item(ui.Button(label="Buy Product", style=discord.ButtonStyle.success, emoji="🛒",
+                                custom_id=routed_id("ticket", "buy", channel_id, user_id)))
+        self.add_item(ui.Button(label="Any Queries", style=discord.ButtonStyle.primary, emoji="❓",
+                                custom_id=routed_id("ticket", "queries", channel_id, user_id)))
+        self.add_item(ui.Button(label="Close Ticket", style=discord.ButtonStyle.danger, emoji="🔒",
+                                custom_id=routed_id("ticket", "close", channel_id, user_id), row=1))
 
-class PaymentConfirmView(ui.View):
+class PaymentConfirmView(InstrumentedView):
     def __init__(self, user_id: int, product_name: str, timeout: float = 600):
         super().__init__(timeout=timeout)
         self.user_id = user_id
@@ -840,7 +317,7 @@ class PaymentConfirmView(ui.View):
         
         await interaction.response.send_message(embed=embed)
 
-class PaymentButtonsView(ui.View):
+class PaymentButtonsView(InstrumentedView):
     def __init__(self, user_id: int, product_name: str, paypal_link: str, timeout: float = 600):
         super().__init__(timeout=timeout)
         self.user_id = user_id
@@ -917,6 +394,260 @@ class SupportInteractionCog(commands.Cog):
         self.bot = bot
         self.product_await_users: Dict[int, Dict] = {}
         self.owner_username = "sizuka42"
+        self.input_limiter = AutoReplyLimiter("support_input", DEFAULT_INPUT_BUDGETS, "message_limits")
+        self.reply_limiter = AutoReplyLimiter("support")
+    
+    async def cog_load(self):
+        interaction_router.register("order", "paid", self.order_payment_received,
+                                    legacy_ids=("payment_received",), resolver=order_id_from_message)
+        interaction_router.register("order", "processing", self.order_processing,
+                                    legacy_ids=("order_processing",), resolver=order_id_from_message)
+        interaction_router.register("order", "complete", self.order_complete,
+                                    legacy_ids=("mark_complete", "complete_order"), resolver=order_id_from_message)
+        interaction_router.register("ticket", "buy", self.ticket_buy_product,
+                                    legacy_ids=("buy_product",), resolver=ticket_from_channel)
+        interaction_router.register("ticket", "queries", self.ticket_queries,
+                                    legacy_ids=("any_queries",), resolver=ticket_from_channel)
+        interaction_router.register("ticket", "close", self.ticket_close,
+                                    legacy_ids=("close_ticket",), resolver=ticket_from_channel)
+        interaction_router.register("catalog", "pick", self.catalog_pick)
+        interaction_router.register("catalog", "page", self.catalog_page)
+        interaction_router.register("catalog", "back", self.catalog_back)
+    
+    async def cog_unload(self):
+        interaction_router.unregister(self)
+        message_debouncer.cancel_all()
+    
+    async def check_order_staff(self, interaction: discord.Interaction, denied: str) -> bool:
+        if is_owner_user(interaction.user) or interaction.user.guild_permissions.administrator:
+            return True
+        await interaction.response.send_message(denied, ephemeral=True)
+        return False
+    
+    async def advance_timeline(self, interaction: discord.Interaction, order_id: str, stage: int,
+                               title: str, color: int, done: Set[tuple]):
+        if not await self.check_order_staff(interaction, "Only the owner can update order status!"):
+            return
+        
+        view = copy_components(interaction.message, lambda item: interaction_router.action_of(item.custom_id) in done)
+        await interaction.response.edit_message(view=view)
+        
+        embed = TIMELINE_STAGE.fill(stage=title, order_id=order_id, timeline=timeline_display(stage), color=color)
+        await interaction.followup.send(embed=embed)
+    
+    async def order_payment_received(self, interaction: discord.Interaction, args: List[str]):
+        await self.advance_timeline(interaction, args[0], 2, "💰 Payment Received", COMPLETED_COLOR,
+                                    {("order", "paid")})
+    
+    async def order_processing(self, interaction: discord.Interaction, args: List[str]):
+        await self.advance_timeline(interaction, args[0], 3, "⚙️ Order Processing", PROCESSING_COLOR,
+                                    {("order", "paid"), ("order", "processing")})
+    
+    async def order_complete(self, interaction: discord.Interaction, args: List[str]):
+        if not await self.check_order_staff(interaction, "Only the owner can complete orders!"):
+            return
+        
+        order_id = args[0]
+        await interaction.response.defer()
+        
+        try:
+            order = await db_service.update_order_status(
+                order_id,
+                OrderStatus.DELIVERED,
+                staff_id=interaction.user.id
+            )
+        except ValueError as e:
+            await interaction.followup.send(f"Order **{order_id}** was not updated: {e}.", ephemeral=True)
+            return
+        
+        try:
+            await interaction.message.edit(view=copy_components(interaction.message))
+        except:
+            pass
+        
+        customer_name = (order.user.display_name or order.user.username) if order.user else None
+        details = completed_order_fields(order_id, customer_name, order.product_name, order.total_amount or None)
+        hidden_ticket = f"||<#{order.channel_id}>||" if order.channel_id else "||Private||"
+        
+        await interaction.followup.send(embed=ORDER_COMPLETED_TICKET.fill(
+            fields=details, ticket_fields=[field("📋 Ticket", hidden_ticket)]
+        ))
+        
+        settings = await guild_cache.get_settings(interaction.guild.id)
+        if settings.order_channel_id:
+            status_embed = ORDER_DELIVERED_STATUS.fill(fields=details + [
+                field("✍️ Completed By", interaction.user.mention),
+                field("📋 Ticket", hidden_ticket),
+            ])
+            await notification_outbox.enqueue(settings.order_channel_id, order_id, status_embed)
+        
+        try:
+            user = self.bot.get_user(order.user.discord_id)
+            if user:
+                await user.send(embed=ORDER_COMPLETED_DM.fill(order_id=order_id))
+        except:
+            pass
+        
+        try:
+            if interaction.channel:
+                current_name = interaction.channel.name
+                if "-pending" in current_name:
+                    new_name = current_name.replace("-pending", "-complete")
+                    await interaction.channel.edit(name=new_name)
+                elif "pending" in current_name:
+                    new_name = current_name.replace("pending", "complete")
+                    await interaction.channel.edit(name=new_name)
+        except:
+            pass
+    
+    async def check_catalog_user(self, interaction: discord.Interaction, owner_id: Optional[str]):
+        # In a ticket the ticket's customer owns the menu; elsewhere it's the
+        # user id stamped into the custom_id (missing on older buttons).
+        ticket = await db_service.get_ticket(channel_id=interaction.channel_id)
+        if ticket and ticket.user:
+            allowed = ticket.user.discord_id == interaction.user.id
+        else:
+            allowed = owner_id is None or owner_id == str(interaction.user.id)
+        if not allowed:
+            await interaction.response.send_message("This menu is not for you!", ephemeral=True)
+            return False, None
+        return True, ticket
+    
+    async def catalog_pick(self, interaction: discord.Interaction, args: List[str]):
+        allowed, ticket = await self.check_catalog_user(interaction, args[2] if len(args) > 2 else None)
+        if not allowed:
+            return
+        
+        category, key = args[0], args[1]
+        entry = await product_catalog.find(interaction.guild.id, category, key)
+        if not entry:
+            await interaction.response.send_message("That product is no longer available.", ephemeral=True)
+            return
+        
+        await interaction.response.edit_message(view=copy_components(interaction.message))
+        
+        if ticket:
+            extra = ticket.extra_data or {}
+            extra["selected_product"] = entry.name
+            extra["product_price"] = entry.price
+            await db_service.update_ticket_extra_data(ticket.ticket_id, extra)
+        
+        info = category_info(category)
+        embed = TRIGGER_PRODUCT.fill(
+            icon=info["icon"],
+            name=entry.name,
+            fields=[
+                field("💰 Price", f"**${entry.price:g}**"),
+                field("⏳ Permanent", info["warranty"]),
+            ]
+        )
+        
+        settings = await guild_cache.get_settings(interaction.guild.id)
+        view = ProductButtonView(interaction.user.id, interaction.channel_id, entry.as_dict(),
+                                 category == "permanent_triggers", settings.paypal_link or "", self.bot)
+        await interaction.followup.send(embed=embed, view=view)
+    
+    async def catalog_page(self, interaction: discord.Interaction, args: List[str]):
+        allowed, _ = await self.check_catalog_user(interaction, args[2] if len(args) > 2 else None)
+        if not allowed:
+            return
+        
+        embed, view = await product_catalog.render(interaction.guild.id, args[0], interaction.user.id, int(args[1]))
+        await interaction.response.edit_message(embed=embed, view=view)
+    
+    async def catalog_back(self, interaction: discord.Interaction, args: List[str]):
+        allowed, _ = await self.check_catalog_user(interaction, args[0] if args else None)
+        if not allowed:
+            return
+        
+        settings = await guild_cache.get_settings(interaction.guild.id)
+        embed = create_embed(
+            title="🛍️ What would you like to buy?",
+            description="Please select a product category below:",
+            color=Config.EMBED_COLOR
+        )
+        view = ProductCategorySelect(interaction.user.id, interaction.channel_id, settings.paypal_link or "", self.bot)
+        await interaction.response.send_message(embed=embed, view=view)
+    
+    async def check_ticket_owner(self, interaction: discord.Interaction, args: List[str]) -> bool:
+        if len(args) > 1 and interaction.user.id == int(args[1]):
+            return True
+        await interaction.response.send_message("This menu is not for you!", ephemeral=True)
+        return False
+    
+    async def ticket_buy_product(self, interaction: discord.Interaction, args: List[str]):
+        if not await self.check_ticket_owner(interaction, args):
+            return
+        
+        channel_id = int(args[0])
+        await interaction.response.edit_message(view=copy_components(interaction.message))
+        
+        settings = await guild_cache.get_settings(interaction.guild.id)
+        paypal_link = settings.paypal_link or ""
+        
+        embed = create_embed(
+            title="🛍️ What would you like to buy?",
+            description="Please select a product category below:",
+            color=Config.EMBED_COLOR
+        )
+        
+        view = ProductCategorySelect(interaction.user.id, channel_id, paypal_link, self.bot)
+        await interaction.followup.send(embed=embed, view=view)
+        
+        ticket = await db_service.get_ticket(channel_id=channel_id)
+        if ticket:
+            extra = ticket.extra_data or {}
+            extra["flow"] = "buy_product"
+            await db_service.update_ticket_extra_data(ticket.ticket_id, extra)
+    
+    async def ticket_queries(self, interaction: discord.Interaction, args: List[str]):
+        if not await self.check_ticket_owner(interaction, args):
+            return
+        
+        channel_id = int(args[0])
+        await interaction.response.edit_message(view=copy_components(interaction.message))
+        
+        embed = create_embed(
+            title="💬 How can I help you?",
+            description="Please describe your question or concern, and I'll do my best to assist you!\n\nYou can ask about:\n• Product information\n• Order status\n• Payment issues\n• Technical support\n• Anything else!",
+            color=Config.EMBED_COLOR
+        )
+        
+        await interaction.followup.send(embed=embed)
+        
+        ticket = await db_service.get_ticket(channel_id=channel_id)
+        if ticket:
+            extra = ticket.extra_data or {}
+            extra["flow"] = "queries"
+            extra["awaiting_query"] = True
+            await db_service.update_ticket_extra_data(ticket.ticket_id, extra)
+    
+    async def ticket_close(self, interaction: discord.Interaction, args: List[str]):
+        if not await self.check_ticket_owner(interaction, args):
+            return
+        
+        ticket = await db_service.get_ticket(channel_id=int(args[0]))
+        
+        if not ticket:
+            await interaction.response.send_message("This is not a ticket channel.", ephemeral=True)
+            return
+        
+        await interaction.response.defer()
+        
+        await db_service.update_ticket_status(ticket.ticket_id, TicketStatus.CLOSED)
+        
+        embed = create_embed(
+            title="🔒 Ticket Closed",
+            description=f"This ticket has been closed by {interaction.user.mention}\n\n**Thank you for using BM Creations Market!**",
+            color=Config.WARNING_COLOR
+        )
+        embed.add_field(name="Ticket ID", value=ticket.ticket_id, inline=True)
+        embed.add_field(name="Closed At", value=format_timestamp(get_eastern_time()), inline=True)
+        
+        await interaction.followup.send(embed=embed)
+        
+        await interaction.channel.send("This channel will be deleted in 10 seconds...")
+        transcript_archiver.archive(interaction.channel, ticket, delete_after=10, reason="Ticket closed by user")
     
     def is_owner(self, member: discord.Member) -> bool:
         username_lower = member.name.lower()
@@ -957,11 +688,11 @@ class SupportInteractionCog(commands.Cog):
         return False
     
     async def search_product_by_name(self, guild_id: int, product_name: str):
-        products = await db_service.search_products(guild_id, product_name)
+        products = await guild_cache.search_products(guild_id, product_name)
         if products:
             return products[0]
         
-        all_products = await db_service.get_all_products(guild_id)
+        all_products = await guild_cache.get_products(guild_id)
         product_name_lower = product_name.lower()
         
         for product in all_products:
@@ -970,14 +701,15 @@ class SupportInteractionCog(commands.Cog):
         
         return None
     
+    @instrument("support_interaction.generate_smart_response")
     async def generate_smart_response(self, message: str, guild_id: int) -> Optional[str]:
         message_lower = message.lower()
         
-        faqs = await db_service.search_faqs(guild_id, message)
+        faqs = await guild_cache.search_faq(guild_id, message)
         if faqs:
             return faqs[0].answer
         
-        products = await db_service.search_products(guild_id, message)
+        products = await guild_cache.search_products(guild_id, message)
         if products:
             product = products[0]
             price_text = f"${product.price:.2f}" if product.price else "Contact for price"
@@ -1067,9 +799,14 @@ class SupportInteractionCog(commands.Cog):
         
         await asyncio.sleep(1)
         
+        if not db_service.is_ready:
+            return
+        
+        await self.create_thread_ticket(thread)
+    
+    @instrument("support_interaction.create_thread_ticket", "listener")
+    async def create_thread_ticket(self, thread: discord.Thread):
         try:
-            await db_service.ensure_initialized()
-            
             owner = thread.owner
             if not owner:
                 try:
@@ -1080,7 +817,7 @@ class SupportInteractionCog(commands.Cog):
             if owner.bot:
                 return
             
-            settings = await db_service.get_or_create_guild_settings(thread.guild.id)
+            settings = await guild_cache.get_settings(thread.guild.id)
             
             if self.is_founder_or_admin(owner, settings):
                 return
@@ -1110,7 +847,7 @@ class SupportInteractionCog(commands.Cog):
             embed.add_field(name="❓ Any Queries", value="Ask questions or get support", inline=True)
             embed.set_footer(text="BM Creations Support | Staff will be with you soon!")
             
-            view = TicketWelcomeView(owner.id, self.bot, thread.id)
+            view = TicketWelcomeView(owner.id, thread.id)
             await thread.send(embed=embed, view=view)
             
             print(f"Auto-ticket created for thread: {thread.name} by {owner}")
@@ -1119,13 +856,15 @@ class SupportInteractionCog(commands.Cog):
             print(f"Error creating auto-ticket for thread: {e}")
     
     @commands.Cog.listener()
+    @instrument("support_interaction.on_message", "listener")
     async def on_message(self, message: discord.Message):
         if message.author.bot or not message.guild:
             return
         
-        await db_service.ensure_initialized()
+        if not db_service.is_ready:
+            return
         
-        settings = await db_service.get_or_create_guild_settings(message.guild.id)
+        settings = await guild_cache.get_settings(message.guild.id)
         
         if self.is_in_ignored_category(message.channel):
             return
@@ -1138,7 +877,14 @@ class SupportInteractionCog(commands.Cog):
             else:
                 del suppressed_channels[message.channel.id]
         
-        if self.is_founder_or_admin(message.author, settings):
+        is_staff_member = self.is_founder_or_admin(message.author, settings)
+        # Spam is dropped here, before the ticket lookup; ticket input gets
+        # this looser budget, replies are charged again in may_reply.
+        if not is_staff_member and not self.input_limiter.allow(message, settings):
+            return
+        
+        if is_staff_member:
+            message_debouncer.cancel_channel(message.channel.id)
             ticket = await db_service.get_ticket(channel_id=message.channel.id)
             if ticket:
                 suppressed_channels[message.channel.id] = datetime.now()
@@ -1180,6 +926,7 @@ class SupportInteractionCog(commands.Cog):
                 await self.handle_purchase_intent_message(message, settings)
             return
     
+    @instrument("support_interaction.handle_ticket_message")
     async def handle_ticket_message(self, message: discord.Message, ticket, settings):
         extra = ticket.extra_data or {}
         
@@ -1192,7 +939,7 @@ class SupportInteractionCog(commands.Cog):
                 extra["awaiting_product_name"] = False
                 extra["selected_product"] = product.name
             else:
-                similar = await db_service.search_products(message.guild.id, product_name)
+                similar = await guild_cache.search_products(message.guild.id, product_name)
                 
                 embed = create_embed(
                     title="🔍 Product Not Found",
@@ -1213,23 +960,7 @@ class SupportInteractionCog(commands.Cog):
             return
         
         if extra.get("awaiting_query") or extra.get("thread_ticket") or extra.get("auto_created"):
-            response = await self.generate_smart_response(message.content, message.guild.id)
-            
-            if response:
-                embed = create_embed(
-                    title="💡 Here's what I found",
-                    description=response,
-                    color=Config.EMBED_COLOR
-                )
-                embed.set_footer(text="Staff will be with you shortly!")
-                await message.channel.send(embed=embed)
-            else:
-                embed = create_embed(
-                    title="📝 Got it!",
-                    description="I've noted your message. A staff member will respond shortly!\n\nFeel free to add more details.",
-                    color=Config.EMBED_COLOR
-                )
-                await message.channel.send(embed=embed)
+            await message_debouncer.submit(message, self.answer_ticket_messages)
             return
         
         if extra.get("awaiting_payment_proof"):
@@ -1240,87 +971,65 @@ class SupportInteractionCog(commands.Cog):
                 customer_imvu = extra.get('customer_imvu', '')
                 order_id = await db_service.generate_unique_bm_order_id()
                 
-                user = await db_service.get_or_create_user(
-                    discord_id=message.author.id,
+                extra["payment_proof_received"] = True
+                extra["order_id"] = order_id
+                await order_placement.place_order(
                     guild_id=message.guild.id,
+                    discord_id=message.author.id,
                     username=str(message.author),
-                    display_name=message.author.display_name
-                )
-                
-                order = await db_service.create_order(
-                    guild_id=message.guild.id,
-                    user_id=user.id,
-                    ticket_id=ticket.id if ticket else None,
-                    order_id=order_id,
+                    display_name=message.author.display_name,
+                    ticket=ticket,
                     channel_id=message.channel.id,
+                    order_id=order_id,
                     items=[{"name": product_name, "quantity": 1, "price": float(product_price) if product_price else 0.0}],
-                    notes=f"Product: {product_name} | IMVU: {customer_imvu}"
+                    notes=f"Product: {product_name} | IMVU: {customer_imvu}",
+                    product_name=product_name,
+                    customer_imvu=customer_imvu or None,
+                    ticket_extra=extra
                 )
                 
                 blurred_customer = blur_name(message.author.display_name)
                 warranty = "Permanent" if is_permanent else "6 Months"
                 
-                timeline_display = "✅ **Order Confirmed** ← Current\n⏳ Payment Received\n⏳ Order Processing\n⏳ Completed"
                 
-                order_embed = discord.Embed(
-                    title="🎫 𝐍𝐞𝐰 𝐎𝐫𝐝𝐞𝐫 𝐂𝐫𝐞𝐚𝐭𝐞𝐝",
-                    description=f"A new order has been placed!",
-                    color=Config.EMBED_COLOR
-                )
+                created_at = format_timestamp(get_eastern_time())
+                image_url = message.attachments[0].url if message.attachments else None
                 
-                order_embed.add_field(name="🆔 Order ID", value=f"**{order_id}**", inline=True)
-                order_embed.add_field(name="👤 Customer", value=f"||{blurred_customer}||", inline=True)
-                order_embed.add_field(name="📍 Ticket", value=f"||<#{message.channel.id}>||", inline=True)
-                order_embed.add_field(name="🛍️ Product", value=product_name, inline=True)
+                order_fields = [
+                    field("🆔 Order ID", f"**{order_id}**"),
+                    field("👤 Customer", f"||{blurred_customer}||"),
+                    field("📍 Ticket", f"||<#{message.channel.id}>||"),
+                    field("🛍️ Product", product_name),
+                ]
                 if product_price:
-                    order_embed.add_field(name="💰 Price", value=f"${product_price}", inline=True)
-                order_embed.add_field(name="⏳ Warranty", value=warranty, inline=True)
-                if customer_imvu:
-                    order_embed.add_field(name="🎮 IMVU", value=customer_imvu, inline=True)
-                order_embed.add_field(name="🕐 Created At", value=format_timestamp(get_eastern_time()), inline=True)
-                order_embed.add_field(name="📦 Status", value="🟡 **ORDER CONFIRMED**", inline=True)
-                order_embed.add_field(name="📊 Timeline", value=timeline_display, inline=False)
-                order_embed.set_footer(text="BM Creations Support • Trusted since 2020")
+                    order_fields.append(field("💰 Price", f"${product_price}"))
+                order_fields.append(field("⏳ Warranty", warranty))
                 
-                if message.attachments:
-                    order_embed.set_image(url=message.attachments[0].url)
+                ticket_fields = list(order_fields)
+                if customer_imvu:
+                    ticket_fields.append(field("🎮 IMVU", customer_imvu))
+                ticket_fields.append(field("🕐 Created At", created_at))
+                ticket_fields.append(field("📦 Status", "🟡 **ORDER CONFIRMED**"))
+                ticket_fields.append(field("📊 Timeline", timeline_display(1), inline=False))
+                order_embed = ORDER_CREATED.fill(fields=ticket_fields, image_url=image_url)
                 
-                view = OrderTimelineView(
-                    order_id, 
-                    self.bot, 
-                    customer_name=message.author.display_name,
-                    product_name=product_name,
-                    product_price=product_price,
-                    ticket_channel_id=message.channel.id
-                )
-                order_msg = await message.channel.send(embed=order_embed, view=view)
+                view = OrderTimelineView(order_id)
+                sends = [message.channel.send(embed=order_embed, view=view)]
                 
-                settings = await db_service.get_or_create_guild_settings(message.guild.id)
                 if settings.order_channel_id:
-                    order_channel = self.bot.get_channel(settings.order_channel_id)
-                    if order_channel:
-                        status_embed = discord.Embed(
-                            title="🎫 𝐍𝐞𝐰 𝐎𝐫𝐝𝐞𝐫 𝐑𝐞𝐜𝐞𝐢𝐯𝐞𝐝",
-                            description=f"Order **{order_id}** has been created!",
-                            color=Config.EMBED_COLOR
-                        )
-                        status_embed.add_field(name="🆔 Order ID", value=f"**{order_id}**", inline=True)
-                        status_embed.add_field(name="👤 Customer", value=f"||{blurred_customer}||", inline=True)
-                        status_embed.add_field(name="📍 Ticket", value=f"||<#{message.channel.id}>||", inline=True)
-                        status_embed.add_field(name="🛍️ Product", value=product_name, inline=True)
-                        if product_price:
-                            status_embed.add_field(name="💰 Price", value=f"${product_price}", inline=True)
-                        status_embed.add_field(name="⏳ Warranty", value=warranty, inline=True)
-                        status_embed.add_field(name="🕐 Time", value=format_timestamp(get_eastern_time()), inline=True)
-                        status_embed.add_field(name="📦 Status", value="🟡 **ORDER CONFIRMED**", inline=True)
-                        if message.attachments:
-                            status_embed.set_image(url=message.attachments[0].url)
-                        status_embed.set_footer(text="BM Creations Support • Trusted since 2020")
-                        await order_channel.send(embed=status_embed)
+                    status_embed = ORDER_RECEIVED_STATUS.fill(
+                        order_id=order_id,
+                        fields=order_fields + [
+                            field("🕐 Time", created_at),
+                            field("📦 Status", "🟡 **ORDER CONFIRMED**"),
+                        ],
+                        image_url=image_url
+                    )
+                    sends.append(notification_outbox.enqueue(settings.order_channel_id, order_id, status_embed))
                 
-                extra["payment_proof_received"] = True
-                extra["order_id"] = order_id
-                await db_service.update_ticket_extra_data(ticket.ticket_id, extra)
+                for result in await asyncio.gather(*sends, return_exceptions=True):
+                    if isinstance(result, Exception):
+                        print(f"Failed to post order {order_id}: {result}")
             else:
                 imvu_keywords = ["imvu", "username", "@", "my name", "deliver to"]
                 message_lower = message.content.lower()
@@ -1342,8 +1051,47 @@ class SupportInteractionCog(commands.Cog):
                 await message.channel.send(embed=embed)
             return
     
+    async def may_reply(self, message: discord.Message) -> bool:
+        # Charged per reply, after debouncing, so merged messages cost one
+        # token and ticket flow input is never dropped.
+        settings = await guild_cache.get_settings(message.guild.id)
+        return self.reply_limiter.allow(message, settings)
+    
+    @instrument("support_interaction.answer_ticket_messages")
+    async def answer_ticket_messages(self, messages: List[discord.Message]):
+        message = messages[-1]
+        if not await self.may_reply(message):
+            return
+        text = "\n".join(m.content for m in messages)
+        response = await self.generate_smart_response(text, message.guild.id)
+        
+        if response:
+            embed = create_embed(
+                title="💡 Here's what I found",
+                description=response,
+                color=Config.EMBED_COLOR
+            )
+            embed.set_footer(text="Staff will be with you shortly!")
+            await message.channel.send(embed=embed)
+        else:
+            embed = create_embed(
+                title="📝 Got it!",
+                description="I've noted your message. A staff member will respond shortly!\n\nFeel free to add more details.",
+                color=Config.EMBED_COLOR
+            )
+            await message.channel.send(embed=embed)
+    
+    @instrument("support_interaction.handle_support_desk_message")
     async def handle_support_desk_message(self, message: discord.Message, settings):
-        response = await self.generate_smart_response(message.content, message.guild.id)
+        await message_debouncer.submit(message, self.answer_support_desk_messages)
+    
+    @instrument("support_interaction.answer_support_desk_messages")
+    async def answer_support_desk_messages(self, messages: List[discord.Message]):
+        message = messages[-1]
+        if not await self.may_reply(message):
+            return
+        text = "\n".join(m.content for m in messages)
+        response = await self.generate_smart_response(text, message.guild.id)
         
         if response:
             embed = create_embed(
@@ -1361,7 +1109,11 @@ class SupportInteractionCog(commands.Cog):
             )
             await message.reply(embed=embed, mention_author=False)
     
+    @instrument("support_interaction.handle_products_channel_message")
     async def handle_products_channel_message(self, message: discord.Message, settings):
+        if not self.reply_limiter.allow(message, settings):
+            return
+        
         ticket = await self.create_ticket_for_user(message.channel, message.author, "Product Inquiry")
         
         if ticket:
@@ -1370,7 +1122,7 @@ class SupportInteractionCog(commands.Cog):
                 description=f"Hello {message.author.mention}! I see you're interested in our products.\n\n**Staff is coming to help you shortly!**\n\nUntil then, tell me what you're looking for and I'll try to help!",
                 color=Config.EMBED_COLOR
             )
-            view = TicketWelcomeView(message.author.id, self.bot, message.channel.id)
+            view = TicketWelcomeView(message.author.id, message.channel.id)
             await message.reply(embed=embed, view=view, mention_author=False)
         else:
             response = await self.generate_smart_response(message.content, message.guild.id)
@@ -1382,7 +1134,11 @@ class SupportInteractionCog(commands.Cog):
                 )
                 await message.reply(embed=embed, mention_author=False)
     
+    @instrument("support_interaction.handle_purchase_intent_message")
     async def handle_purchase_intent_message(self, message: discord.Message, settings):
+        if not self.reply_limiter.allow(message, settings):
+            return
+        
         response = await self.generate_smart_response(message.content, message.guild.id)
         
         if response:
@@ -1425,7 +1181,7 @@ class SupportInteractionCog(commands.Cog):
             inline=False
         )
         
-        embed.set_footer(text="BM Creations Market | Trusted Since 2020")
+        embed.set_footer(text=MARKET_FOOTER)
         
         view = PaymentButtonsView(user.id, product.name, paypal_link)
         await channel.send(embed=embed, view=view)
@@ -1441,7 +1197,7 @@ class SupportInteractionCog(commands.Cog):
         embed.add_field(name="❓ Any Queries", value="Ask questions or get support", inline=True)
         embed.set_footer(text="BM Creations Support | We're here to help!")
         
-        view = TicketWelcomeView(user.id, self.bot, channel.id)
+        view = TicketWelcomeView(user.id, channel.id)
         await channel.send(embed=embed, view=view)
     
     @app_commands.command(name="setsupportchannel", description="Set the support desk channel (Admin)")
@@ -1522,8 +1278,8 @@ class SupportInteractionCog(commands.Cog):
     @app_commands.describe(role="The Founder role - bot stops responding when they message")
     @app_commands.default_permissions(administrator=True)
     async def set_founder_role(self, interaction: discord.Interaction, role: discord.Role):
-        settings = await db_service.get_or_create_guild_settings(interaction.guild.id)
-        founder_roles = settings.founder_role_ids or []
+        settings = await guild_cache.get_settings(interaction.guild.id)
+        founder_roles = list(settings.founder_role_ids or [])
         
         if role.id not in founder_roles:
             founder_roles.append(role.id)
@@ -1545,8 +1301,8 @@ class SupportInteractionCog(commands.Cog):
     @app_commands.describe(role="The Admin role - bot stops responding when they message")
     @app_commands.default_permissions(administrator=True)
     async def set_admin_role(self, interaction: discord.Interaction, role: discord.Role):
-        settings = await db_service.get_or_create_guild_settings(interaction.guild.id)
-        admin_roles = settings.admin_role_ids or []
+        settings = await guild_cache.get_settings(interaction.guild.id)
+        admin_roles = list(settings.admin_role_ids or [])
         
         if role.id not in admin_roles:
             admin_roles.append(role.id)
@@ -1591,7 +1347,7 @@ class SupportInteractionCog(commands.Cog):
     @app_commands.command(name="supportstatus", description="View support system configuration (Admin)")
     @app_commands.default_permissions(administrator=True)
     async def support_status(self, interaction: discord.Interaction):
-        settings = await db_service.get_or_create_guild_settings(interaction.guild.id)
+        settings = await guild_cache.get_settings(interaction.guild.id)
         
         embed = create_embed(
             title="⚙️ Support System Status",
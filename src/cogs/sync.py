@@ -4,6 +4,7 @@ from discord import app_commands
 import re
 
 from src.services.database import db_service
+from src.services.cache import guild_cache
 from src.utils.helpers import create_embed, is_staff
 from src.config import Config
 
@@ -349,7 +350,7 @@ class SyncCog(commands.Cog):
     
     @app_commands.command(name="listproducts", description="View all synced products")
     async def list_products(self, interaction: discord.Interaction):
-        products = await db_service.get_all_products(interaction.guild.id)
+        products = await guild_cache.get_products(interaction.guild.id)
         
         if not products:
             await interaction.response.send_message("No products synced yet. Use `/syncall` to sync products from your channels.", ephemeral=True)
@@ -378,14 +379,7 @@ class SyncCog(commands.Cog):
     async def clear_products(self, interaction: discord.Interaction):
         await interaction.response.defer(ephemeral=True)
         
-        async with db_service.session_factory() as session:
-            from sqlalchemy import delete
-            from src.models.database import Product
-            
-            result = await session.execute(
-                delete(Product).where(Product.guild_id == interaction.guild.id)
-            )
-            await session.commit()
+        await db_service.clear_products(interaction.guild.id)
         
         embed = create_embed(
             title="🗑️ Products Cleared",
@@ -430,7 +424,7 @@ class SyncCog(commands.Cog):
     async def server_stats(self, interaction: discord.Interaction):
         guild = interaction.guild
         settings = await db_service.get_or_create_guild_settings(guild.id)
-        products = await db_service.get_all_products(guild.id)
+        products = await guild_cache.get_products(guild.id)
         
         embed = create_embed(
             title=f"ℹ️ {guild.name}",
@@ -1,30 +1,378 @@
 import discord
-from discord.ext import commands
+from discord.ext import commands, tasks
 from discord import app_commands
-from datetime import datetime
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Set
+import asyncio
 import pytz
+import secrets
 
 from src.services.database import db_service
+from src.services.cache import guild_cache
+from src.services.metrics import metrics
+from src.services.transcripts import transcript_archiver
 from src.models.database import TicketStatus
 from src.utils.helpers import create_embed, is_staff, get_eastern_time, format_timestamp, get_status_emoji
 from src.utils.translations import get_text
+from src.utils.embeds import field, TICKET_OPENED
 from src.config import Config
 
 OWNER_USERNAME = "sizuka42"
 MAX_TICKETS_PER_USER = 2
+STAFF_ROLE_NAMES = ["staff", "moderator", "admin", "support", "founder"]
+POOL_CHANNEL_PREFIX = "ticket-pool-"
+
+class TicketProfile:
+    # What a guild's ticket channels are provisioned with, resolved once so
+    # /newticket doesn't walk every member and role. Stored as ids and
+    # looked up per ticket; the cog drops the profile on role, member and
+    # channel events that could change it.
+    def __init__(self, category_id: int, settings_category_id: Optional[int], staff_role_ids: List[int], owner_id: Optional[int]):
+        self.category_id = category_id
+        self.settings_category_id = settings_category_id
+        self.staff_role_ids = staff_role_ids
+        self.owner_id = owner_id
+    
+    def owner(self, guild: discord.Guild) -> Optional[discord.Member]:
+        return guild.get_member(self.owner_id) if self.owner_id else None
+    
+    def overwrites(self, guild: discord.Guild, user: discord.abc.User) -> dict:
+        overwrites = {
+            guild.default_role: discord.PermissionOverwrite(read_messages=False),
+            user: discord.PermissionOverwrite(read_messages=True, send_messages=True),
+            guild.me: discord.PermissionOverwrite(read_messages=True, send_messages=True, manage_channels=True)
+        }
+        
+        owner = self.owner(guild)
+        if owner:
+            overwrites[owner] = discord.PermissionOverwrite(read_messages=True, send_messages=True, manage_messages=True)
+        
+        for role_id in self.staff_role_ids:
+            role = guild.get_role(role_id)
+            if role:
+                overwrites[role] = discord.PermissionOverwrite(read_messages=True, send_messages=True)
+        return overwrites
+
+class TicketChannelPool:
+    # Hidden, pre-created ticket channels (TICKET_POOL_SIZE per guild) so
+    # /newticket only has to rename one and set its overwrites. Pool
+    # channels are found again by name after a restart.
+    def __init__(self, size: int):
+        self.size = size
+        self.channels: Dict[int, List[int]] = {}
+        self.refilling: Set[int] = set()
+        self.tasks: Set[asyncio.Task] = set()
+        metrics.register_gauge("bm_ticket_pool_channels", "Pre-created ticket channels ready to claim",
+                               lambda: sum(len(ids) for ids in self.channels.values()))
+    
+    @property
+    def enabled(self) -> bool:
+        return self.size > 0
+    
+    def claim(self, guild: discord.Guild) -> Optional[discord.TextChannel]:
+        ids = self.channels.get(guild.id, [])
+        while ids:
+            channel = guild.get_channel(ids.pop(0))
+            if channel:
+                metrics.inc("bm_ticket_pool_claims_total", help_text="Ticket channel pool claims", result="hit")
+                return channel
+        metrics.inc("bm_ticket_pool_claims_total", help_text="Ticket channel pool claims", result="miss")
+        return None
+    
+    def adopt(self, guild: discord.Guild, category: Optional[discord.CategoryChannel]) -> List[int]:
+        ids = self.channels.setdefault(guild.id, [])
+        if category:
+            for channel in category.text_channels:
+                if channel.name.startswith(POOL_CHANNEL_PREFIX) and channel.id not in ids:
+                    ids.append(channel.id)
+        return ids
+    
+    def schedule_refill(self, guild: discord.Guild, profile: TicketProfile):
+        task = asyncio.create_task(self.refill(guild, profile))
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+    
+    async def refill(self, guild: discord.Guild, profile: TicketProfile):
+        if guild.id in self.refilling:
+            return
+        self.refilling.add(guild.id)
+        try:
+            category = guild.get_channel(profile.category_id)
+            if guild.id in self.channels:
+                ids = [channel_id for channel_id in self.channels[guild.id] if guild.get_channel(channel_id)]
+                self.channels[guild.id] = ids
+            else:
+                ids = self.adopt(guild, category)
+            
+            overwrites = {
+                guild.default_role: discord.PermissionOverwrite(read_messages=False),
+                guild.me: discord.PermissionOverwrite(read_messages=True, send_messages=True, manage_channels=True)
+            }
+            while len(ids) < self.size:
+                channel = await guild.create_text_channel(
+                    name=f"{POOL_CHANNEL_PREFIX}{secrets.token_hex(3)}",
+                    category=category,
+                    overwrites=overwrites,
+                    reason="Pre-created for the ticket system"
+                )
+                ids.append(channel.id)
+        except Exception as e:
+            print(f"Error refilling ticket channel pool for {guild.id}: {e}")
+        finally:
+            self.refilling.discard(guild.id)
 
 class TicketsCog(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+        self.profiles: Dict[int, TicketProfile] = {}
+        self.pool = TicketChannelPool(Config.TICKET_POOL_SIZE)
+        if self.pool.enabled:
+            self.refill_pools.start()
+        self.sweep_stale_tickets.start()
+    
+    def cog_unload(self):
+        self.refill_pools.cancel()
+        self.sweep_stale_tickets.cancel()
+    
+    @tasks.loop(minutes=Config.STALE_TICKET_SWEEP_MINUTES)
+    async def sweep_stale_tickets(self):
+        try:
+            await self.sweep()
+        except Exception as e:
+            print(f"Error sweeping stale tickets: {e}")
+    
+    @sweep_stale_tickets.before_loop
+    async def before_sweep_stale_tickets(self):
+        await self.bot.wait_until_ready()
+        await db_service.wait_until_ready()
+    
+    async def sweep(self):
+        cutoff = datetime.utcnow() - timedelta(hours=Config.STALE_TICKET_HOURS)
+        tickets = await db_service.get_stale_tickets(cutoff, Config.STALE_TICKET_BATCH_SIZE)
+        if not tickets:
+            return
+        
+        resolved, closed, touched = [], [], []
+        threads: Dict[int, discord.Thread] = {}
+        kept: Set[int] = set()
+        for ticket in tickets:
+            guild = self.bot.get_guild(ticket.guild_id)
+            channel = guild.get_channel_or_thread(ticket.channel_id) if guild else None
+            
+            if channel is None and guild:
+                # Archived threads drop out of the cache, so only a failed
+                # fetch means the channel is really gone.
+                try:
+                    channel = await guild.fetch_channel(ticket.channel_id)
+                except discord.NotFound:
+                    pass
+                except discord.HTTPException as e:
+                    print(f"Error fetching ticket channel {ticket.channel_id}: {e}")
+                    continue
+            
+            if channel is None:
+                closed.append(ticket.id)
+                continue
+            
+            # updated_at only moves on ticket writes; the channel's last
+            # message is the real activity signal and costs no API call.
+            if channel.last_message_id and discord.utils.snowflake_time(channel.last_message_id).replace(tzinfo=None) >= cutoff:
+                touched.append(ticket.id)
+                continue
+            
+            if isinstance(channel, discord.Thread):
+                threads[ticket.id] = channel
+                resolved.append(ticket.id)
+            elif (ticket.extra_data or {}).get("auto_created"):
+                resolved.append(ticket.id)
+            else:
+                # Dedicated /newticket channels are left for staff to close;
+                # touching them keeps them from filling every sweep.
+                touched.append(ticket.id)
+                kept.add(ticket.id)
+        
+        # The updates re-check status and updated_at, so tickets that changed
+        # since they were read are skipped and only real changes are counted.
+        resolved = await db_service.bulk_update_ticket_status(resolved, TicketStatus.RESOLVED, cutoff)
+        closed = await db_service.bulk_update_ticket_status(closed, TicketStatus.CLOSED, cutoff)
+        touched = await db_service.touch_tickets(touched, cutoff)
+        
+        guild_of = {ticket.id: ticket.guild_id for ticket in tickets}
+        summary: Dict[int, Dict[str, int]] = {}
+        def counts_for(ticket_id: int) -> Dict[str, int]:
+            return summary.setdefault(guild_of[ticket_id], {"resolved": 0, "closed": 0, "archived": 0, "kept": 0})
+        for ticket_id in resolved:
+            counts_for(ticket_id)["resolved"] += 1
+        for ticket_id in closed:
+            counts_for(ticket_id)["closed"] += 1
+        for ticket_id in touched:
+            if ticket_id in kept:
+                counts_for(ticket_id)["kept"] += 1
+        
+        archived = 0
+        for ticket_id in resolved:
+            thread = threads.get(ticket_id)
+            if thread is None:
+                continue
+            try:
+                if not thread.archived:
+                    await thread.edit(archived=True, reason="Inactive ticket")
+                counts_for(ticket_id)["archived"] += 1
+                archived += 1
+            except discord.HTTPException as e:
+                print(f"Error archiving ticket thread {thread.id}: {e}")
+        
+        metrics.inc("bm_stale_tickets_total", len(resolved), help_text="Tickets swept for inactivity", status="resolved")
+        metrics.inc("bm_stale_tickets_total", len(closed), help_text="Tickets swept for inactivity", status="closed")
+        print(f"Stale ticket sweep: {len(resolved)} resolved, {len(closed)} closed, {archived} threads archived")
+        
+        for guild_id, counts in summary.items():
+            if counts["resolved"] or counts["closed"] or counts["kept"]:
+                await self.send_sweep_summary(guild_id, counts)
+    
+    async def send_sweep_summary(self, guild_id: int, counts: Dict[str, int]):
+        settings = await guild_cache.get_settings(guild_id)
+        log_channel = self.bot.get_channel(settings.log_channel_id) if settings.log_channel_id else None
+        if not log_channel:
+            return
+        
+        embed = create_embed(
+            title="🧹 Inactive Tickets Swept",
+            description=f"Tickets with no activity for {Config.STALE_TICKET_HOURS:g} hours.",
+            color=Config.EMBED_COLOR
+        )
+        embed.add_field(name="Resolved", value=str(counts["resolved"]), inline=True)
+        embed.add_field(name="Closed (channel gone)", value=str(counts["closed"]), inline=True)
+        embed.add_field(name="Threads Archived", value=str(counts["archived"]), inline=True)
+        if counts["kept"]:
+            embed.add_field(name="Ticket Channels Awaiting Staff", value=str(counts["kept"]), inline=True)
+        try:
+            await log_channel.send(embed=embed)
+        except discord.HTTPException:
+            pass
     
-    async def get_owner_member(self, guild: discord.Guild) -> discord.Member:
+    @tasks.loop(minutes=5)
+    async def refill_pools(self):
+        for guild in self.bot.guilds:
+            try:
+                profile = await self.get_profile(guild)
+                await self.pool.refill(guild, profile)
+            except Exception as e:
+                print(f"Error preparing ticket pool for {guild.id}: {e}")
+    
+    @refill_pools.before_loop
+    async def before_refill_pools(self):
+        await self.bot.wait_until_ready()
+        await db_service.wait_until_ready()
+    
+    async def open_ticket_channel(self, guild: discord.Guild, profile: TicketProfile, user: discord.abc.User, name: str) -> discord.TextChannel:
+        category = guild.get_channel(profile.category_id)
+        overwrites = profile.overwrites(guild, user)
+        reason = f"Ticket created by {user}"
+        
+        channel = self.pool.claim(guild) if self.pool.enabled else None
+        if channel:
+            changes = {"name": name, "overwrites": overwrites}
+            if category and channel.category_id != category.id:
+                changes["category"] = category
+            try:
+                # One PATCH: name, parent and overwrites together.
+                await channel.edit(reason=reason, **changes)
+            except discord.HTTPException as e:
+                print(f"Error claiming pooled ticket channel {channel.id}: {e}")
+                channel = None
+        
+        if self.pool.enabled:
+            self.pool.schedule_refill(guild, profile)
+        
+        if channel:
+            return channel
+        return await guild.create_text_channel(
+            name=name,
+            category=category,
+            overwrites=overwrites,
+            reason=reason
+        )
+    
+    def find_owner_member(self, guild: discord.Guild) -> Optional[discord.Member]:
         for member in guild.members:
             if member.name.lower() == OWNER_USERNAME:
                 return member
         return None
     
+    async def get_profile(self, guild: discord.Guild) -> TicketProfile:
+        settings = await guild_cache.get_settings(guild.id)
+        profile = self.profiles.get(guild.id)
+        if (profile and profile.settings_category_id == settings.ticket_category_id
+                and guild.get_channel(profile.category_id)):
+            return profile
+        
+        category = await self.get_ticket_category(guild)
+        owner = self.find_owner_member(guild)
+        profile = TicketProfile(
+            category_id=category.id,
+            settings_category_id=settings.ticket_category_id,
+            staff_role_ids=[role.id for role in guild.roles if role.name.lower() in STAFF_ROLE_NAMES],
+            owner_id=owner.id if owner else None
+        )
+        self.profiles[guild.id] = profile
+        return profile
+    
+    def invalidate_profile(self, guild_id: int):
+        self.profiles.pop(guild_id, None)
+    
+    def is_owner_change(self, guild_id: int, member: discord.abc.User) -> bool:
+        profile = self.profiles.get(guild_id)
+        return member.name.lower() == OWNER_USERNAME or (profile is not None and profile.owner_id == member.id)
+    
+    @commands.Cog.listener()
+    async def on_guild_role_create(self, role: discord.Role):
+        self.invalidate_profile(role.guild.id)
+    
+    @commands.Cog.listener()
+    async def on_guild_role_update(self, before: discord.Role, after: discord.Role):
+        if before.name != after.name:
+            self.invalidate_profile(after.guild.id)
+    
+    @commands.Cog.listener()
+    async def on_guild_role_delete(self, role: discord.Role):
+        self.invalidate_profile(role.guild.id)
+    
+    @commands.Cog.listener()
+    async def on_member_join(self, member: discord.Member):
+        if self.is_owner_change(member.guild.id, member):
+            self.invalidate_profile(member.guild.id)
+    
+    @commands.Cog.listener()
+    async def on_member_remove(self, member: discord.Member):
+        if self.is_owner_change(member.guild.id, member):
+            self.invalidate_profile(member.guild.id)
+    
+    @commands.Cog.listener()
+    async def on_user_update(self, before: discord.User, after: discord.User):
+        if before.name == after.name:
+            return
+        for guild_id in list(self.profiles):
+            if self.is_owner_change(guild_id, before) or self.is_owner_change(guild_id, after):
+                self.invalidate_profile(guild_id)
+    
+    @commands.Cog.listener()
+    async def on_guild_channel_create(self, channel: discord.abc.GuildChannel):
+        if isinstance(channel, discord.CategoryChannel):
+            self.invalidate_profile(channel.guild.id)
+    
+    @commands.Cog.listener()
+    async def on_guild_channel_update(self, before: discord.abc.GuildChannel, after: discord.abc.GuildChannel):
+        if isinstance(after, discord.CategoryChannel) and before.name != after.name:
+            self.invalidate_profile(after.guild.id)
+    
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel):
+        if isinstance(channel, discord.CategoryChannel):
+            self.invalidate_profile(channel.guild.id)
+    
     async def get_ticket_category(self, guild: discord.Guild) -> discord.CategoryChannel:
-        settings = await db_service.get_or_create_guild_settings(guild.id)
+        settings = await guild_cache.get_settings(guild.id)
         
         if settings.ticket_category_id:
             category = guild.get_channel(settings.ticket_category_id)
@@ -42,14 +390,6 @@ class TicketsCog(commands.Cog):
         await db_service.update_guild_settings(guild.id, ticket_category_id=category.id)
         return category
     
-    async def count_user_open_tickets(self, user_id: int, guild_id: int) -> int:
-        tickets = await db_service.get_user_tickets(user_id, guild_id)
-        if not tickets:
-            return 0
-        open_statuses = [TicketStatus.OPEN, TicketStatus.IN_PROGRESS, TicketStatus.PENDING]
-        open_tickets = [t for t in tickets if t.status in open_statuses]
-        return len(open_tickets)
-    
     @app_commands.command(name="newticket", description="Create a new support ticket")
     @app_commands.describe(subject="The subject/reason for your ticket")
     async def new_ticket(self, interaction: discord.Interaction, subject: str = "General Support"):
@@ -60,7 +400,7 @@ class TicketsCog(commands.Cog):
         )
         lang = user.language
         
-        open_ticket_count = await self.count_user_open_tickets(user.id, interaction.guild.id)
+        open_ticket_count = await db_service.count_open_tickets(user.id, interaction.guild.id)
         
         if open_ticket_count >= MAX_TICKETS_PER_USER:
             embed = create_embed(
@@ -71,29 +411,12 @@ class TicketsCog(commands.Cog):
             await interaction.followup.send(embed=embed, ephemeral=True)
             return
         
-        category = await self.get_ticket_category(interaction.guild)
-        
-        owner = await self.get_owner_member(interaction.guild)
-        
-        overwrites = {
-            interaction.guild.default_role: discord.PermissionOverwrite(read_messages=False),
-            interaction.user: discord.PermissionOverwrite(read_messages=True, send_messages=True),
-            interaction.guild.me: discord.PermissionOverwrite(read_messages=True, send_messages=True, manage_channels=True)
-        }
-        
-        if owner:
-            overwrites[owner] = discord.PermissionOverwrite(read_messages=True, send_messages=True, manage_messages=True)
-        
-        for role in interaction.guild.roles:
-            if role.name.lower() in ["staff", "moderator", "admin", "support", "founder"]:
-                overwrites[role] = discord.PermissionOverwrite(read_messages=True, send_messages=True)
+        profile = await self.get_profile(interaction.guild)
+        owner = profile.owner(interaction.guild)
         
         safe_username = interaction.user.name[:20].replace(" ", "-").lower()
-        channel = await interaction.guild.create_text_channel(
-            name=f"{safe_username}-pending",
-            category=category,
-            overwrites=overwrites,
-            reason=f"Ticket created by {interaction.user}"
+        channel = await self.open_ticket_channel(
+            interaction.guild, profile, interaction.user, f"{safe_username}-pending"
         )
         
         ticket = await db_service.create_ticket(
@@ -104,18 +427,18 @@ class TicketsCog(commands.Cog):
             category="support"
         )
         
-        embed = create_embed(
-            title=f"🎫 {get_text('ticket_created', lang)}",
-            description=f"Welcome {interaction.user.mention}!\n\n**Staff will be with you shortly!**",
-            color=Config.EMBED_COLOR
+        embed = TICKET_OPENED.fill(
+            heading=get_text('ticket_created', lang),
+            mention=interaction.user.mention,
+            ticket_id=ticket.ticket_id,
+            fields=[
+                field("🆔 Ticket ID", ticket.ticket_id),
+                field("📋 Subject", subject),
+                field("📦 Status", "🟢 **Open**"),
+                field("🕐 Created At", format_timestamp(get_eastern_time()), inline=False),
+            ]
         )
         
-        embed.add_field(name="🆔 Ticket ID", value=ticket.ticket_id, inline=True)
-        embed.add_field(name="📋 Subject", value=subject, inline=True)
-        embed.add_field(name="📦 Status", value="🟢 **Open**", inline=True)
-        embed.add_field(name="🕐 Created At", value=format_timestamp(get_eastern_time()), inline=False)
-        embed.set_footer(text=f"BM Creations Market | Ticket: {ticket.ticket_id}")
-        
         mentions = interaction.user.mention
         if owner:
             mentions += f" | Owner: {owner.mention}"
@@ -170,8 +493,7 @@ class TicketsCog(commands.Cog):
         await interaction.followup.send(embed=embed)
         
         await interaction.channel.send("This channel will be deleted in 10 seconds...")
-        await discord.utils.sleep_until(datetime.utcnow().replace(second=datetime.utcnow().second + 10))
-        await interaction.channel.delete(reason=f"Ticket closed: {reason}")
+        transcript_archiver.archive(interaction.channel, ticket, delete_after=10, reason=f"Ticket closed: {reason}")
     
     @app_commands.command(name="viewtickets", description="View all open tickets (Staff only)")
     @app_commands.default_permissions(manage_messages=True)
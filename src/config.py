@@ -8,6 +8,38 @@ class Config:
     OWNER_ID = None
     
     BOT_PREFIX = "!"
+    
+    SHARDED = os.getenv("SHARDED", "0") == "1"
+    SHARD_COUNT = int(os.getenv("SHARD_COUNT", "1"))
+    SHARD_IDS = [int(shard) for shard in os.getenv("SHARD_IDS", "").split(",") if shard.strip()]
+    
+    COMMAND_SYNC_CONCURRENCY = int(os.getenv("COMMAND_SYNC_CONCURRENCY", "4"))
+    FORCE_COMMAND_SYNC = os.getenv("FORCE_COMMAND_SYNC", "0") == "1"
+    
+    HEALTH_HOST = os.getenv("HEALTH_HOST", "0.0.0.0")
+    HEALTH_PORT = int(os.getenv("PORT", "5000"))
+    SLOW_OPERATION_MS = int(os.getenv("SLOW_OPERATION_MS", "500"))
+    SQL_PROFILE = os.getenv("SQL_PROFILE", "0") == "1"
+    DB_RETRY_MAX_SECONDS = float(os.getenv("DB_RETRY_MAX_SECONDS", "60"))
+    SQL_PROFILE_N_PLUS_ONE = int(os.getenv("SQL_PROFILE_N_PLUS_ONE", "3"))
+    ORDER_ID_BLOCK_SIZE = int(os.getenv("ORDER_ID_BLOCK_SIZE", "20"))
+    ORDER_NOTIFY_WINDOW_SECONDS = float(os.getenv("ORDER_NOTIFY_WINDOW_SECONDS", "5"))
+    ORDER_NOTIFY_CONCURRENCY = int(os.getenv("ORDER_NOTIFY_CONCURRENCY", "2"))
+    ORDER_NOTIFY_MAX_ATTEMPTS = int(os.getenv("ORDER_NOTIFY_MAX_ATTEMPTS", "5"))
+    CATALOG_PAGE_SIZE = int(os.getenv("CATALOG_PAGE_SIZE", "12"))
+    CACHE_REFRESH_SECONDS = float(os.getenv("CACHE_REFRESH_SECONDS", "300"))
+    CHANGE_FEED_CHECK_SECONDS = float(os.getenv("CHANGE_FEED_CHECK_SECONDS", "10"))
+    TICKET_POOL_SIZE = int(os.getenv("TICKET_POOL_SIZE", "0"))
+    TRANSCRIPT_DIR = os.getenv("TRANSCRIPT_DIR", "transcripts")
+    TRANSCRIPT_PAGE_SIZE = int(os.getenv("TRANSCRIPT_PAGE_SIZE", "100"))
+    TRANSCRIPT_SHUTDOWN_SECONDS = float(os.getenv("TRANSCRIPT_SHUTDOWN_SECONDS", "20"))
+    TRANSCRIPT_RECOVERY_DAYS = float(os.getenv("TRANSCRIPT_RECOVERY_DAYS", "7"))
+    STALE_TICKET_HOURS = float(os.getenv("STALE_TICKET_HOURS", "72"))
+    STALE_TICKET_SWEEP_MINUTES = float(os.getenv("STALE_TICKET_SWEEP_MINUTES", "30"))
+    STALE_TICKET_BATCH_SIZE = int(os.getenv("STALE_TICKET_BATCH_SIZE", "500"))
+    REPLY_DEBOUNCE_SECONDS = float(os.getenv("REPLY_DEBOUNCE_SECONDS", "2.5"))
+    REPLY_DEBOUNCE_MAX_SECONDS = float(os.getenv("REPLY_DEBOUNCE_MAX_SECONDS", "8"))
+    FAQ_USAGE_FLUSH_SECONDS = float(os.getenv("FAQ_USAGE_FLUSH_SECONDS", "30"))
     DEFAULT_LANGUAGE = "en"
     SUPPORTED_LANGUAGES = ["en", "es", "fr", "de", "pt", "ar", "zh", "ja", "ko", "ru"]
     
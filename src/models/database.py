@@ -1,6 +1,6 @@
 from sqlalchemy import (
     Column, Integer, BigInteger, String, Text, Boolean, DateTime, Float, 
-    ForeignKey, JSON, Enum as SQLEnum, create_engine, Index
+    ForeignKey, JSON, Enum as SQLEnum, create_engine, Index, Sequence, text
 )
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker, relationship, declarative_base
@@ -17,6 +17,8 @@ class TicketStatus(enum.Enum):
     RESOLVED = "resolved"
     CLOSED = "closed"
 
+OPEN_TICKET_STATUSES = [TicketStatus.OPEN, TicketStatus.IN_PROGRESS, TicketStatus.PENDING]
+
 class OrderStatus(enum.Enum):
     PENDING = "pending"
     CONFIRMED = "confirmed"
@@ -36,7 +38,7 @@ class User(Base):
     __tablename__ = "users"
     
     id = Column(Integer, primary_key=True, autoincrement=True)
-    discord_id = Column(BigInteger, unique=True, nullable=False, index=True)
+    discord_id = Column(BigInteger, nullable=False, index=True)
     guild_id = Column(BigInteger, nullable=False, index=True)
     username = Column(String(100))
     display_name = Column(String(100))
@@ -56,6 +58,10 @@ class User(Base):
     warnings = relationship("Warning", back_populates="user")
     feedback = relationship("Feedback", back_populates="user")
     interactions = relationship("UserInteraction", back_populates="user")
+    
+    __table_args__ = (
+        Index("uq_users_discord_guild", "discord_id", "guild_id", unique=True),
+    )
 
 class Product(Base):
     __tablename__ = "products"
@@ -86,7 +92,7 @@ class Ticket(Base):
     ticket_id = Column(String(50), unique=True, nullable=False, index=True)
     guild_id = Column(BigInteger, nullable=False, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    channel_id = Column(BigInteger, nullable=False)
+    channel_id = Column(BigInteger, nullable=False, index=True)
     category = Column(String(100))
     subject = Column(String(255))
     status = Column(SQLEnum(TicketStatus), default=TicketStatus.OPEN)
@@ -101,12 +107,24 @@ class Ticket(Base):
     orders = relationship("Order", back_populates="ticket")
     messages = relationship("TicketMessage", back_populates="ticket")
     recommendations = relationship("Recommendation", back_populates="ticket")
+    
+    __table_args__ = (
+        # Enum columns store member names, hence the upper-case literals.
+        Index(
+            "ix_tickets_user_open", "user_id", "guild_id",
+            postgresql_where=text("status IN ('OPEN', 'IN_PROGRESS', 'PENDING')")
+        ),
+        Index(
+            "ix_tickets_open_updated_at", "updated_at",
+            postgresql_where=text("status IN ('OPEN', 'IN_PROGRESS', 'PENDING')")
+        ),
+    )
 
 class TicketMessage(Base):
     __tablename__ = "ticket_messages"
     
     id = Column(Integer, primary_key=True, autoincrement=True)
-    ticket_id = Column(Integer, ForeignKey("tickets.id"), nullable=False)
+    ticket_id = Column(Integer, ForeignKey("tickets.id"), nullable=False, index=True)
     discord_message_id = Column(BigInteger)
     author_id = Column(BigInteger, nullable=False)
     content = Column(Text)
@@ -115,6 +133,10 @@ class TicketMessage(Base):
     
     ticket = relationship("Ticket", back_populates="messages")
 
+# Numbers for BM-##### order ids. Starts above the legacy random BM-1000..9999
+# range so allocated ids never collide with existing orders.
+ORDER_NUMBER_SEQUENCE = Sequence("bm_order_number_seq", start=10000, metadata=Base.metadata)
+
 class Order(Base):
     __tablename__ = "orders"
     
@@ -337,7 +359,32 @@ class GuildSettings(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+class BotState(Base):
+    __tablename__ = "bot_state"
+    
+    key = Column(String(100), primary_key=True)
+    value = Column(Text)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+class NotificationOutbox(Base):
+    __tablename__ = "notification_outbox"
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    guild_id = Column(BigInteger, index=True)
+    channel_id = Column(BigInteger, nullable=False)
+    coalesce_key = Column(String(100), nullable=False)
+    payload = Column(JSON, nullable=False)
+    attempts = Column(Integer, default=0)
+    send_after = Column(DateTime, default=datetime.utcnow, index=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+_engine = None
+
 async def get_async_engine():
+    global _engine
+    if _engine is not None:
+        return _engine
+    
     database_url = os.getenv("DATABASE_URL")
     if database_url and database_url.startswith("postgres://"):
         database_url = database_url.replace("postgres://", "postgresql+asyncpg://", 1)
@@ -351,7 +398,8 @@ async def get_async_engine():
             database_url = base_url + "?" + "&".join(filtered_params)
         else:
             database_url = base_url
-    return create_async_engine(database_url, echo=False)
+    _engine = create_async_engine(database_url, echo=False)
+    return _engine
 
 async def get_async_session():
     engine = await get_async_engine()
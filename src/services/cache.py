@@ -0,0 +1,188 @@
+import asyncio
+import itertools
+import time
+from typing import Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import select
+
+from src.models.database import Product, FAQ, GuildSettings
+from src.services.database import db_service
+from src.services.changes import change_feed
+from src.services.metrics import metrics
+from src.services.sharding import shard_scope
+from src.config import Config
+
+TABLES = {"products": Product, "faqs": FAQ, "settings": GuildSettings}
+
+class Snapshot:
+    def __init__(self, version: int, rows: list):
+        self.version = version
+        self.rows = rows
+        self.loaded_at = time.monotonic()
+
+class GuildDataCache:
+    # Read-only, per-guild snapshots of products, FAQs and settings. Rows are
+    # detached ORM objects shared between callers, so they must not be
+    # modified; writers publish a change through change_feed, which
+    # invalidates the guild here and in every other bot process.
+    def __init__(self):
+        self.snapshots: Dict[Tuple[str, int], Snapshot] = {}
+        self.generations: Dict[Tuple[str, int], int] = {}
+        self.dirty: Set[Tuple[str, int]] = set()
+        self.versions = itertools.count(1)
+        self.wake = asyncio.Event()
+        self.task = None
+        self.warmed_at = None
+        metrics.register_gauge("bm_cache_snapshots", "Guild snapshots held by the read cache",
+                               lambda: len(self.snapshots))
+        metrics.register_queue("cache_refresh", lambda: len(self.dirty))
+    
+    def version(self, table: str, guild_id: int) -> int:
+        snapshot = self.snapshots.get((table, guild_id))
+        return snapshot.version if snapshot else 0
+    
+    def invalidate(self, table: str, guild_id: Optional[int] = None, key: Optional[str] = None):
+        if guild_id is None:
+            # Changes may have been missed: drop the table and reload it.
+            for cached in [cached for cached in self.snapshots if cached[0] == table]:
+                self.generations[cached] = self.generations.get(cached, 0) + 1
+                del self.snapshots[cached]
+            self.warmed_at = None
+            self.wake.set()
+            return
+        
+        # Guilds outside this shard can still be cached by a miss in rows(),
+        # so they are dropped too, but only owned guilds are reloaded eagerly.
+        cached = (table, guild_id)
+        self.generations[cached] = self.generations.get(cached, 0) + 1
+        self.snapshots.pop(cached, None)
+        if shard_scope.owns(guild_id):
+            self.dirty.add(cached)
+            self.wake.set()
+    
+    async def query(self, table: str, guild_ids: List[int] = None) -> Dict[int, list]:
+        model = TABLES[table]
+        statement = select(model).order_by(model.id)
+        if guild_ids is not None:
+            statement = statement.where(model.guild_id.in_(guild_ids))
+        else:
+            statement = shard_scope.apply(statement, model.guild_id)
+        
+        async with db_service.session_factory() as session:
+            rows = (await session.execute(statement)).scalars().all()
+        
+        grouped = {guild_id: [] for guild_id in guild_ids or ()}
+        for row in rows:
+            grouped.setdefault(row.guild_id, []).append(row)
+        return grouped
+    
+    async def load(self, table: str, guild_ids: List[int] = None) -> Dict[int, list]:
+        generations = dict(self.generations)
+        grouped = await self.query(table, guild_ids)
+        
+        if guild_ids is None:
+            # A full reload also empties guilds whose rows are all gone. It
+            # only covers this shard, so other guilds' snapshots are dropped
+            # and reloaded on their next lookup instead.
+            for cached_table, guild_id in list(self.snapshots):
+                if cached_table != table:
+                    continue
+                if shard_scope.owns(guild_id):
+                    grouped.setdefault(guild_id, [])
+                elif guild_id not in grouped:
+                    del self.snapshots[(table, guild_id)]
+        
+        for guild_id, rows in grouped.items():
+            key = (table, guild_id)
+            # Skip guilds written to while the query ran; the write queued
+            # its own reload.
+            if self.generations.get(key, 0) != generations.get(key, 0):
+                continue
+            self.snapshots[key] = Snapshot(next(self.versions), rows)
+        return grouped
+    
+    async def warm(self):
+        started = time.perf_counter()
+        loaded = await asyncio.gather(*(self.load(table) for table in TABLES))
+        self.warmed_at = time.monotonic()
+        counts = ", ".join(
+            f"{sum(len(rows) for rows in grouped.values())} {table}" for table, grouped in zip(TABLES, loaded)
+        )
+        print(f"Cache warmed in {(time.perf_counter() - started) * 1000:.0f}ms: {counts}")
+    
+    async def start(self):
+        await self.warm()
+        self.task = asyncio.create_task(self.run())
+    
+    async def stop(self):
+        if self.task:
+            self.task.cancel()
+            self.task = None
+    
+    async def run(self):
+        while True:
+            try:
+                await asyncio.wait_for(self.wake.wait(), timeout=Config.CACHE_REFRESH_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+            self.wake.clear()
+            
+            try:
+                if self.dirty:
+                    pending, self.dirty = self.dirty, set()
+                    for table in TABLES:
+                        guild_ids = [guild_id for dirty_table, guild_id in pending if dirty_table == table]
+                        if guild_ids:
+                            await self.load(table, guild_ids)
+                
+                if self.warmed_at is None or time.monotonic() - self.warmed_at >= Config.CACHE_REFRESH_SECONDS:
+                    await self.warm()
+            except Exception as e:
+                print(f"Error refreshing cache: {e}")
+    
+    async def rows(self, table: str, guild_id: int) -> list:
+        snapshot = self.snapshots.get((table, guild_id))
+        if snapshot is not None:
+            metrics.inc("bm_cache_requests_total", help_text="Read cache lookups", table=table, result="hit")
+            return snapshot.rows
+        
+        metrics.inc("bm_cache_requests_total", help_text="Read cache lookups", table=table, result="miss")
+        grouped = await self.load(table, [guild_id])
+        return grouped[guild_id]
+    
+    async def get_products(self, guild_id: int, category: str = None, available_only: bool = True) -> List[Product]:
+        return [
+            product for product in await self.rows("products", guild_id)
+            if (product.is_available or not available_only) and (category is None or product.category == category)
+        ]
+    
+    async def search_products(self, guild_id: int, search_term: str) -> List[Product]:
+        term = search_term.lower()
+        return [
+            product for product in await self.get_products(guild_id)
+            if term in (product.name or "").lower()
+            or term in (product.description or "").lower()
+            or term in (product.category or "").lower()
+        ]
+    
+    async def get_faqs(self, guild_id: int) -> List[FAQ]:
+        return [faq for faq in await self.rows("faqs", guild_id) if faq.is_active]
+    
+    async def search_faq(self, guild_id: int, search_term: str) -> List[FAQ]:
+        term = search_term.lower()
+        return [
+            faq for faq in await self.get_faqs(guild_id)
+            if term in (faq.question or "").lower() or term in (faq.answer or "").lower()
+        ]
+    
+    async def get_settings(self, guild_id: int) -> GuildSettings:
+        rows = await self.rows("settings", guild_id)
+        if rows:
+            return rows[0]
+        
+        settings = await db_service.get_or_create_guild_settings(guild_id)
+        self.snapshots[("settings", guild_id)] = Snapshot(next(self.versions), [settings])
+        return settings
+
+guild_cache = GuildDataCache()
+change_feed.subscribe(TABLES, guild_cache.invalidate)
@@ -0,0 +1,169 @@
+import re
+import discord
+from discord import ui
+from typing import Dict, List, Optional, Tuple
+
+from src.services.cache import guild_cache
+from src.services.interactions import routed_id
+from src.utils.helpers import create_embed
+from src.utils.views import RoutedView
+from src.config import Config
+
+# Shown until the guild has synced products for the category.
+DEFAULT_PRODUCTS = {
+    "permanent_triggers": [
+        {"name": "King Cummy", "price": 35},
+        {"name": "Venom3", "price": 50},
+        {"name": "KingKong V4", "price": 40},
+        {"name": "Private BBC V5", "price": 55},
+        {"name": "King Cummy V8", "price": 50},
+        {"name": "Female Trigger", "price": 60},
+        {"name": "Red Venom", "price": 60},
+    ],
+    "gifting_triggers": [
+        {"name": "HD Kong", "price": 38},
+        {"name": "BBC King Ultra", "price": 38},
+    ],
+}
+
+CATALOG_CATEGORIES = {
+    "permanent_triggers": {
+        "title": "🎯 Permanent Triggers",
+        "description": "Select the product you want to purchase:\n\n*All Permanent Triggers include lifetime warranty*",
+        "icon": "🎯",
+        "warranty": "**Yes**",
+        "style": discord.ButtonStyle.success,
+    },
+    "gifting_triggers": {
+        "title": "🎁 Gifting Triggers",
+        "description": "Select the product you want to purchase:\n\n*Gifting Triggers have a 6-month warranty*",
+        "icon": "🎁",
+        "warranty": "**6 Months**",
+        "style": discord.ButtonStyle.primary,
+    },
+}
+
+BUTTONS_PER_ROW = 3
+
+def category_key(name: Optional[str]) -> str:
+    # Kept short so it fits in a routed custom_id (100 characters max)
+    # alongside a product key and the customer's id.
+    return re.sub(r"[^a-z0-9]+", "_", (name or "").lower()).strip("_")[:30]
+
+def category_info(category: str) -> Dict:
+    info = CATALOG_CATEGORIES.get(category)
+    if info:
+        return info
+    title = category.replace("_", " ").title()
+    return {
+        "title": f"🛍️ {title}",
+        "description": "Select the product you want to purchase:",
+        "icon": "🛍️",
+        "warranty": "**Yes**",
+        "style": discord.ButtonStyle.primary,
+    }
+
+class CatalogEntry:
+    def __init__(self, key: str, name: str, price: float, product_id: int = None):
+        self.key = key
+        self.name = name
+        self.price = price
+        self.product_id = product_id
+    
+    @property
+    def label(self) -> str:
+        return f"{self.name} - ${self.price:g}"[:80]
+    
+    def as_dict(self) -> Dict:
+        return {"name": self.name, "price": self.price}
+
+DEFAULT_ENTRIES = {
+    category: [CatalogEntry(category_key(product["name"]), product["name"], product["price"]) for product in products]
+    for category, products in DEFAULT_PRODUCTS.items()
+}
+
+class ProductCatalog:
+    # Catalog page layouts are built once per guild/category/page and reused
+    # for as long as the guild's product snapshot in the read cache is
+    # unchanged. Only the customer's id is stamped into the buttons per send.
+    def __init__(self):
+        self.entries: Dict[int, Tuple[int, Dict[str, List[CatalogEntry]]]] = {}
+        self.layouts: Dict[Tuple[int, str, int, int], List[Tuple]] = {}
+    
+    async def load(self, guild_id: int) -> Tuple[int, Dict[str, List[CatalogEntry]]]:
+        products = await guild_cache.get_products(guild_id)
+        version = guild_cache.version("products", guild_id)
+        
+        cached = self.entries.get(guild_id)
+        if cached and cached[0] == version:
+            return cached
+        
+        grouped = {}
+        for product in products:
+            grouped.setdefault(category_key(product.category), []).append(
+                CatalogEntry(f"p{product.id}", product.name, product.price or 0.0, product.id)
+            )
+        
+        # Version 0 means the rows were read while a write was in flight;
+        # use them once but don't cache anything built from them.
+        if version:
+            for key in [key for key in self.layouts if key[0] == guild_id and key[2] != version]:
+                del self.layouts[key]
+            self.entries[guild_id] = (version, grouped)
+        return version, grouped
+    
+    async def get_entries(self, guild_id: int, category: str) -> Tuple[int, List[CatalogEntry]]:
+        version, grouped = await self.load(guild_id)
+        return version, grouped.get(category) or DEFAULT_ENTRIES.get(category, [])
+    
+    async def find(self, guild_id: int, category: str, key: str) -> Optional[CatalogEntry]:
+        _, entries = await self.get_entries(guild_id, category)
+        for entry in entries:
+            if entry.key == key:
+                return entry
+        return None
+    
+    async def render(self, guild_id: int, category: str, user_id: int, page: int = 0) -> Tuple[discord.Embed, RoutedView]:
+        version, entries = await self.get_entries(guild_id, category)
+        page_size = max(1, min(Config.CATALOG_PAGE_SIZE, 4 * BUTTONS_PER_ROW))
+        pages = max(1, -(-len(entries) // page_size))
+        page = min(max(page, 0), pages - 1)
+        
+        key = (guild_id, category, version, page)
+        layout = self.layouts.get(key)
+        if layout is None:
+            layout = self.build_layout(category, entries[page * page_size:(page + 1) * page_size], page, pages)
+            if version:
+                self.layouts[key] = layout
+        
+        info = category_info(category)
+        embed = create_embed(title=info["title"], description=info["description"], color=Config.EMBED_COLOR)
+        if not entries:
+            embed.description = "No products are available in this category right now."
+        if pages > 1:
+            embed.set_footer(text=f"Page {page + 1}/{pages}")
+        return embed, self.build_view(layout, user_id)
+    
+    def build_layout(self, category: str, entries: List[CatalogEntry], page: int, pages: int) -> List[Tuple]:
+        # (label, style, action, args, row, disabled) per button.
+        style = category_info(category)["style"]
+        layout = [
+            (entry.label, style, "pick", (category, entry.key), index // BUTTONS_PER_ROW, False)
+            for index, entry in enumerate(entries)
+        ]
+        layout.append(("⬅️ Back", discord.ButtonStyle.secondary, "back", (), 4, False))
+        if pages > 1:
+            layout.append(("◀ Prev", discord.ButtonStyle.secondary, "page", (category, page - 1), 4, page == 0))
+            layout.append(("Next ▶", discord.ButtonStyle.secondary, "page", (category, page + 1), 4, page >= pages - 1))
+        return layout
+    
+    def build_view(self, layout: List[Tuple], user_id: int) -> RoutedView:
+        # The customer's id goes last so buttons sent before it was added
+        # still parse; outside a ticket it is the only ownership check.
+        view = RoutedView()
+        for label, style, action, args, row, disabled in layout:
+            view.add_item(ui.Button(label=label, style=style, disabled=disabled, row=row,
+                                    custom_id=routed_id("catalog", action, *args, user_id)))
+        return view
+
+product_catalog = ProductCatalog()
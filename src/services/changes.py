@@ -0,0 +1,98 @@
+import asyncio
+import json
+import uuid
+from typing import Callable, Dict, List, Optional
+
+import asyncpg
+from sqlalchemy import event, select, func
+from sqlalchemy.orm import Session
+
+from src.services.metrics import metrics
+from src.config import Config
+
+CHANNEL = "bm_changes"
+
+ChangeHandler = Callable[[str, Optional[int], Optional[str]], None]
+
+class ChangeFeed:
+    # Cache invalidation shared between bot processes. Writers publish a
+    # NOTIFY inside their transaction; every process LISTENs and invalidates
+    # its own caches. The writing process applies the change itself right
+    # after commit and ignores its own notification.
+    def __init__(self):
+        self.origin = uuid.uuid4().hex[:12]
+        self.handlers: Dict[str, List[ChangeHandler]] = {}
+        self.dsn = None
+        self.connection = None
+        self.task = None
+    
+    def subscribe(self, tables, handler: ChangeHandler):
+        for table in tables:
+            self.handlers.setdefault(table, []).append(handler)
+    
+    def apply(self, table: str, guild_id: Optional[int] = None, key: Optional[str] = None):
+        for handler in self.handlers.get(table, []):
+            try:
+                handler(table, guild_id, key)
+            except Exception as e:
+                print(f"Error applying {table} change: {e}")
+    
+    def apply_all(self):
+        for table in self.handlers:
+            self.apply(table)
+    
+    async def publish(self, session, table: str, guild_id: Optional[int] = None, key: Optional[str] = None):
+        payload = json.dumps({"table": table, "guild": guild_id, "key": key, "origin": self.origin})
+        await session.execute(select(func.pg_notify(CHANNEL, payload)))
+        session.info.setdefault("bm_changes", []).append((table, guild_id, key))
+    
+    def on_notification(self, connection, pid, channel, payload):
+        try:
+            change = json.loads(payload)
+        except ValueError:
+            return
+        if change.get("origin") == self.origin:
+            return
+        metrics.inc("bm_changes_received_total", help_text="Change notifications from other processes",
+                    table=change.get("table", "unknown"))
+        self.apply(change.get("table"), change.get("guild"), change.get("key"))
+    
+    async def start(self, engine):
+        self.dsn = engine.url.set(drivername="postgresql").render_as_string(hide_password=False)
+        self.task = asyncio.create_task(self.watch())
+        await self.connect()
+    
+    async def stop(self):
+        if self.task:
+            self.task.cancel()
+            self.task = None
+        if self.connection and not self.connection.is_closed():
+            await self.connection.close()
+    
+    async def connect(self):
+        self.connection = await asyncpg.connect(self.dsn)
+        await self.connection.add_listener(CHANNEL, self.on_notification)
+        print(f"Listening for cache changes on '{CHANNEL}'")
+    
+    async def watch(self):
+        while True:
+            await asyncio.sleep(Config.CHANGE_FEED_CHECK_SECONDS)
+            if self.connection and not self.connection.is_closed():
+                continue
+            try:
+                await self.connect()
+                # Anything published while disconnected was missed.
+                self.apply_all()
+            except Exception as e:
+                print(f"Change feed reconnect failed: {e}")
+
+change_feed = ChangeFeed()
+
+@event.listens_for(Session, "after_commit")
+def apply_committed_changes(session):
+    for change in session.info.pop("bm_changes", []):
+        change_feed.apply(*change)
+
+@event.listens_for(Session, "after_rollback")
+def discard_rolled_back_changes(session):
+    session.info.pop("bm_changes", None)
@@ -0,0 +1,87 @@
+import discord
+from discord import app_commands
+import asyncio
+import hashlib
+import json
+from typing import Dict, Optional
+
+from src.services.database import db_service
+from src.config import Config
+
+GLOBAL_STATE_KEY = "command_tree:global"
+
+def guild_state_key(guild_id: int) -> str:
+    return f"command_tree:{guild_id}"
+
+def command_tree_signature(tree: app_commands.CommandTree, guild: Optional[discord.abc.Snowflake] = None) -> str:
+    payload = sorted(
+        (command.to_dict() for command in tree.get_commands(guild=guild)),
+        key=lambda command: (command.get("type", 1), command["name"])
+    )
+    encoded = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+async def load_stored_signatures(keys) -> Dict[str, str]:
+    if not db_service.is_ready:
+        return {}
+    try:
+        return await db_service.get_bot_state(list(keys))
+    except Exception as e:
+        print(f"Failed to load command tree signatures: {e}")
+        return {}
+
+async def store_signature(key: str, signature: str):
+    if not db_service.is_ready:
+        return
+    try:
+        await db_service.set_bot_state(key, signature)
+    except Exception as e:
+        print(f"Failed to store command tree signature {key}: {e}")
+
+async def sync_guild_commands(bot: discord.Client, guild: discord.Guild, stored_signature: str = None,
+                              semaphore: asyncio.Semaphore = None, force: bool = False) -> bool:
+    bot.tree.copy_global_to(guild=guild)
+    signature = command_tree_signature(bot.tree, guild=guild)
+    if not force and signature == stored_signature:
+        return False
+    
+    semaphore = semaphore or asyncio.Semaphore(1)
+    async with semaphore:
+        try:
+            synced = await bot.tree.sync(guild=guild)
+            print(f"Synced {len(synced)} slash commands to guild: {guild.name}")
+        except Exception as e:
+            print(f"Failed to sync to guild {guild.name}: {e}")
+            return False
+    
+    await store_signature(guild_state_key(guild.id), signature)
+    return True
+
+async def sync_command_tree(bot: discord.Client, force: bool = None) -> Dict[str, int]:
+    force = Config.FORCE_COMMAND_SYNC if force is None else force
+    guilds = list(bot.guilds)
+    stored = await load_stored_signatures(
+        [GLOBAL_STATE_KEY] + [guild_state_key(guild.id) for guild in guilds]
+    )
+    
+    semaphore = asyncio.Semaphore(max(1, Config.COMMAND_SYNC_CONCURRENCY))
+    results = await asyncio.gather(*(
+        sync_guild_commands(bot, guild, stored.get(guild_state_key(guild.id)), semaphore, force)
+        for guild in guilds
+    ))
+    guilds_synced = sum(1 for synced in results if synced)
+    
+    global_synced = False
+    global_signature = command_tree_signature(bot.tree)
+    if force or stored.get(GLOBAL_STATE_KEY) != global_signature:
+        try:
+            synced = await bot.tree.sync()
+            print(f"Also synced {len(synced)} slash commands globally")
+            await store_signature(GLOBAL_STATE_KEY, global_signature)
+            global_synced = True
+        except Exception as e:
+            print(f"Failed to sync globally: {e}")
+    
+    print(f"Command tree sync: {guilds_synced}/{len(guilds)} guilds updated, "
+          f"global {'updated' if global_synced else 'unchanged'}")
+    return {"guilds": len(guilds), "guilds_synced": guilds_synced, "global_synced": int(global_synced)}
@@ -1,33 +1,70 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, delete, func, and_, or_
+from sqlalchemy import select, update, delete, func, and_, or_, bindparam
 from sqlalchemy.orm import selectinload
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any
+import asyncio
 import random
 import string
 
 from src.models.database import (
     User, Product, Ticket, TicketMessage, Order, OrderItem, OrderEvent,
     CartItem, WishlistItem, Recommendation, FAQ, Announcement, Warning,
-    Feedback, Reminder, UserInteraction, Analytics, GuildSettings,
-    TicketStatus, OrderStatus, WarningLevel, get_async_session, init_db
+    Feedback, Reminder, UserInteraction, Analytics, GuildSettings, BotState, NotificationOutbox,
+    TicketStatus, OPEN_TICKET_STATUSES, OrderStatus, WarningLevel, ORDER_NUMBER_SEQUENCE, get_async_session, get_async_engine
 )
+from src.services.migrations import run_migrations
+from src.services.instrumentation import instrument_class
+from src.services.profiler import install_query_profiler
+from src.services.changes import change_feed
+from src.services.sharding import shard_scope
+from src.config import Config
 
 class DatabaseService:
     def __init__(self):
         self.session_factory = None
+        self.engine = None
         self._initialized = False
+        self._init_lock = asyncio.Lock()
+        self._ready = asyncio.Event()
+        self._order_numbers: List[int] = []
+        self._order_number_lock = asyncio.Lock()
+    
+    @property
+    def is_ready(self) -> bool:
+        return self._ready.is_set()
+    
+    async def wait_until_ready(self):
+        await self._ready.wait()
     
     async def initialize(self):
-        if self._initialized:
-            return
-        await init_db()
-        self.session_factory = await get_async_session()
-        self._initialized = True
+        async with self._init_lock:
+            if self._initialized:
+                return
+            await run_migrations()
+            self.engine = await get_async_engine()
+            if Config.SQL_PROFILE:
+                install_query_profiler(self.engine)
+            self.session_factory = await get_async_session()
+            self._initialized = True
+            self._ready.set()
     
     async def ensure_initialized(self):
-        if not self._initialized or self.session_factory is None:
-            await self.initialize()
+        if self._initialized:
+            return
+        await self.initialize()
+    
+    def pool_status(self) -> Dict[str, int]:
+        if not self.engine:
+            return {}
+        pool = self.engine.pool
+        return {
+            "size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": pool.overflow(),
+        }
     
     async def get_session(self) -> AsyncSession:
         return self.session_factory()
@@ -38,18 +75,24 @@ class DatabaseService:
         return f"{prefix}-{random_id}-{random_suffix}"
     
     async def generate_unique_bm_order_id(self) -> str:
+        # Numbers come from bm_order_number_seq in reserved blocks, shuffled so
+        # consecutive customers don't get adjacent ids. nextval never repeats,
+        # so there is nothing to probe and no check-then-insert race.
+        if not self._order_numbers:
+            async with self._order_number_lock:
+                if not self._order_numbers:
+                    await self.reserve_order_numbers(Config.ORDER_ID_BLOCK_SIZE)
+        return f"BM-{self._order_numbers.pop()}"
+    
+    async def reserve_order_numbers(self, count: int):
         await self.ensure_initialized()
         async with self.session_factory() as session:
-            for _ in range(10):
-                random_num = random.randint(1000, 9999)
-                order_id = f"BM-{random_num}"
-                result = await session.execute(
-                    select(Order).where(Order.order_id == order_id)
-                )
-                if not result.scalar_one_or_none():
-                    return order_id
-            timestamp = datetime.utcnow().strftime("%H%M")
-            return f"BM-{timestamp}{random.randint(10, 99)}"
+            result = await session.execute(
+                select(ORDER_NUMBER_SEQUENCE.next_value()).select_from(func.generate_series(1, count))
+            )
+            numbers = [row[0] for row in result]
+        random.shuffle(numbers)
+        self._order_numbers.extend(numbers)
     
     def generate_bm_order_id(self) -> str:
         random_num = random.randint(1000, 9999)
@@ -139,10 +182,18 @@ class DatabaseService:
                 **kwargs
             )
             session.add(product)
+            await change_feed.publish(session, "products", guild_id)
             await session.commit()
             await session.refresh(product)
             return product
     
+    async def clear_products(self, guild_id: int) -> int:
+        async with self.session_factory() as session:
+            result = await session.execute(delete(Product).where(Product.guild_id == guild_id))
+            await change_feed.publish(session, "products", guild_id)
+            await session.commit()
+            return result.rowcount
+    
     async def get_products(self, guild_id: int, category: str = None, 
                           available_only: bool = True) -> List[Product]:
         async with self.session_factory() as session:
@@ -207,7 +258,7 @@ class DatabaseService:
                 .options(selectinload(Ticket.user))
                 .where(and_(
                     Ticket.guild_id == guild_id,
-                    Ticket.status.in_([TicketStatus.OPEN, TicketStatus.IN_PROGRESS, TicketStatus.PENDING])
+                    Ticket.status.in_(OPEN_TICKET_STATUSES)
                 ))
                 .order_by(Ticket.created_at.desc())
             )
@@ -226,6 +277,21 @@ class DatabaseService:
             )
             return result.scalars().all()
     
+    async def count_open_tickets(self, user_id: int, guild_id: int) -> int:
+        # Answered from ix_tickets_user_open, so the cost doesn't grow with
+        # the user's closed ticket history.
+        async with self.session_factory() as session:
+            result = await session.execute(
+                select(func.count())
+                .select_from(Ticket)
+                .where(and_(
+                    Ticket.user_id == user_id,
+                    Ticket.guild_id == guild_id,
+                    Ticket.status.in_(OPEN_TICKET_STATUSES)
+                ))
+            )
+            return result.scalar_one()
+    
     async def get_guild_tickets(self, guild_id: int, status: TicketStatus = None) -> List[Ticket]:
         async with self.session_factory() as session:
             query = select(Ticket).options(selectinload(Ticket.user)).where(Ticket.guild_id == guild_id)
@@ -250,6 +316,68 @@ class DatabaseService:
                 await session.commit()
             return ticket
     
+    async def get_stale_tickets(self, inactive_since: datetime, limit: int) -> List[Ticket]:
+        async with self.session_factory() as session:
+            query = (
+                select(Ticket)
+                .where(and_(
+                    Ticket.status.in_(OPEN_TICKET_STATUSES),
+                    Ticket.updated_at < inactive_since
+                ))
+                .order_by(Ticket.updated_at)
+                .limit(limit)
+            )
+            result = await session.execute(shard_scope.apply(query, Ticket.guild_id))
+            return result.scalars().all()
+    
+    async def get_unarchived_closed_tickets(self, closed_since: datetime) -> List[Ticket]:
+        async with self.session_factory() as session:
+            query = select(Ticket).where(and_(
+                Ticket.status == TicketStatus.CLOSED,
+                Ticket.closed_at >= closed_since,
+                Ticket.extra_data["transcript"].is_(None)
+            ))
+            result = await session.execute(shard_scope.apply(query, Ticket.guild_id))
+            return result.scalars().all()
+    
+    async def bulk_update_ticket_status(self, ticket_ids: List[int], status: TicketStatus,
+                                        stale_before: datetime) -> List[int]:
+        # Only tickets that are still open and still stale are changed, so a
+        # ticket closed or answered since it was read is left alone. Returns
+        # the ids that were actually updated.
+        if not ticket_ids:
+            return []
+        now = datetime.utcnow()
+        values = {"status": status, "updated_at": now}
+        if status in [TicketStatus.RESOLVED, TicketStatus.CLOSED]:
+            values["closed_at"] = now
+        async with self.session_factory() as session:
+            result = await session.execute(
+                update(Ticket).where(
+                    Ticket.id.in_(ticket_ids),
+                    Ticket.status.in_(OPEN_TICKET_STATUSES),
+                    Ticket.updated_at < stale_before
+                ).values(**values).returning(Ticket.id)
+            )
+            updated = list(result.scalars().all())
+            await session.commit()
+            return updated
+    
+    async def touch_tickets(self, ticket_ids: List[int], stale_before: datetime) -> List[int]:
+        if not ticket_ids:
+            return []
+        async with self.session_factory() as session:
+            result = await session.execute(
+                update(Ticket).where(
+                    Ticket.id.in_(ticket_ids),
+                    Ticket.status.in_(OPEN_TICKET_STATUSES),
+                    Ticket.updated_at < stale_before
+                ).values(updated_at=datetime.utcnow()).returning(Ticket.id)
+            )
+            touched = list(result.scalars().all())
+            await session.commit()
+            return touched
+    
     async def update_ticket_extra_data(self, ticket_id: str, extra_data: Dict) -> Ticket:
         async with self.session_factory() as session:
             result = await session.execute(
@@ -284,6 +412,18 @@ class DatabaseService:
             await session.commit()
             return message
     
+    async def add_ticket_messages(self, rows: List[Dict]):
+        if not rows:
+            return
+        async with self.session_factory() as session:
+            await session.execute(pg_insert(TicketMessage), rows)
+            await session.commit()
+    
+    async def clear_ticket_messages(self, ticket_id: int):
+        async with self.session_factory() as session:
+            await session.execute(delete(TicketMessage).where(TicketMessage.ticket_id == ticket_id))
+            await session.commit()
+    
     async def create_order(self, guild_id: int, user_id: int, ticket_id: int = None, 
                           items: List[Dict] = None, notes: str = None, 
                           order_id: str = None, channel_id: int = None) -> Order:
@@ -355,29 +495,16 @@ class DatabaseService:
     
     async def update_order_status(self, order_id: str, status: OrderStatus, 
                                   tracking_number: str = None, staff_id: int = None) -> Order:
-        async with self.session_factory() as session:
-            result = await session.execute(
-                select(Order).where(Order.order_id == order_id)
-            )
-            order = result.scalar_one_or_none()
-            if order:
-                old_status = order.status
-                order.status = status
-                if tracking_number:
-                    order.tracking_number = tracking_number
-                if status == OrderStatus.DELIVERED:
-                    order.completed_at = datetime.utcnow()
-                
-                event = OrderEvent(
-                    order_id=order.id,
-                    event_type="status_change",
-                    description=f"Status changed from {old_status.value} to {status.value}",
-                    created_by=staff_id,
-                    metadata={"old_status": old_status.value, "new_status": status.value}
-                )
-                session.add(event)
-                await session.commit()
-            return order
+        from src.services.orders import order_transitions
+        
+        # Raises ValueError with the reason ("not found", "already delivered",
+        # ...) when the order wasn't updated.
+        outcome = await order_transitions.transition(
+            status, order_ids=[order_id], staff_id=staff_id, tracking_number=tracking_number
+        )
+        if not outcome.updated:
+            raise ValueError(outcome.skipped.get(order_id, "not found"))
+        return outcome.updated[0]
     
     async def add_to_cart(self, discord_id: int, guild_id: int, product_id: int, 
                          quantity: int = 1) -> CartItem:
@@ -499,10 +626,24 @@ class DatabaseService:
                 category=category
             )
             session.add(faq)
+            await change_feed.publish(session, "faqs", guild_id)
             await session.commit()
             await session.refresh(faq)
             return faq
     
+    async def increment_faq_usage(self, counts: Dict[int, int]):
+        if not counts:
+            return
+        faqs = FAQ.__table__
+        statement = (
+            update(faqs)
+            .where(faqs.c.id == bindparam("faq_id"))
+            .values(usage_count=func.coalesce(faqs.c.usage_count, 0) + bindparam("hits"))
+        )
+        async with self.session_factory() as session:
+            await session.execute(statement, [{"faq_id": faq_id, "hits": hits} for faq_id, hits in counts.items()])
+            await session.commit()
+    
     async def search_faq(self, guild_id: int, search_term: str, language: str = "en") -> List[FAQ]:
         async with self.session_factory() as session:
             result = await session.execute(
@@ -543,12 +684,11 @@ class DatabaseService:
     
     async def get_pending_announcements(self) -> List[Announcement]:
         async with self.session_factory() as session:
-            result = await session.execute(
-                select(Announcement).where(and_(
-                    Announcement.is_sent == False,
-                    Announcement.scheduled_at <= datetime.utcnow()
-                ))
-            )
+            query = select(Announcement).where(and_(
+                Announcement.is_sent == False,
+                Announcement.scheduled_at <= datetime.utcnow()
+            ))
+            result = await session.execute(shard_scope.apply(query, Announcement.guild_id))
             return result.scalars().all()
     
     async def mark_announcement_sent(self, announcement_id: int):
@@ -634,12 +774,11 @@ class DatabaseService:
     
     async def get_pending_reminders(self) -> List[Reminder]:
         async with self.session_factory() as session:
-            result = await session.execute(
-                select(Reminder).where(and_(
-                    Reminder.is_sent == False,
-                    Reminder.scheduled_at <= datetime.utcnow()
-                ))
-            )
+            query = select(Reminder).where(and_(
+                Reminder.is_sent == False,
+                Reminder.scheduled_at <= datetime.utcnow()
+            ))
+            result = await session.execute(shard_scope.apply(query, Reminder.guild_id))
             return result.scalars().all()
     
     async def mark_reminder_sent(self, reminder_id: int):
@@ -718,6 +857,7 @@ class DatabaseService:
             if not settings:
                 settings = GuildSettings(guild_id=guild_id)
                 session.add(settings)
+                await change_feed.publish(session, "settings", guild_id)
                 await session.commit()
                 await session.refresh(settings)
             
@@ -734,8 +874,67 @@ class DatabaseService:
                 for key, value in kwargs.items():
                     if hasattr(settings, key):
                         setattr(settings, key, value)
+                await change_feed.publish(session, "settings", guild_id)
                 await session.commit()
             
             return settings
+    
+    async def get_bot_state(self, keys: List[str]) -> Dict[str, str]:
+        async with self.session_factory() as session:
+            result = await session.execute(
+                select(BotState.key, BotState.value).where(BotState.key.in_(keys))
+            )
+            return {key: value for key, value in result.all()}
+    
+    async def set_bot_state(self, key: str, value: str):
+        async with self.session_factory() as session:
+            statement = pg_insert(BotState).values(key=key, value=value, updated_at=datetime.utcnow())
+            statement = statement.on_conflict_do_update(
+                index_elements=[BotState.key],
+                set_={"value": statement.excluded.value, "updated_at": statement.excluded.updated_at}
+            )
+            await session.execute(statement)
+            await session.commit()
+    
+    async def add_outbox_item(self, channel_id: int, coalesce_key: str, payload: Dict, send_after: datetime,
+                              guild_id: int = None) -> int:
+        async with self.session_factory() as session:
+            item = NotificationOutbox(
+                guild_id=guild_id,
+                channel_id=channel_id,
+                coalesce_key=coalesce_key,
+                payload=payload,
+                send_after=send_after
+            )
+            session.add(item)
+            await session.commit()
+            return item.id
+    
+    async def update_outbox_item(self, item_id: int, **values):
+        async with self.session_factory() as session:
+            await session.execute(
+                update(NotificationOutbox).where(NotificationOutbox.id == item_id).values(**values)
+            )
+            await session.commit()
+    
+    async def get_outbox_items(self) -> List[NotificationOutbox]:
+        async with self.session_factory() as session:
+            query = select(NotificationOutbox).order_by(NotificationOutbox.send_after)
+            result = await session.execute(shard_scope.apply(query, NotificationOutbox.guild_id))
+            return list(result.scalars().all())
+    
+    async def delete_outbox_items(self, item_ids: List[int]):
+        if not item_ids:
+            return
+        async with self.session_factory() as session:
+            await session.execute(
+                delete(NotificationOutbox).where(NotificationOutbox.id.in_(item_ids))
+            )
+            await session.commit()
+
+instrument_class(
+    DatabaseService, "db", "db",
+    exclude=("initialize", "ensure_initialized", "wait_until_ready", "get_session")
+)
 
 db_service = DatabaseService()
@@ -0,0 +1,72 @@
+import discord
+import asyncio
+import time
+from typing import Awaitable, Callable, Dict, List, Tuple
+
+from src.services.metrics import metrics
+from src.config import Config
+
+BurstHandler = Callable[[List[discord.Message]], Awaitable[None]]
+
+class PendingBurst:
+    def __init__(self, handler: BurstHandler):
+        self.handler = handler
+        self.messages: List[discord.Message] = []
+        self.deadline = time.monotonic() + Config.REPLY_DEBOUNCE_MAX_SECONDS
+        self.task = None
+
+class MessageDebouncer:
+    # Collects a user's messages in a channel until they stop typing for
+    # REPLY_DEBOUNCE_SECONDS (or REPLY_DEBOUNCE_MAX_SECONDS have passed) and
+    # hands the whole burst to one handler call. Staff activity in the
+    # channel drops whatever is still waiting.
+    def __init__(self):
+        self.pending: Dict[Tuple[int, int], PendingBurst] = {}
+        metrics.register_queue("reply_debounce", lambda: len(self.pending))
+    
+    async def submit(self, message: discord.Message, handler: BurstHandler):
+        if Config.REPLY_DEBOUNCE_SECONDS <= 0:
+            await handler([message])
+            return
+        
+        key = (message.channel.id, message.author.id)
+        burst = self.pending.get(key)
+        if burst is None or burst.handler != handler:
+            if burst:
+                self.flush(key)
+            burst = self.pending[key] = PendingBurst(handler)
+        else:
+            burst.task.cancel()
+            metrics.inc("bm_replies_coalesced_total", help_text="Auto-reply messages merged into a pending burst")
+        
+        burst.messages.append(message)
+        delay = min(Config.REPLY_DEBOUNCE_SECONDS, max(0, burst.deadline - time.monotonic()))
+        burst.task = asyncio.create_task(self.fire(key, burst, delay))
+    
+    def flush(self, key: Tuple[int, int]):
+        burst = self.pending.get(key)
+        if burst:
+            burst.task.cancel()
+            burst.task = asyncio.create_task(self.fire(key, burst, 0))
+    
+    async def fire(self, key: Tuple[int, int], burst: PendingBurst, delay: float):
+        await asyncio.sleep(delay)
+        if self.pending.get(key) is burst:
+            del self.pending[key]
+        try:
+            await burst.handler(burst.messages)
+        except Exception as e:
+            print(f"Error answering messages in {key[0]}: {e}")
+    
+    def cancel_channel(self, channel_id: int):
+        for key in [key for key in self.pending if key[0] == channel_id]:
+            burst = self.pending.pop(key)
+            burst.task.cancel()
+            metrics.inc("bm_replies_superseded_total", help_text="Pending auto-replies dropped for staff activity")
+    
+    def cancel_all(self):
+        for burst in self.pending.values():
+            burst.task.cancel()
+        self.pending.clear()
+
+message_debouncer = MessageDebouncer()
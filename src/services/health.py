@@ -0,0 +1,85 @@
+import discord
+from aiohttp import web
+import math
+import time
+
+from src.services.database import db_service
+from src.services.metrics import metrics
+from src.config import Config
+
+class HealthServer:
+    def __init__(self, bot: discord.Client, host: str = None, port: int = None):
+        self.bot = bot
+        self.host = host or Config.HEALTH_HOST
+        self.port = port or Config.HEALTH_PORT
+        self.started_at = time.time()
+        self.runner = None
+        
+        self.app = web.Application()
+        self.app.router.add_get("/", self.home)
+        self.app.router.add_get("/healthz", self.healthz)
+        self.app.router.add_get("/metrics", self.prometheus)
+        
+        metrics.register_gauge("bm_up", "Whether the bot is connected and ready", lambda: int(self.is_healthy()))
+        metrics.register_gauge("bm_uptime_seconds", "Seconds since the process started", lambda: time.time() - self.started_at)
+        metrics.register_gauge("bm_gateway_latency_seconds", "Discord gateway heartbeat latency", self.gateway_latency)
+        metrics.register_gauge("bm_guilds", "Guilds the bot is connected to", lambda: len(self.bot.guilds))
+        for key in ("size", "checked_in", "checked_out", "overflow"):
+            metrics.register_gauge(
+                f"bm_db_pool_{key}", f"Database connection pool {key.replace('_', ' ')}",
+                lambda key=key: db_service.pool_status()[key]
+            )
+    
+    def gateway_latency(self) -> float:
+        latency = self.bot.latency
+        if latency is None or math.isnan(latency) or math.isinf(latency):
+            raise ValueError("no heartbeat yet")
+        return latency
+    
+    def is_healthy(self) -> bool:
+        if self.bot.is_closed() or not self.bot.is_ready() or not db_service.is_ready:
+            return False
+        try:
+            self.gateway_latency()
+        except ValueError:
+            return False
+        return True
+    
+    async def home(self, request: web.Request) -> web.Response:
+        return web.Response(text="BM Creations Bot is alive and running!")
+    
+    async def healthz(self, request: web.Request) -> web.Response:
+        try:
+            latency_ms = round(self.gateway_latency() * 1000, 1)
+        except ValueError:
+            latency_ms = None
+        
+        healthy = self.is_healthy()
+        payload = {
+            "status": "ok" if healthy else "unavailable",
+            "ready": self.bot.is_ready(),
+            "latency_ms": latency_ms,
+            "guilds": len(self.bot.guilds),
+            "uptime_seconds": round(time.time() - self.started_at),
+            "database": {
+                "ready": db_service.is_ready,
+                "pool": db_service.pool_status(),
+            },
+            "queues": metrics.queue_depths(),
+        }
+        return web.json_response(payload, status=200 if healthy else 503)
+    
+    async def prometheus(self, request: web.Request) -> web.Response:
+        return web.Response(text=metrics.render_prometheus(), content_type="text/plain", charset="utf-8")
+    
+    async def start(self):
+        self.runner = web.AppRunner(self.app, access_log=None)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, self.host, self.port)
+        await site.start()
+        print(f"Health server listening on {self.host}:{self.port}")
+    
+    async def stop(self):
+        if self.runner:
+            await self.runner.cleanup()
+            self.runner = None
@@ -0,0 +1,66 @@
+import functools
+import inspect
+import time
+from contextlib import contextmanager
+from typing import Dict, List
+
+from src.services.metrics import metrics
+from src.services.profiler import profile_scope
+from src.config import Config
+
+DURATION_METRIC = "bm_operation_duration_seconds"
+ERROR_METRIC = "bm_operation_errors_total"
+
+@contextmanager
+def track(operation: str, kind: str = "handler"):
+    start = time.perf_counter()
+    failed = False
+    try:
+        with profile_scope(f"{kind}:{operation}"):
+            yield
+    except Exception:
+        failed = True
+        raise
+    finally:
+        elapsed = time.perf_counter() - start
+        metrics.observe(DURATION_METRIC, elapsed, help_text="Latency of instrumented operations",
+                        kind=kind, operation=operation)
+        if failed:
+            metrics.inc(ERROR_METRIC, help_text="Instrumented operations that raised",
+                        kind=kind, operation=operation)
+        if elapsed * 1000 >= Config.SLOW_OPERATION_MS:
+            print(f"Slow {kind} operation {operation}: {elapsed * 1000:.0f}ms")
+
+def instrument(operation: str, kind: str = "handler"):
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            with track(operation, kind):
+                return await func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def instrument_class(cls, kind: str, prefix: str, exclude: tuple = ()):
+    for name, attr in list(vars(cls).items()):
+        if name.startswith("_") or name in exclude or not inspect.iscoroutinefunction(attr):
+            continue
+        setattr(cls, name, instrument(f"{prefix}.{name}", kind)(attr))
+    return cls
+
+def operation_stats(kind: str = None) -> List[Dict]:
+    stats = []
+    for labels, histogram in metrics.histogram_series(DURATION_METRIC).items():
+        label_map = dict(labels)
+        if kind and label_map.get("kind") != kind:
+            continue
+        stats.append({
+            "kind": label_map.get("kind"),
+            "operation": label_map.get("operation"),
+            "count": histogram.count,
+            "total": histogram.total,
+            "avg": histogram.total / histogram.count if histogram.count else 0.0,
+            "p95": histogram.quantile(0.95),
+            "max": histogram.max,
+            "errors": int(metrics.counter_value(ERROR_METRIC, **label_map)),
+        })
+    return sorted(stats, key=lambda stat: stat["total"], reverse=True)
@@ -0,0 +1,101 @@
+import discord
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from src.services.instrumentation import track
+
+CUSTOM_ID_PREFIX = "bm"
+
+RouteHandler = Callable[[discord.Interaction, List[str]], Awaitable[None]]
+LegacyResolver = Callable[[discord.Interaction], Awaitable[Optional[List[str]]]]
+
+def routed_id(scope: str, action: str, *args) -> str:
+    return ":".join([CUSTOM_ID_PREFIX, scope, action, *(str(arg) for arg in args)])
+
+def parse_routed_id(custom_id: str) -> Optional[Tuple[str, str, List[str]]]:
+    parts = custom_id.split(":")
+    if len(parts) < 3 or parts[0] != CUSTOM_ID_PREFIX:
+        return None
+    return parts[1], parts[2], parts[3:]
+
+class InteractionRouter:
+    # Buttons on long-lived messages carry their state in the custom_id
+    # (bm:<scope>:<action>:<args...>) and are answered here instead of by a
+    # View kept in memory, so they keep working across restarts.
+    def __init__(self):
+        self.routes: Dict[Tuple[str, str], RouteHandler] = {}
+        self.legacy: Dict[str, Tuple[str, str, Optional[LegacyResolver]]] = {}
+    
+    def attach(self, bot: discord.Client):
+        bot.add_listener(self.on_interaction, "on_interaction")
+    
+    def register(self, scope: str, action: str, handler: RouteHandler,
+                 legacy_ids: Tuple[str, ...] = (), resolver: LegacyResolver = None):
+        self.routes[(scope, action)] = handler
+        for custom_id in legacy_ids:
+            self.legacy[custom_id] = (scope, action, resolver)
+    
+    def unregister(self, owner):
+        removed = [key for key, handler in self.routes.items() if getattr(handler, "__self__", None) is owner]
+        for key in removed:
+            del self.routes[key]
+        for custom_id, (scope, action, _) in list(self.legacy.items()):
+            if (scope, action) in removed:
+                del self.legacy[custom_id]
+    
+    def action_of(self, custom_id: Optional[str]) -> Optional[Tuple[str, str]]:
+        if not custom_id:
+            return None
+        route = parse_routed_id(custom_id)
+        if route:
+            return route[0], route[1]
+        if custom_id in self.legacy:
+            scope, action, _ = self.legacy[custom_id]
+            return scope, action
+        return None
+    
+    async def on_interaction(self, interaction: discord.Interaction):
+        if interaction.type != discord.InteractionType.component:
+            return
+        
+        custom_id = (interaction.data or {}).get("custom_id")
+        if not custom_id:
+            return
+        
+        route = parse_routed_id(custom_id)
+        if route:
+            scope, action, args = route
+        elif custom_id in self.legacy:
+            # Messages sent before routed ids existed: rebuild the arguments
+            # from the message or the channel's ticket.
+            scope, action, resolver = self.legacy[custom_id]
+            args = await resolver(interaction) if resolver else []
+            if args is None:
+                await interaction.response.send_message("This button is no longer active.", ephemeral=True)
+                return
+        else:
+            return
+        
+        handler = self.routes.get((scope, action))
+        if handler is None:
+            return
+        
+        try:
+            with track(f"{scope}.{action}", "view"):
+                await handler(interaction, args)
+        except Exception as e:
+            print(f"Error handling button {custom_id}: {e}")
+            try:
+                if not interaction.response.is_done():
+                    await interaction.response.send_message("Something went wrong, please try again.", ephemeral=True)
+            except:
+                pass
+
+async def order_id_from_message(interaction: discord.Interaction) -> Optional[List[str]]:
+    message = interaction.message
+    for embed in message.embeds if message else []:
+        for embed_field in embed.fields:
+            if "Order ID" in embed_field.name:
+                return [embed_field.value.strip("*| ")]
+    return None
+
+interaction_router = InteractionRouter()
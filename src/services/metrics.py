@@ -0,0 +1,129 @@
+from typing import Callable, Dict, List, Tuple
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+def _format_labels(labels: Tuple[Tuple[str, str], ...]) -> str:
+    if not labels:
+        return ""
+    parts = []
+    for key, value in labels:
+        value = str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        parts.append(f'{key}="{value}"')
+    return "{" + ",".join(parts) + "}"
+
+class Histogram:
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.bucket_counts = [0] * len(buckets)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+    
+    def observe(self, value: float):
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.bucket_counts[i] += 1
+                break
+    
+    def quantile(self, q: float) -> float:
+        # Upper bound of the bucket holding the q-th observation, which is
+        # as precise as fixed buckets allow.
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        seen = 0
+        for bound, bucket_count in zip(self.buckets, self.bucket_counts):
+            seen += bucket_count
+            if seen >= target:
+                return min(bound, self.max)
+        return self.max
+
+class MetricsRegistry:
+    def __init__(self):
+        self.help: Dict[str, str] = {}
+        self.counters: Dict[str, Dict[Tuple, float]] = {}
+        self.histograms: Dict[str, Dict[Tuple, Histogram]] = {}
+        self.gauges: Dict[str, Callable[[], float]] = {}
+        self.queues: Dict[str, Callable[[], int]] = {}
+    
+    def inc(self, name: str, value: float = 1, help_text: str = None, **labels):
+        if help_text:
+            self.help.setdefault(name, help_text)
+        series = self.counters.setdefault(name, {})
+        key = tuple(sorted(labels.items()))
+        series[key] = series.get(key, 0) + value
+    
+    def observe(self, name: str, value: float, help_text: str = None, **labels):
+        if help_text:
+            self.help.setdefault(name, help_text)
+        series = self.histograms.setdefault(name, {})
+        key = tuple(sorted(labels.items()))
+        histogram = series.get(key)
+        if histogram is None:
+            histogram = series[key] = Histogram()
+        histogram.observe(value)
+    
+    def histogram_series(self, name: str) -> Dict[Tuple, Histogram]:
+        return self.histograms.get(name, {})
+    
+    def counter_value(self, name: str, **labels) -> float:
+        return self.counters.get(name, {}).get(tuple(sorted(labels.items())), 0)
+    
+    def register_gauge(self, name: str, help_text: str, provider: Callable[[], float]):
+        self.help[name] = help_text
+        self.gauges[name] = provider
+    
+    def register_queue(self, name: str, provider: Callable[[], int]):
+        self.queues[name] = provider
+    
+    def queue_depths(self) -> Dict[str, int]:
+        depths = {}
+        for name, provider in self.queues.items():
+            try:
+                depths[name] = int(provider())
+            except Exception:
+                depths[name] = -1
+        return depths
+    
+    def render_prometheus(self) -> str:
+        lines: List[str] = []
+        
+        for name, provider in self.gauges.items():
+            try:
+                value = float(provider())
+            except Exception:
+                continue
+            lines.append(f"# HELP {name} {self.help.get(name, name)}")
+            lines.append(f"# TYPE {name} gauge")
+            lines.append(f"{name} {value}")
+        
+        if self.queues:
+            lines.append("# HELP bm_queue_depth Items waiting in in-process queues")
+            lines.append("# TYPE bm_queue_depth gauge")
+            for queue, depth in self.queue_depths().items():
+                lines.append(f"bm_queue_depth{_format_labels((('queue', queue),))} {depth}")
+        
+        for name, series in self.counters.items():
+            lines.append(f"# HELP {name} {self.help.get(name, name)}")
+            lines.append(f"# TYPE {name} counter")
+            for labels, value in series.items():
+                lines.append(f"{name}{_format_labels(labels)} {value}")
+        
+        for name, series in self.histograms.items():
+            lines.append(f"# HELP {name} {self.help.get(name, name)}")
+            lines.append(f"# TYPE {name} histogram")
+            for labels, histogram in series.items():
+                cumulative = 0
+                for bound, bucket_count in zip(histogram.buckets, histogram.bucket_counts):
+                    cumulative += bucket_count
+                    lines.append(f"{name}_bucket{_format_labels(labels + (('le', bound),))} {cumulative}")
+                lines.append(f"{name}_bucket{_format_labels(labels + (('le', '+Inf'),))} {histogram.count}")
+                lines.append(f"{name}_sum{_format_labels(labels)} {histogram.total}")
+                lines.append(f"{name}_count{_format_labels(labels)} {histogram.count}")
+        
+        return "\n".join(lines) + "\n"
+
+metrics = MetricsRegistry()
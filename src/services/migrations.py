@@ -0,0 +1,160 @@
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+from typing import Callable, List, Optional
+
+from src.models.database import Base, BotState, NotificationOutbox, get_async_engine
+
+# Arbitrary key for pg_advisory_lock so only one process migrates at a time.
+MIGRATION_LOCK_KEY = 804_121_337
+
+class Migration:
+    def __init__(self, version: int, name: str, statements: List[str] = None,
+                 run_sync: Callable = None, concurrent: bool = False):
+        self.version = version
+        self.name = name
+        self.statements = statements or []
+        self.run_sync = run_sync
+        # Concurrent migrations run outside a transaction (required by
+        # CREATE/DROP INDEX CONCURRENTLY) so they never lock hot tables.
+        self.concurrent = concurrent
+    
+    async def apply(self, conn: AsyncConnection):
+        if self.run_sync:
+            await conn.run_sync(self.run_sync)
+        for statement in self.statements:
+            await conn.execute(text(statement))
+
+class ConcurrentIndex(Migration):
+    def __init__(self, version: int, name: str, index_name: str, table: str,
+                 columns: List[str], unique: bool = False, where: str = None):
+        super().__init__(version, name, concurrent=True)
+        self.index_name = index_name
+        self.table = table
+        self.columns = columns
+        self.unique = unique
+        self.where = where
+    
+    async def apply(self, conn: AsyncConnection):
+        # A failed CONCURRENTLY build leaves an INVALID index behind that
+        # IF NOT EXISTS would happily skip, so clear it out first.
+        result = await conn.execute(
+            text(
+                "SELECT i.indisvalid FROM pg_index i "
+                "JOIN pg_class c ON c.oid = i.indexrelid WHERE c.relname = :name"
+            ),
+            {"name": self.index_name}
+        )
+        valid = result.scalar()
+        if valid is False:
+            await conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {self.index_name}"))
+        
+        unique = "UNIQUE " if self.unique else ""
+        statement = (
+            f"CREATE {unique}INDEX CONCURRENTLY IF NOT EXISTS {self.index_name} "
+            f"ON {self.table} ({', '.join(self.columns)})"
+        )
+        if self.where:
+            statement += f" WHERE {self.where}"
+        await conn.execute(text(statement))
+
+# Models describe the final schema, so a fresh database gets everything from
+# the baseline create_all and the later steps are no-ops there. Existing
+# databases are brought forward by the later steps. Never edit or reorder a
+# released migration; append a new one instead.
+MIGRATIONS: List[Migration] = [
+    Migration(1, "baseline schema", run_sync=Base.metadata.create_all),
+    ConcurrentIndex(2, "index tickets by channel", "ix_tickets_channel_id", "tickets", ["channel_id"]),
+    ConcurrentIndex(
+        3, "composite user key", "uq_users_discord_guild", "users",
+        ["discord_id", "guild_id"], unique=True
+    ),
+    Migration(
+        4, "drop global discord_id uniqueness",
+        [
+            "DROP INDEX CONCURRENTLY IF EXISTS ix_users_discord_id",
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_users_discord_id ON users (discord_id)",
+        ],
+        concurrent=True
+    ),
+    Migration(
+        5, "bot state table",
+        run_sync=lambda conn: Base.metadata.create_all(conn, tables=[BotState.__table__])
+    ),
+    Migration(
+        6, "order number sequence",
+        [
+            "CREATE SEQUENCE IF NOT EXISTS bm_order_number_seq START WITH 10000",
+            # Skip past any numeric BM ids already issued (including the old
+            # timestamp fallback ids) so the sequence can never hand one out again.
+            "SELECT setval('bm_order_number_seq', GREATEST(10000, COALESCE("
+            "(SELECT MAX(CAST(substring(order_id FROM 4) AS BIGINT)) FROM orders "
+            "WHERE order_id ~ '^BM-[0-9]+$'), 0) + 1), false)",
+        ]
+    ),
+    Migration(
+        7, "notification outbox",
+        run_sync=lambda conn: Base.metadata.create_all(conn, tables=[NotificationOutbox.__table__])
+    ),
+    Migration(
+        8, "outbox guild for shard partitioning",
+        [
+            "ALTER TABLE notification_outbox ADD COLUMN IF NOT EXISTS guild_id BIGINT",
+            "CREATE INDEX IF NOT EXISTS ix_notification_outbox_guild_id ON notification_outbox (guild_id)",
+        ]
+    ),
+    ConcurrentIndex(
+        9, "index open tickets per user", "ix_tickets_user_open", "tickets",
+        ["user_id", "guild_id"], where="status IN ('OPEN', 'IN_PROGRESS', 'PENDING')"
+    ),
+    ConcurrentIndex(
+        10, "index ticket messages by ticket", "ix_ticket_messages_ticket_id", "ticket_messages", ["ticket_id"]
+    ),
+    ConcurrentIndex(
+        11, "index open tickets by activity", "ix_tickets_open_updated_at", "tickets",
+        ["updated_at"], where="status IN ('OPEN', 'IN_PROGRESS', 'PENDING')"
+    ),
+]
+
+async def get_applied_versions(conn: AsyncConnection) -> set:
+    result = await conn.execute(text("SELECT version FROM schema_migrations"))
+    return {row[0] for row in result}
+
+async def run_migrations(target_version: Optional[int] = None) -> List[int]:
+    engine = await get_async_engine()
+    applied_now = []
+    
+    async with engine.connect() as lock_conn:
+        lock_conn = await lock_conn.execution_options(isolation_level="AUTOCOMMIT")
+        await lock_conn.execute(text("SELECT pg_advisory_lock(:key)"), {"key": MIGRATION_LOCK_KEY})
+        try:
+            await lock_conn.execute(text(
+                "CREATE TABLE IF NOT EXISTS schema_migrations ("
+                "version INTEGER PRIMARY KEY, "
+                "name VARCHAR(255) NOT NULL, "
+                "applied_at TIMESTAMP NOT NULL DEFAULT (now() at time zone 'utc'))"
+            ))
+            applied = await get_applied_versions(lock_conn)
+            
+            for migration in sorted(MIGRATIONS, key=lambda m: m.version):
+                if migration.version in applied:
+                    continue
+                if target_version is not None and migration.version > target_version:
+                    break
+                
+                record = text("INSERT INTO schema_migrations (version, name) VALUES (:version, :name)")
+                params = {"version": migration.version, "name": migration.name}
+                
+                if migration.concurrent:
+                    await migration.apply(lock_conn)
+                    await lock_conn.execute(record, params)
+                else:
+                    async with engine.begin() as conn:
+                        await migration.apply(conn)
+                        await conn.execute(record, params)
+                
+                applied_now.append(migration.version)
+                print(f"Applied migration {migration.version}: {migration.name}")
+        finally:
+            await lock_conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": MIGRATION_LOCK_KEY})
+    
+    return applied_now
@@ -0,0 +1,128 @@
+import discord
+import asyncio
+from datetime import datetime, timedelta
+from typing import Dict, Tuple
+
+from src.services.database import db_service
+from src.services.metrics import metrics
+from src.config import Config
+
+class PendingNotification:
+    def __init__(self, row_id: int, channel_id: int, coalesce_key: str, payload: Dict,
+                 send_after: datetime, attempts: int = 0):
+        self.row_id = row_id
+        self.channel_id = channel_id
+        self.coalesce_key = coalesce_key
+        self.payload = payload
+        self.send_after = send_after
+        self.attempts = attempts
+
+class NotificationOutbox:
+    def __init__(self):
+        self.bot = None
+        self.pending: Dict[Tuple[int, str], PendingNotification] = {}
+        self.lock = asyncio.Lock()
+        self.task = None
+        metrics.register_queue("order_notifications", lambda: len(self.pending))
+    
+    async def start(self, bot: discord.Client):
+        self.bot = bot
+        for row in await db_service.get_outbox_items():
+            # Rows left behind by a restart; if several share a key only the
+            # newest is still worth posting.
+            key = (row.channel_id, row.coalesce_key)
+            stale = self.pending.get(key)
+            if stale:
+                await db_service.delete_outbox_items([stale.row_id])
+            self.pending[key] = PendingNotification(
+                row.id, row.channel_id, row.coalesce_key, row.payload, row.send_after, row.attempts or 0
+            )
+        if self.pending:
+            print(f"Requeued {len(self.pending)} unsent order notifications")
+        self.task = asyncio.create_task(self.run())
+    
+    async def stop(self):
+        if self.task:
+            self.task.cancel()
+            self.task = None
+    
+    async def enqueue(self, channel_id: int, coalesce_key: str, embed: discord.Embed):
+        if not channel_id:
+            return
+        
+        payload = embed.to_dict()
+        key = (channel_id, coalesce_key)
+        async with self.lock:
+            item = self.pending.get(key)
+            if item:
+                # Another update for the same order is still waiting: replace
+                # it so the channel only gets the latest state.
+                item.payload = payload
+                await db_service.update_outbox_item(item.row_id, payload=payload)
+                metrics.inc("bm_notifications_coalesced_total", help_text="Order notifications merged into a pending one")
+                return
+            
+            send_after = datetime.utcnow() + timedelta(seconds=Config.ORDER_NOTIFY_WINDOW_SECONDS)
+            channel = self.bot.get_channel(channel_id) if self.bot else None
+            guild_id = channel.guild.id if getattr(channel, "guild", None) else None
+            row_id = await db_service.add_outbox_item(channel_id, coalesce_key, payload, send_after, guild_id)
+            self.pending[key] = PendingNotification(row_id, channel_id, coalesce_key, payload, send_after)
+    
+    async def run(self):
+        await self.bot.wait_until_ready()
+        semaphore = asyncio.Semaphore(max(1, Config.ORDER_NOTIFY_CONCURRENCY))
+        while not self.bot.is_closed():
+            try:
+                await self.flush_due(semaphore)
+            except Exception as e:
+                print(f"Error flushing order notifications: {e}")
+            await asyncio.sleep(1)
+    
+    async def flush_due(self, semaphore: asyncio.Semaphore):
+        now = datetime.utcnow()
+        async with self.lock:
+            due = [item for item in self.pending.values() if item.send_after <= now]
+            for item in due:
+                del self.pending[(item.channel_id, item.coalesce_key)]
+        if not due:
+            return
+        
+        results = await asyncio.gather(*(self.deliver(item, semaphore) for item in due))
+        finished = [item.row_id for item, done in zip(due, results) if done]
+        await db_service.delete_outbox_items(finished)
+        
+        async with self.lock:
+            for item, done in zip(due, results):
+                if done:
+                    continue
+                key = (item.channel_id, item.coalesce_key)
+                if key in self.pending:
+                    # A newer update arrived while this one was in flight.
+                    await db_service.delete_outbox_items([item.row_id])
+                    continue
+                self.pending[key] = item
+                await db_service.update_outbox_item(
+                    item.row_id, attempts=item.attempts, send_after=item.send_after
+                )
+    
+    async def deliver(self, item: PendingNotification, semaphore: asyncio.Semaphore) -> bool:
+        channel = self.bot.get_channel(item.channel_id)
+        if channel is None:
+            print(f"Dropping order notification {item.coalesce_key}: channel {item.channel_id} not found")
+            return True
+        
+        async with semaphore:
+            try:
+                await channel.send(embed=discord.Embed.from_dict(item.payload))
+                metrics.inc("bm_notifications_sent_total", help_text="Order notifications posted")
+                return True
+            except Exception as e:
+                item.attempts += 1
+                if item.attempts >= Config.ORDER_NOTIFY_MAX_ATTEMPTS:
+                    print(f"Giving up on order notification {item.coalesce_key} after {item.attempts} attempts: {e}")
+                    return True
+                item.send_after = datetime.utcnow() + timedelta(seconds=2 ** item.attempts * 5)
+                print(f"Order notification {item.coalesce_key} failed (attempt {item.attempts}): {e}")
+                return False
+
+notification_outbox = NotificationOutbox()
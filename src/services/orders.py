@@ -0,0 +1,205 @@
+from sqlalchemy import select, update, insert, func
+from sqlalchemy.orm import selectinload
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from src.models.database import User, Ticket, Order, OrderItem, OrderEvent, OrderStatus
+from src.services.database import db_service
+from src.services.instrumentation import instrument_class
+
+class OrderPlacementService:
+    async def upsert_user_id(self, session, discord_id: int, guild_id: int,
+                             username: str = None, display_name: str = None) -> int:
+        statement = pg_insert(User).values(
+            discord_id=discord_id,
+            guild_id=guild_id,
+            username=username,
+            display_name=display_name
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=[User.discord_id, User.guild_id],
+            set_={
+                "last_active": datetime.utcnow(),
+                "username": func.coalesce(statement.excluded.username, User.username),
+                "display_name": func.coalesce(statement.excluded.display_name, User.display_name),
+            }
+        ).returning(User.id)
+        result = await session.execute(statement)
+        return result.scalar_one()
+    
+    async def place_order(self, guild_id: int, discord_id: int, items: List[Dict],
+                          username: str = None, display_name: str = None,
+                          ticket: Optional[Ticket] = None, channel_id: int = None,
+                          notes: str = None, product_name: str = None, customer_imvu: str = None,
+                          ticket_extra: Dict = None, order_id: str = None) -> Order:
+        order_id = order_id or await db_service.generate_unique_bm_order_id()
+        
+        async with db_service.session_factory() as session:
+            async with session.begin():
+                user_id = await self.upsert_user_id(session, discord_id, guild_id, username, display_name)
+                
+                order_items = [
+                    OrderItem(
+                        product_id=item.get("product_id"),
+                        product_name=item.get("name", "Unknown"),
+                        quantity=item.get("quantity", 1),
+                        unit_price=item.get("price", 0.0),
+                        total_price=item.get("price", 0.0) * item.get("quantity", 1),
+                        notes=item.get("notes")
+                    )
+                    for item in items
+                ]
+                order = Order(
+                    order_id=order_id,
+                    guild_id=guild_id,
+                    user_id=user_id,
+                    ticket_id=ticket.id if ticket else None,
+                    channel_id=channel_id,
+                    notes=notes,
+                    product_name=product_name,
+                    customer_imvu=customer_imvu,
+                    total_amount=sum(item.total_price for item in order_items),
+                    items=order_items,
+                    events=[OrderEvent(event_type="created", description="Order created")]
+                )
+                session.add(order)
+                
+                if ticket and ticket_extra is not None:
+                    await session.execute(
+                        update(Ticket).where(Ticket.id == ticket.id).values(extra_data=ticket_extra)
+                    )
+        
+        return order
+
+ALLOWED_TRANSITIONS = {
+    OrderStatus.PENDING: {OrderStatus.CONFIRMED, OrderStatus.PROCESSING, OrderStatus.SHIPPED,
+                          OrderStatus.DELIVERED, OrderStatus.CANCELLED},
+    OrderStatus.CONFIRMED: {OrderStatus.PROCESSING, OrderStatus.SHIPPED, OrderStatus.DELIVERED,
+                            OrderStatus.CANCELLED, OrderStatus.REFUNDED},
+    OrderStatus.PROCESSING: {OrderStatus.SHIPPED, OrderStatus.DELIVERED, OrderStatus.CANCELLED,
+                             OrderStatus.REFUNDED},
+    OrderStatus.SHIPPED: {OrderStatus.DELIVERED, OrderStatus.REFUNDED},
+    OrderStatus.DELIVERED: {OrderStatus.REFUNDED},
+    OrderStatus.CANCELLED: {OrderStatus.PENDING, OrderStatus.CONFIRMED},
+    OrderStatus.REFUNDED: set(),
+}
+# Orders that can still have their tracking number changed without a status
+# change, e.g. /settracking on an order that is already shipped or delivered.
+TRACKING_STATUSES = {OrderStatus.SHIPPED, OrderStatus.DELIVERED}
+
+def can_transition(current: OrderStatus, target: OrderStatus) -> bool:
+    return target in ALLOWED_TRANSITIONS.get(current, set())
+
+class TransitionResult:
+    def __init__(self):
+        self.updated: List[Order] = []
+        self.skipped: Dict[str, str] = {}
+        # Orders matching the filters vs. how many were looked at; they
+        # differ when the limit cut the batch short.
+        self.matched = 0
+        self.processed = 0
+
+class OrderTransitionService:
+    async def transition(self, status: OrderStatus, order_ids: List[str] = None, guild_id: int = None,
+                         from_status: OrderStatus = None, staff_id: int = None,
+                         tracking_number: str = None, limit: int = 500) -> TransitionResult:
+        outcome = TransitionResult()
+        now = datetime.utcnow()
+        
+        filters = []
+        if order_ids is not None:
+            filters.append(Order.order_id.in_(order_ids))
+        if guild_id is not None:
+            filters.append(Order.guild_id == guild_id)
+        if from_status is not None:
+            filters.append(Order.status == from_status)
+        query = select(Order.id, Order.order_id, Order.status).where(*filters)
+        query = query.order_by(Order.id).limit(limit).with_for_update()
+        
+        async with db_service.session_factory() as session:
+            async with session.begin():
+                rows = (await session.execute(query)).all()
+                outcome.processed = len(rows)
+                outcome.matched = len(rows)
+                if len(rows) >= limit:
+                    outcome.matched = (await session.execute(
+                        select(func.count()).select_from(Order).where(*filters)
+                    )).scalar_one()
+                found = {row.order_id for row in rows}
+                for order_id in order_ids or []:
+                    if order_id not in found:
+                        outcome.skipped[order_id] = "not found"
+                
+                eligible = []
+                tracked = []
+                for row in rows:
+                    if can_transition(row.status, status):
+                        eligible.append(row)
+                    elif tracking_number and row.status in TRACKING_STATUSES:
+                        tracked.append(row)
+                    elif row.status == status:
+                        outcome.skipped[row.order_id] = f"already {status.value}"
+                    else:
+                        outcome.skipped[row.order_id] = f"can't go from {row.status.value} to {status.value}"
+                
+                if not eligible and not tracked:
+                    return outcome
+                
+                events = []
+                if eligible:
+                    values = {"status": status, "updated_at": now}
+                    if tracking_number:
+                        values["tracking_number"] = tracking_number
+                    if status == OrderStatus.DELIVERED:
+                        values["completed_at"] = now
+                    await session.execute(
+                        update(Order).where(Order.id.in_([row.id for row in eligible])).values(**values),
+                        execution_options={"synchronize_session": False}
+                    )
+                    events += [
+                        {
+                            "order_id": row.id,
+                            "event_type": "status_change",
+                            "description": f"Status changed from {row.status.value} to {status.value}",
+                            "created_by": staff_id,
+                            "created_at": now,
+                            "extra_data": {"old_status": row.status.value, "new_status": status.value},
+                        }
+                        for row in eligible
+                    ]
+                
+                if tracked:
+                    # Tracking-only: the status (and completed_at) stay as they are.
+                    await session.execute(
+                        update(Order).where(Order.id.in_([row.id for row in tracked]))
+                        .values(tracking_number=tracking_number, updated_at=now),
+                        execution_options={"synchronize_session": False}
+                    )
+                    events += [
+                        {
+                            "order_id": row.id,
+                            "event_type": "tracking_update",
+                            "description": f"Tracking number set to {tracking_number}",
+                            "created_by": staff_id,
+                            "created_at": now,
+                            "extra_data": {"tracking_number": tracking_number},
+                        }
+                        for row in tracked
+                    ]
+                
+                await session.execute(insert(OrderEvent), events)
+                
+                ids = [row.id for row in eligible + tracked]
+                result = await session.execute(
+                    select(Order).options(selectinload(Order.user)).where(Order.id.in_(ids))
+                )
+                outcome.updated = list(result.scalars().all())
+        
+        return outcome
+
+instrument_class(OrderPlacementService, "db", "orders", exclude=("upsert_user_id",))
+instrument_class(OrderTransitionService, "db", "order_transitions")
+
+order_placement = OrderPlacementService()
+order_transitions = OrderTransitionService()
@@ -0,0 +1,127 @@
+import re
+import time
+from collections import Counter, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, List, Optional
+
+from sqlalchemy import event
+
+from src.services.metrics import metrics
+from src.config import Config
+
+_current_profile: ContextVar = ContextVar("bm_query_profile", default=None)
+
+recent_profiles = deque(maxlen=100)
+
+_PLACEHOLDER_LIST = re.compile(r"\?(\s*,\s*\?)+")
+_PLACEHOLDER = re.compile(r"\$\d+")
+_WHITESPACE = re.compile(r"\s+")
+
+def normalize_statement(statement: str) -> str:
+    statement = _PLACEHOLDER.sub("?", statement)
+    statement = _PLACEHOLDER_LIST.sub("?", statement)
+    return _WHITESPACE.sub(" ", statement).strip()
+
+class QueryProfile:
+    def __init__(self, scope: str):
+        self.scope = scope
+        self.started_at = time.perf_counter()
+        self.elapsed = 0.0
+        self.statements = Counter()
+        self.statement_count = 0
+        self.db_time = 0.0
+        self.token = None
+        self.finished = False
+    
+    def record(self, statement: str, duration: float):
+        self.statements[normalize_statement(statement)] += 1
+        self.statement_count += 1
+        self.db_time += duration
+    
+    def repeated_statements(self) -> List[tuple]:
+        # The same SELECT issued over and over inside one invocation is the
+        # signature of a lazy-load or per-row lookup loop.
+        return [
+            (statement, count) for statement, count in self.statements.most_common()
+            if count >= Config.SQL_PROFILE_N_PLUS_ONE and statement.upper().startswith("SELECT")
+        ]
+    
+    def summary(self) -> Dict:
+        return {
+            "scope": self.scope,
+            "statements": self.statement_count,
+            "distinct": len(self.statements),
+            "db_ms": self.db_time * 1000,
+            "elapsed_ms": self.elapsed * 1000,
+            "n_plus_one": self.repeated_statements(),
+        }
+
+def current_profile() -> Optional[QueryProfile]:
+    return _current_profile.get()
+
+def start_profile(scope: str) -> Optional[QueryProfile]:
+    if not Config.SQL_PROFILE or _current_profile.get() is not None:
+        return None
+    profile = QueryProfile(scope)
+    profile.token = _current_profile.set(profile)
+    return profile
+
+def finish_profile(profile: Optional[QueryProfile]):
+    if profile is None or profile.finished:
+        return
+    profile.finished = True
+    profile.elapsed = time.perf_counter() - profile.started_at
+    try:
+        _current_profile.reset(profile.token)
+    except ValueError:
+        # Finished from another task (e.g. the app command completion
+        # event); the originating task's context ends with it.
+        pass
+    
+    if not profile.statement_count:
+        return
+    
+    summary = profile.summary()
+    recent_profiles.append(summary)
+    metrics.inc("bm_sql_statements_total", profile.statement_count,
+                help_text="SQL statements issued, by invoking command/listener/view", scope=profile.scope)
+    metrics.inc("bm_sql_time_seconds_total", profile.db_time,
+                help_text="Time spent executing SQL, by invoking command/listener/view", scope=profile.scope)
+    
+    print(f"[sql] {profile.scope}: {summary['statements']} statements "
+          f"({summary['distinct']} distinct), {summary['db_ms']:.1f}ms DB / {summary['elapsed_ms']:.1f}ms total")
+    for statement, count in summary["n_plus_one"]:
+        metrics.inc("bm_sql_n_plus_one_total", help_text="Invocations repeating the same SELECT",
+                    scope=profile.scope)
+        print(f"[sql]   possible N+1 x{count}: {statement[:200]}")
+
+@contextmanager
+def profile_scope(scope: str):
+    profile = start_profile(scope)
+    try:
+        yield profile
+    finally:
+        finish_profile(profile)
+
+def install_query_profiler(engine):
+    sync_engine = engine.sync_engine
+    
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("bm_query_start", []).append(time.perf_counter())
+    
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        duration = time.perf_counter() - conn.info["bm_query_start"].pop()
+        profile = _current_profile.get()
+        if profile is not None:
+            profile.record(statement, duration)
+    
+    @event.listens_for(sync_engine, "handle_error")
+    def handle_error(exception_context):
+        conn = exception_context.connection
+        if conn is not None and conn.info.get("bm_query_start"):
+            conn.info["bm_query_start"].pop()
+    
+    print("SQL query profiler enabled")
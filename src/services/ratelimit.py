@@ -0,0 +1,91 @@
+import discord
+import time
+from typing import Dict, Tuple
+
+from src.services.metrics import metrics
+
+# Default budgets as (burst, seconds to refill the burst). A guild can
+# override any of them under GuildSettings.settings, e.g.
+# settings["auto_reply_limits"] = {"user": [3, 60]}.
+DEFAULT_BUDGETS: Dict[str, Tuple[float, float]] = {
+    "user": (5, 30),
+    "channel": (20, 60),
+    "guild": (300, 60),
+}
+# Looser budgets for every message entering the pipeline, checked before any
+# database work. Overridden with settings["message_limits"].
+DEFAULT_INPUT_BUDGETS: Dict[str, Tuple[float, float]] = {
+    "user": (20, 60),
+    "channel": (60, 60),
+    "guild": (600, 60),
+}
+PRUNE_EVERY = 1000
+
+class TokenBucket:
+    def __init__(self, capacity: float, seconds: float):
+        self.capacity = capacity
+        self.seconds = seconds
+        self.rate = capacity / seconds if seconds > 0 else float("inf")
+        self.tokens = capacity
+        self.updated = time.monotonic()
+    
+    def refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+class AutoReplyLimiter:
+    # Token buckets per user, channel and guild. A message (or reply) only
+    # passes, and is charged, when all three buckets have a token.
+    def __init__(self, name: str, defaults: Dict[str, Tuple[float, float]] = None,
+                 setting: str = "auto_reply_limits"):
+        self.name = name
+        self.defaults = defaults or DEFAULT_BUDGETS
+        self.setting = setting
+        self.buckets: Dict[Tuple[str, int], TokenBucket] = {}
+        self.checks = 0
+    
+    def budgets(self, settings) -> Dict[str, Tuple[float, float]]:
+        overrides = ((settings.settings or {}) if settings else {}).get(self.setting) or {}
+        budgets = dict(self.defaults)
+        for scope, budget in overrides.items():
+            if scope in budgets:
+                try:
+                    budgets[scope] = (float(budget[0]), float(budget[1]))
+                except (TypeError, ValueError, IndexError):
+                    pass
+        return budgets
+    
+    def bucket(self, scope: str, key: int, budget: Tuple[float, float]) -> TokenBucket:
+        bucket = self.buckets.get((scope, key))
+        if bucket is None or (bucket.capacity, bucket.seconds) != budget:
+            bucket = self.buckets[(scope, key)] = TokenBucket(*budget)
+        return bucket
+    
+    def allow(self, message: discord.Message, settings) -> bool:
+        now = time.monotonic()
+        self.checks += 1
+        if self.checks % PRUNE_EVERY == 0:
+            self.prune(now)
+        
+        budgets = self.budgets(settings)
+        keys = {"user": message.author.id, "channel": message.channel.id, "guild": message.guild.id}
+        buckets = []
+        for scope, key in keys.items():
+            bucket = self.bucket(scope, key, budgets[scope])
+            bucket.refill(now)
+            if bucket.tokens < 1:
+                metrics.inc("bm_auto_replies_limited_total", help_text="Messages skipped by the auto-reply rate limiter",
+                            limiter=self.name, scope=scope)
+                return False
+            buckets.append(bucket)
+        
+        for bucket in buckets:
+            bucket.tokens -= 1
+        return True
+    
+    def prune(self, now: float):
+        # Full buckets behave exactly like new ones, so they can go.
+        for key, bucket in list(self.buckets.items()):
+            bucket.refill(now)
+            if bucket.tokens >= bucket.capacity:
+                del self.buckets[key]
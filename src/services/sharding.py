@@ -0,0 +1,55 @@
+from typing import List, Optional
+
+from sqlalchemy import or_
+
+from src.config import Config
+
+def shard_for(guild_id: int, shard_count: int) -> int:
+    # Discord's own routing: the guild's creation timestamp bits modulo the
+    # shard count.
+    return (guild_id >> 22) % shard_count
+
+class ShardScope:
+    # The guilds this process is responsible for. Without SHARD_IDS one
+    # process owns every shard (AutoShardedBot or a plain Bot), so nothing
+    # is filtered.
+    def __init__(self, shard_count: int = 1, shard_ids: Optional[List[int]] = None):
+        self.shard_count = max(1, shard_count)
+        self.shard_ids = sorted(shard_ids) if shard_ids else None
+    
+    @property
+    def partitioned(self) -> bool:
+        return self.shard_ids is not None and len(self.shard_ids) < self.shard_count
+    
+    @property
+    def owns_unscoped(self) -> bool:
+        # Rows with no guild (outbox items queued before guild_id existed or
+        # for an uncached channel) belong to whichever process runs shard 0.
+        return not self.partitioned or 0 in self.shard_ids
+    
+    def owns(self, guild_id: Optional[int]) -> bool:
+        if not self.partitioned:
+            return True
+        if guild_id is None:
+            return self.owns_unscoped
+        return shard_for(guild_id, self.shard_count) in self.shard_ids
+    
+    def clause(self, column):
+        # Same expression as shard_for, evaluated by Postgres so a process
+        # only loads rows for its own guilds.
+        clause = (column.op(">>")(22) % self.shard_count).in_(self.shard_ids)
+        if self.owns_unscoped:
+            clause = or_(column.is_(None), clause)
+        return clause
+    
+    def apply(self, query, column):
+        if not self.partitioned:
+            return query
+        return query.where(self.clause(column))
+    
+    def describe(self) -> str:
+        if not self.partitioned:
+            return f"all shards ({self.shard_count})"
+        return f"shards {', '.join(map(str, self.shard_ids))} of {self.shard_count}"
+
+shard_scope = ShardScope(Config.SHARD_COUNT, Config.SHARD_IDS)
@@ -0,0 +1,81 @@
+import importlib
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+class StartupReport:
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self.ready_after: Optional[float] = None
+        self.phases: Dict[str, float] = {}
+        self.cogs: Dict[str, Dict] = {}
+    
+    @contextmanager
+    def phase(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + time.perf_counter() - start
+    
+    def record_cog(self, name: str, import_seconds: float, setup_seconds: float = 0.0, error: str = None):
+        self.cogs[name] = {"import": import_seconds, "setup": setup_seconds, "error": error}
+    
+    def mark_ready(self):
+        if self.ready_after is None:
+            self.ready_after = time.perf_counter() - self.started_at
+    
+    def format_lines(self) -> List[str]:
+        lines = []
+        if self.ready_after is not None:
+            lines.append(f"Ready after {self.ready_after * 1000:.0f}ms")
+        for name, seconds in self.phases.items():
+            lines.append(f"{name}: {seconds * 1000:.0f}ms")
+        
+        slowest = sorted(self.cogs.items(), key=lambda item: item[1]["import"] + item[1]["setup"], reverse=True)
+        for name, timings in slowest:
+            short_name = name.rsplit(".", 1)[-1]
+            line = f"  {short_name}: import {timings['import'] * 1000:.0f}ms, setup {timings['setup'] * 1000:.0f}ms"
+            if timings["error"]:
+                line += f" (FAILED: {timings['error']})"
+            lines.append(line)
+        return lines
+    
+    def print_report(self):
+        print("\n=== STARTUP TIMINGS ===")
+        for line in self.format_lines():
+            print(line)
+        print("=======================\n")
+
+startup_report = StartupReport()
+
+async def load_cog(bot, name: str):
+    # Same steps as bot.load_extension (import, then setup()), split so each
+    # half is timed and the module body only runs once. Nothing reloads
+    # cogs, so they aren't registered in bot.extensions; bot.close() still
+    # removes them and runs cog_unload.
+    start = time.perf_counter()
+    try:
+        module = importlib.import_module(name)
+    except Exception as e:
+        startup_report.record_cog(name, time.perf_counter() - start, error=str(e))
+        print(f"Failed to import cog {name}: {e}")
+        return
+    import_seconds = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    try:
+        await module.setup(bot)
+    except Exception as e:
+        startup_report.record_cog(name, import_seconds, time.perf_counter() - start, error=str(e))
+        print(f"Failed to load cog {name}: {e}")
+        return
+    startup_report.record_cog(name, import_seconds, time.perf_counter() - start)
+    print(f"Loaded cog: {name}")
+
+async def load_extensions(bot, names: List[str]):
+    # Sequential on purpose: imports hold the GIL and setup() registers
+    # app commands, which must all be in the tree before the first sync.
+    with startup_report.phase("cogs.load"):
+        for name in names:
+            await load_cog(bot, name)
@@ -0,0 +1,193 @@
+import discord
+import asyncio
+import gzip
+import json
+import os
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from src.services.database import db_service
+from src.services.metrics import metrics
+from src.utils.helpers import is_staff
+from src.config import Config
+
+class TranscriptJob:
+    def __init__(self, channel: discord.TextChannel, ticket, delete_after: Optional[float] = None,
+                 reason: str = None):
+        self.channel = channel
+        self.ticket = ticket
+        # Seconds after the close (not after the export) before the channel
+        # is deleted; None keeps the channel.
+        self.delete_at = time.monotonic() + delete_after if delete_after is not None else None
+        self.reason = reason
+        self.done = asyncio.Event()
+        self.exported = False
+
+class TranscriptArchiver:
+    # Exports a closed ticket's channel history to a gzip JSONL file
+    # (TRANSCRIPT_DIR/<guild>/<ticket id>.jsonl.gz) and mirrors message
+    # metadata into ticket_messages, off the close path. Deletion is timed
+    # separately and only happens after a successful export; channels whose
+    # export failed or was cut short by a restart are kept and picked up
+    # again by recover() on the next start.
+    def __init__(self):
+        self.bot = None
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.task = None
+        self.recovery_task = None
+        self.deletions: Dict[TranscriptJob, asyncio.Task] = {}
+        metrics.register_queue("transcripts", lambda: self.queue.qsize())
+    
+    async def start(self, bot: discord.Client):
+        self.bot = bot
+        self.task = asyncio.create_task(self.run())
+        self.recovery_task = asyncio.create_task(self.recover())
+    
+    async def stop(self):
+        if self.recovery_task:
+            self.recovery_task.cancel()
+            self.recovery_task = None
+        
+        if self.task:
+            try:
+                await asyncio.wait_for(self.queue.join(), timeout=Config.TRANSCRIPT_SHUTDOWN_SECONDS)
+            except asyncio.TimeoutError:
+                print(f"Stopping with {self.queue.qsize()} ticket transcripts unfinished; "
+                      f"their channels are kept until the next start")
+            self.task.cancel()
+            self.task = None
+        
+        # Customers were told these channels are going away, so delete the
+        # ones already archived now rather than after the countdown.
+        pending = list(self.deletions.items())
+        self.deletions.clear()
+        for job, task in pending:
+            task.cancel()
+        await asyncio.gather(*(self.delete(job) for job, task in pending if job.exported))
+    
+    async def recover(self):
+        await self.bot.wait_until_ready()
+        await db_service.wait_until_ready()
+        since = datetime.utcnow() - timedelta(days=Config.TRANSCRIPT_RECOVERY_DAYS)
+        requeued = 0
+        for ticket in await db_service.get_unarchived_closed_tickets(since):
+            channel = self.bot.get_channel(ticket.channel_id)
+            if isinstance(channel, discord.TextChannel):
+                self.archive(channel, ticket, delete_after=0, reason="Ticket closed")
+                requeued += 1
+        if requeued:
+            print(f"Requeued {requeued} closed tickets for transcript export")
+    
+    def archive(self, channel: discord.TextChannel, ticket, delete_after: Optional[float] = None,
+                reason: str = None):
+        job = TranscriptJob(channel, ticket, delete_after, reason)
+        self.queue.put_nowait(job)
+        if job.delete_at is not None:
+            task = asyncio.create_task(self.delete_later(job))
+            self.deletions[job] = task
+            task.add_done_callback(lambda done, job=job: self.deletions.pop(job, None))
+    
+    async def delete_later(self, job: TranscriptJob):
+        await asyncio.sleep(max(0, job.delete_at - time.monotonic()))
+        await job.done.wait()
+        if not job.exported:
+            print(f"Keeping channel {job.channel.id}: transcript for ticket {job.ticket.ticket_id} failed")
+            return
+        await self.delete(job)
+    
+    async def delete(self, job: TranscriptJob):
+        try:
+            await job.channel.delete(reason=job.reason)
+        except discord.NotFound:
+            pass
+        except Exception as e:
+            print(f"Error deleting ticket channel {job.channel.id}: {e}")
+    
+    def path_for(self, ticket) -> str:
+        return os.path.join(Config.TRANSCRIPT_DIR, str(ticket.guild_id), f"{ticket.ticket_id}.jsonl.gz")
+    
+    async def run(self):
+        while True:
+            job = await self.queue.get()
+            try:
+                await self.process(job)
+            except Exception as e:
+                print(f"Error archiving ticket {job.ticket.ticket_id}: {e}")
+                metrics.inc("bm_transcripts_total", help_text="Ticket transcripts exported", result="error")
+            finally:
+                job.done.set()
+                self.queue.task_done()
+    
+    async def process(self, job: TranscriptJob):
+        started = time.perf_counter()
+        count = await self.export(job)
+        metrics.inc("bm_transcripts_total", help_text="Ticket transcripts exported", result="ok")
+        metrics.observe("bm_transcript_seconds", time.perf_counter() - started,
+                        help_text="Time to export a ticket transcript")
+        
+        extra = dict(job.ticket.extra_data or {})
+        extra["transcript"] = {"path": self.path_for(job.ticket), "messages": count,
+                               "archived_at": datetime.utcnow().isoformat()}
+        await db_service.update_ticket_extra_data(job.ticket.ticket_id, extra)
+        job.exported = True
+    
+    async def export(self, job: TranscriptJob) -> int:
+        path = self.path_for(job.ticket)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        partial = f"{path}.part"
+        
+        # A retried close replaces the earlier rows instead of duplicating them.
+        await db_service.clear_ticket_messages(job.ticket.id)
+        
+        count = 0
+        page: List[discord.Message] = []
+        handle = await asyncio.to_thread(gzip.open, partial, "wt", encoding="utf-8")
+        try:
+            async for message in job.channel.history(limit=None, oldest_first=True):
+                page.append(message)
+                if len(page) >= Config.TRANSCRIPT_PAGE_SIZE:
+                    count += await self.write_page(handle, job.ticket, page)
+                    page = []
+            if page:
+                count += await self.write_page(handle, job.ticket, page)
+        except BaseException:
+            handle.close()
+            if os.path.exists(partial):
+                os.remove(partial)
+            raise
+        await asyncio.to_thread(handle.close)
+        
+        os.replace(partial, path)
+        return count
+    
+    async def write_page(self, handle, ticket, page: List[discord.Message]) -> int:
+        lines = []
+        rows = []
+        for message in page:
+            staff = isinstance(message.author, discord.Member) and is_staff(message.author)
+            lines.append(json.dumps({
+                "id": message.id,
+                "author_id": message.author.id,
+                "author": str(message.author),
+                "staff": staff,
+                "bot": message.author.bot,
+                "content": message.content,
+                "created_at": message.created_at.isoformat(),
+                "attachments": [attachment.url for attachment in message.attachments],
+                "embeds": [embed.to_dict() for embed in message.embeds],
+            }, ensure_ascii=False))
+            rows.append({
+                "ticket_id": ticket.id,
+                "discord_message_id": message.id,
+                "author_id": message.author.id,
+                "content": message.content,
+                "is_staff": staff,
+                "created_at": message.created_at.replace(tzinfo=None),
+            })
+        
+        await asyncio.to_thread(handle.write, "\n".join(lines) + "\n")
+        await db_service.add_ticket_messages(rows)
+        return len(page)
+
+transcript_archiver = TranscriptArchiver()
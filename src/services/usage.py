@@ -0,0 +1,57 @@
+import asyncio
+from collections import Counter
+
+from src.services.database import db_service
+from src.services.metrics import metrics
+from src.config import Config
+
+class FAQUsageCounter:
+    # FAQ hits are counted in memory and added to faqs.usage_count in one
+    # batched UPDATE every FAQ_USAGE_FLUSH_SECONDS, and once more on
+    # shutdown.
+    def __init__(self):
+        self.counts: Counter = Counter()
+        self.lock = asyncio.Lock()
+        self.task = None
+        metrics.register_queue("faq_usage", lambda: len(self.counts))
+    
+    def record(self, faq_id: int, n: int = 1):
+        self.counts[faq_id] += n
+    
+    async def start(self):
+        self.task = asyncio.create_task(self.run())
+    
+    async def stop(self):
+        if self.task:
+            self.task.cancel()
+            try:
+                # Let an interrupted flush put its counts back first.
+                await self.task
+            except asyncio.CancelledError:
+                pass
+            self.task = None
+        await self.flush()
+    
+    async def run(self):
+        while True:
+            await asyncio.sleep(Config.FAQ_USAGE_FLUSH_SECONDS)
+            await self.flush()
+    
+    async def flush(self):
+        async with self.lock:
+            if not self.counts:
+                return
+            pending, self.counts = self.counts, Counter()
+            try:
+                await db_service.increment_faq_usage(dict(pending))
+                metrics.inc("bm_faq_usage_flushed_total", sum(pending.values()),
+                            help_text="FAQ hits written to usage_count")
+            except asyncio.CancelledError:
+                self.counts.update(pending)
+                raise
+            except Exception as e:
+                # Keep the hits for the next flush.
+                self.counts.update(pending)
+                print(f"Error flushing FAQ usage counts: {e}")
+
+faq_usage = FAQUsageCounter()
@@ -0,0 +1,144 @@
+import discord
+from datetime import datetime, timezone
+from typing import Dict, List, Sequence, Union
+
+from src.config import Config
+
+WEBSITE_URL = "https://imvublackmarket.xyz/"
+INSTAGRAM_URL = "https://www.instagram.com/imvublackmarket_official"
+
+SUPPORT_FOOTER = "BM Creations Support • Trusted since 2020"
+MARKET_FOOTER = "BM Creations Market | Trusted Since 2020"
+
+COMPLETED_COLOR = 0x00ff00
+PROCESSING_COLOR = 0xffa500
+
+CONNECT_FIELD = {
+    "name": "🌐 Connect With Us",
+    "value": f"🔗 **Website:** [imvublackmarket.xyz]({WEBSITE_URL})\n📸 **Instagram:** [@imvublackmarket_official]({INSTAGRAM_URL})",
+    "inline": False,
+}
+
+def field(name: str, value, inline: bool = True) -> Dict:
+    return {"name": name, "value": str(value), "inline": inline}
+
+def _has_slots(text: str) -> bool:
+    return bool(text) and "{" in text
+
+class EmbedTemplate:
+    # Layout entries are either static field dicts, copied into every embed,
+    # or slot names that fill() replaces with the caller's list of fields.
+    def __init__(self, title: str = None, description: str = None, color: int = Config.EMBED_COLOR,
+                 layout: Sequence[Union[Dict, str]] = ("fields",), footer: str = None,
+                 timestamp: bool = False):
+        self.title = title
+        self.description = description
+        self.color = color
+        self.layout = [dict(entry) if isinstance(entry, dict) else entry for entry in layout]
+        self.footer = footer
+        self.timestamp = timestamp
+        self._title_slots = _has_slots(title)
+        self._description_slots = _has_slots(description)
+    
+    def fill(self, color: int = None, footer: str = None, image_url: str = None, **values) -> discord.Embed:
+        data = {"type": "rich", "color": self.color if color is None else color}
+        if self.title:
+            data["title"] = self.title.format_map(values) if self._title_slots else self.title
+        if self.description:
+            data["description"] = self.description.format_map(values) if self._description_slots else self.description
+        
+        fields: List[Dict] = []
+        for entry in self.layout:
+            if isinstance(entry, str):
+                fields.extend(dict(item) for item in values.get(entry) or ())
+            else:
+                fields.append(dict(entry))
+        data["fields"] = fields
+        
+        footer = footer or self.footer
+        if footer:
+            data["footer"] = {"text": footer.format_map(values) if _has_slots(footer) else footer}
+        if image_url:
+            data["image"] = {"url": image_url}
+        if self.timestamp:
+            data["timestamp"] = datetime.now(timezone.utc).isoformat()
+        return discord.Embed.from_dict(data)
+
+TIMELINE_STAGE = EmbedTemplate(
+    title="{stage}",
+    description="**Order:** {order_id}\n\n**Timeline:**\n{timeline}",
+    layout=(),
+    footer=SUPPORT_FOOTER
+)
+
+ORDER_CREATED = EmbedTemplate(
+    title="🎫 𝐍𝐞𝐰 𝐎𝐫𝐝𝐞𝐫 𝐂𝐫𝐞𝐚𝐭𝐞𝐝",
+    description="A new order has been placed!",
+    footer=SUPPORT_FOOTER
+)
+
+ORDER_RECEIVED_STATUS = EmbedTemplate(
+    title="🎫 𝐍𝐞𝐰 𝐎𝐫𝐝𝐞𝐫 𝐑𝐞𝐜𝐞𝐢𝐯𝐞𝐝",
+    description="Order **{order_id}** has been created!",
+    footer=SUPPORT_FOOTER
+)
+
+ORDER_COMPLETED_TICKET = EmbedTemplate(
+    title="🎉 𝐎𝐫𝐝𝐞𝐫 𝐂𝐨𝐦𝐩𝐥𝐞𝐭𝐞𝐝!",
+    description="Thank you for shopping with **BM Creations Market!**\n\nYour order has been **successfully delivered**! 🚀",
+    color=COMPLETED_COLOR,
+    layout=("fields", CONNECT_FIELD, "ticket_fields"),
+    footer=SUPPORT_FOOTER
+)
+
+ORDER_DELIVERED_STATUS = EmbedTemplate(
+    title="✅ 𝐎𝐫𝐝𝐞𝐫 𝐃𝐞𝐥𝐢𝐯𝐞𝐫𝐞𝐝",
+    description="Order has been **successfully delivered!** 🎉",
+    color=COMPLETED_COLOR,
+    layout=("fields", CONNECT_FIELD),
+    footer=SUPPORT_FOOTER
+)
+
+ORDER_COMPLETED_DM = EmbedTemplate(
+    title="🎉 Your Order is Complete!",
+    description="Your order **{order_id}** has been **successfully delivered!** 🚀\n\nThank you for choosing **BM Creations Market!**",
+    color=COMPLETED_COLOR,
+    layout=(CONNECT_FIELD,),
+    footer=SUPPORT_FOOTER
+)
+
+ORDER_COMPLETED = EmbedTemplate(
+    title="✅ Order Completed!",
+    description="Thank you for shopping with **BM Creations Market!**\n\nYour order has been successfully delivered.",
+    color=Config.SUCCESS_COLOR,
+    layout=("fields", CONNECT_FIELD),
+    footer=MARKET_FOOTER,
+    timestamp=True
+)
+
+ORDER_COMPLETED_NOTICE = EmbedTemplate(
+    title="Order Completed",
+    description="Thank you for shopping with **BM Creations Market!**\nYour order has been successfully delivered.",
+    color=Config.SUCCESS_COLOR,
+    layout=(CONNECT_FIELD, "fields"),
+    footer=SUPPORT_FOOTER,
+    timestamp=True
+)
+
+TRIGGER_PRODUCT = EmbedTemplate(
+    title="{icon} {name}",
+    layout=(
+        "fields",
+        field("🔐 Login Required", "Yes (for uploading)"),
+        field("🏠 Sex Room Required", "**Yes**"),
+        field("📝 Note", "Send screenshot after payment", inline=False),
+    ),
+    footer=MARKET_FOOTER
+)
+
+TICKET_OPENED = EmbedTemplate(
+    title="🎫 {heading}",
+    description="Welcome {mention}!\n\n**Staff will be with you shortly!**",
+    footer="BM Creations Market | Ticket: {ticket_id}",
+    timestamp=True
+)
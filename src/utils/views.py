@@ -0,0 +1,48 @@
+import discord
+from discord import ui
+from typing import Callable
+
+from src.services.instrumentation import track
+
+class InstrumentedView(ui.View):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        for item in self.children:
+            self._instrument_item(item)
+    
+    def add_item(self, item: ui.Item) -> "InstrumentedView":
+        self._instrument_item(item)
+        return super().add_item(item)
+    
+    def _instrument_item(self, item: ui.Item):
+        callback = item.callback
+        if getattr(callback, "__instrumented__", False):
+            return
+        
+        func = getattr(callback, "callback", callback)
+        name = getattr(func, "__name__", None) or getattr(item, "custom_id", None) or type(item).__name__
+        operation = f"{type(self).__name__}.{name}"
+        
+        async def instrumented(interaction: discord.Interaction):
+            with track(operation, "view"):
+                return await callback(interaction)
+        
+        instrumented.__instrumented__ = True
+        item.callback = instrumented
+
+class RoutedView(ui.View):
+    # Layout only: every button has a routed custom_id and is answered by
+    # the interaction router, so the view is never kept in the view store.
+    def __init__(self):
+        super().__init__(timeout=None)
+    
+    def is_finished(self) -> bool:
+        return True
+
+def copy_components(message: discord.Message, disable: Callable[[ui.Item], bool] = None) -> RoutedView:
+    view = RoutedView()
+    for item in ui.View.from_message(message, timeout=None).children:
+        if disable is None or disable(item):
+            item.disabled = True
+        view.add_item(item)
+    return view